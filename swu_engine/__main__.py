@@ -19,7 +19,7 @@ if __name__ == "__main__":
         game.deal_damage(p2.base, 2)
     blaster = Card("Blaster Shot", "Back", cost=1, card_type="event", effect_fn=blaster_effect)
 
-    p1.hand.append(CardBundle(blaster, owner_id=p1.get_player_id()))
+    p1.get_board().move_bundle(CardBundle(blaster, owner_id=p1.get_player_id()), "Hand")
 
     print("\n-- START --")
     g.show_board()
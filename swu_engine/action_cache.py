@@ -0,0 +1,115 @@
+# action_cache.py
+"""
+Cached legal-action generation behind RulesEngine.get_legal_actions() and
+get_response_actions().
+
+Each player's actions are kept in sections, stored with the versions they
+were built from:
+
+    plays       hand pile, resource pile, leader and base (aspect costs)
+    resources   hand pile, resources_played_this_turn
+    attacks     arena piles
+    responses   hand pile (Ambush cards)
+
+Pile.version changes whenever a pile's cards or their order change and when
+Game.exhaust()/ready() touch one of its cards; Journal.epoch changes on
+rollback and Game.restore(), which drops every section. A call rebuilds
+only the stale sections, reusing the Actions the section's previous build
+made for bundles that are still there (a section only holds Actions for
+its current bundles); a call with no mutation at all since the last one
+(same Journal.version) returns a copy of the last list straight away.
+RulesEngine.build_legal_actions() is the uncached reference.
+"""
+from swu_engine.vocab import KEYWORDS
+
+ARENAS = ("Ground Arena", "Space Arena")
+AMBUSH = KEYWORDS.bit("Ambush")
+
+
+class ActionCache:
+    __slots__ = ("game", "epoch", "sections", "last", "builds")
+
+    def __init__(self, game):
+        self.game = game
+        self.epoch = -1
+        self.sections = {}   # (player id, section) -> (key, actions, {bundle: Action})
+        self.last = {}       # player id -> (journal version, legal actions)
+        self.builds = 0      # sections rebuilt so far (for tests and benchmarks)
+
+    def legal_actions(self, player) -> list:
+        """Same list (order included) as RulesEngine.build_legal_actions()."""
+        version = self.game.journal.version
+        last = self.last.get(player.player_id)
+        if last is not None and last[0] == version:
+            return list(last[1])
+        self._check_epoch()
+        hand = player.hand.pile
+        resources = player.resources.pile
+        board = player.get_board()
+        arenas = tuple((pile, pile.version) for name in ARENAS for pile in board.find_zone(name).get_piles())
+        actions = (self._section(player, "plays", (hand.version, resources.version, player.leader, player.base),
+                                 self._plays)
+                   + self._section(player, "resources", (hand.version, player.resources_played_this_turn),
+                                   self._resources)
+                   + self._section(player, "attacks", arenas, self._attacks))
+        self.last[player.player_id] = (version, actions)
+        return list(actions)
+
+    def response_actions(self, player) -> list:
+        self._check_epoch()
+        return list(self._section(player, "responses", player.hand.pile.version, self._responses))
+
+    def _check_epoch(self):
+        epoch = self.game.journal.epoch
+        if epoch != self.epoch:
+            self.sections.clear()
+            self.last.clear()
+            self.epoch = epoch
+
+    def _section(self, player, name: str, key, build) -> list:
+        slot = (player.player_id, name)
+        entry = self.sections.get(slot)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        previous = entry[2] if entry is not None else {}
+        memo = {}
+        actions = build(player, lambda bundle, create: self._action(previous, memo, bundle, create))
+        self.sections[slot] = (key, actions, memo)
+        self.builds += 1
+        return actions
+
+    @staticmethod
+    def _action(previous: dict, memo: dict, bundle, create):
+        """The Action the last build made for bundle, else a new one; kept in memo for the next build."""
+        action = previous.get(bundle)
+        if action is None:
+            action = create()
+        memo[bundle] = action
+        return action
+
+    def _plays(self, player, action) -> list:
+        game = self.game
+        rules = game.rules
+        ready = sum(1 for r in player.resources if not r.exhausted)   # Player.can_pay_for, counted once
+        return [action(b, lambda b=b: rules.create_play_action(game, player, b))
+                for b in player.hand if rules.apply_aspect_penalty(player, b.primary_card) <= ready]
+
+    def _resources(self, player, action) -> list:
+        if player.resources_played_this_turn:
+            return []
+        game = self.game
+        return [action(b, lambda b=b: game.rules.create_resource_action(game, player, b))
+                for b in player.hand]
+
+    def _attacks(self, player, action) -> list:
+        game = self.game
+        board = player.get_board()
+        return [action(b, lambda b=b: game.rules.create_attack_action(game, player, b))
+                for name in ARENAS for pile in board.find_zone(name).get_piles() for b in pile.get_bundles()
+                if not b.exhausted and b.primary_card]
+
+    def _responses(self, player, action) -> list:
+        """Ambush cards in hand, by printed keyword (the section is keyed by the hand pile alone)."""
+        game = self.game
+        return [action(b, lambda b=b: game.rules.create_ambush_play_action(game, player, b))
+                for b in player.hand if b.primary_card is not None and b.primary_card.keyword_mask & AMBUSH]
@@ -0,0 +1,193 @@
+# action_space.py
+"""
+Integer action space for policies that pick moves by number.
+
+The same moves RulesEngine.get_legal_actions() offers, without building
+Action/Requirement objects:
+
+    0                                   pass
+    1 + i                               play hand slot i
+    1 + hand_slots + i                  resource hand slot i
+    1 + 2 * hand_slots + j * T + k      attack with own unit slot j at target k
+
+Unit slot j is arena * unit_slots + position in that arena (the order of
+ObservationEncoder's unit block). Target k < unit_slots is the enemy unit in
+that slot of the attacker's arena; k == unit_slots is the enemy base.
+T = unit_slots + 1. Moves always belong to the current player.
+
+    mask = legal_action_mask(game)           # NumPy bool array
+    apply_action_id(game, int(np.flatnonzero(mask)[0]))
+"""
+import numpy as np
+
+from swu_engine.cardbundle import CardBundle
+
+ARENAS = ("Ground Arena", "Space Arena")
+PASS = 0
+
+
+class ActionSpace:
+    def __init__(self, hand_slots: int = 12, unit_slots: int = 10):
+        self.hand_slots = hand_slots
+        self.unit_slots = unit_slots
+        self.targets_per_unit = unit_slots + 1
+        self.play_at = 1
+        self.resource_at = 1 + hand_slots
+        self.attack_at = 1 + 2 * hand_slots
+        self.size = self.attack_at + len(ARENAS) * unit_slots * self.targets_per_unit
+
+    def new_mask(self, n: int = None) -> np.ndarray:
+        return np.zeros(self.size if n is None else (n, self.size), dtype=bool)
+
+    def attack_id(self, unit_slot: int, target_slot: int) -> int:
+        return self.attack_at + unit_slot * self.targets_per_unit + target_slot
+
+    def decode(self, action_id: int) -> tuple:
+        """("pass",), ("play", i), ("resource", i) or ("attack", unit_slot, target_slot)."""
+        if action_id == PASS:
+            return ("pass",)
+        if action_id < self.resource_at:
+            return ("play", action_id - self.play_at)
+        if action_id < self.attack_at:
+            return ("resource", action_id - self.resource_at)
+        if action_id < self.size:
+            unit_slot, target_slot = divmod(action_id - self.attack_at, self.targets_per_unit)
+            return ("attack", unit_slot, target_slot)
+        raise ValueError(f"Action id {action_id} is outside the action space (size {self.size})")
+
+    def legal_ids(self, game) -> list[int]:
+        """The current player's legal action ids, in increasing order (pass first)."""
+        ids = [PASS]
+        player = game.turn_manager.get_current_player()
+
+        hand = player.hand
+        n_hand = min(len(hand), self.hand_slots)
+        for i in range(n_hand):
+            if player.can_pay_for(game, hand[i].primary_card):
+                ids.append(self.play_at + i)
+        if player.resources_played_this_turn == 0:
+            ids.extend(range(self.resource_at, self.resource_at + n_hand))
+
+        enemy = None
+        can_attack = game.rules.can_attack
+        for a, arena in enumerate(ARENAS):
+            units = _units(player, arena, self.unit_slots)
+            if not any(not u.exhausted and u.primary_card for u in units):
+                continue
+            if enemy is None:
+                enemy = game.get_opponent(player)
+            enemies = _units(enemy, arena, self.unit_slots) if enemy is not None else []
+            base = enemy.base if enemy is not None else None
+            for s, attacker in enumerate(units):
+                if attacker.exhausted or not attacker.primary_card:
+                    continue
+                at = self.attack_at + (a * self.unit_slots + s) * self.targets_per_unit
+                for k, defender in enumerate(enemies):
+                    if can_attack(game, attacker, defender, player):
+                        ids.append(at + k)
+                if base is not None and can_attack(game, attacker, base, player):
+                    ids.append(at + self.unit_slots)
+        return ids
+
+    def legal_mask(self, game, out: np.ndarray = None) -> np.ndarray:
+        """Fill out (a new mask if None) with the current player's legal moves."""
+        if out is None:
+            out = self.new_mask()
+        else:
+            out[:] = False
+        out[self.legal_ids(game)] = True
+        return out
+
+    def resolve(self, game, action_id: int) -> tuple:
+        """
+        The move action_id stands for in this game: ("pass",), ("play", bundle),
+        ("resource", bundle) or ("attack", attacker, defender). Raises
+        ValueError if it is not legal for the current player.
+        """
+        move = self.decode(action_id)
+        if move[0] == "pass":
+            return move
+        player = game.turn_manager.get_current_player()
+        hand = player.hand
+
+        if move[0] == "play":
+            i = move[1]
+            if i >= len(hand) or not player.can_pay_for(game, hand[i].primary_card):
+                raise ValueError(f"Cannot play hand slot {i}")
+            return "play", hand[i]
+
+        if move[0] == "resource":
+            i = move[1]
+            if i >= len(hand) or player.resources_played_this_turn:
+                raise ValueError(f"Cannot resource hand slot {i}")
+            return "resource", hand[i]
+
+        _, unit_slot, target_slot = move
+        arena, slot = divmod(unit_slot, self.unit_slots)
+        enemy = game.get_opponent(player)
+        units, enemies = self._arena_pairs(player, enemy)[arena]
+        attacker = units[slot] if slot < len(units) else None
+        if target_slot == self.unit_slots:
+            defender = enemy.base if enemy is not None else None
+        else:
+            defender = enemies[target_slot] if target_slot < len(enemies) else None
+        if (attacker is None or defender is None or attacker.exhausted or not attacker.primary_card
+                or not game.rules.can_attack(game, attacker, defender, player)):
+            raise ValueError(f"Illegal attack {move}")
+        return "attack", attacker, defender
+
+    def apply(self, game, action_id: int) -> bool:
+        """
+        Play action_id for the current player. Returns False for a pass (the
+        caller moves on), True otherwise. Raises ValueError for an illegal id.
+        """
+        move = self.resolve(game, action_id)
+        player = game.turn_manager.get_current_player()
+        if move[0] == "play":
+            game.play_card(player, move[1], extra_targets={})
+        elif move[0] == "resource":
+            game.resource_card(player, move[1])
+        elif move[0] == "attack":
+            game.rules.attack(game, player, move[1], move[2])
+        else:
+            return False
+        return True
+
+    def to_action(self, game, action_id: int, actions: list) -> tuple:
+        """
+        (Action, targets) among get_legal_actions()'s actions for action_id, or
+        (None, None) for a pass; for agents that search on ids.
+        """
+        move = self.resolve(game, action_id)
+        if move[0] == "pass":
+            return None, None
+        action = next(a for a in actions if a.move == move[:2])
+        requirements = action.get_requirements()
+        return action, ({requirements[0]: [move[2]]} if requirements else {})
+
+    def _arena_pairs(self, player, enemy) -> list[tuple[list[CardBundle], list[CardBundle]]]:
+        """(own units, enemy units) per arena, each cut to unit_slots."""
+        pairs = []
+        for arena in ARENAS:
+            own = _units(player, arena, self.unit_slots)
+            pairs.append((own, _units(enemy, arena, self.unit_slots) if enemy is not None else []))
+        return pairs
+
+
+def _units(player, arena: str, limit: int) -> list[CardBundle]:
+    units = []
+    for pile in player.get_board().find_zone(arena).get_piles():
+        units += pile.get_bundles()
+    return units[:limit]
+
+
+# Default space, matching ObservationEncoder's default slot counts
+ACTION_SPACE = ActionSpace()
+
+
+def legal_action_mask(game, out: np.ndarray = None) -> np.ndarray:
+    return ACTION_SPACE.legal_mask(game, out)
+
+
+def apply_action_id(game, action_id: int) -> bool:
+    return ACTION_SPACE.apply(game, action_id)
@@ -0,0 +1,59 @@
+# agents.py
+import random
+
+from swu_engine.rules_engine import Action
+
+
+class Agent:
+    """
+    Decision maker for one seat in a headless game.
+    choose_action() returns one of the offered actions, or None to pass.
+    choose_targets() returns the targets dict for Action.execute(), or None
+    if the action cannot be completed.
+    rng: the agent's random stream for tie-breaks; pass game.spawn_rng()
+    so seeded games stay reproducible.
+    """
+
+    def __init__(self, rng: random.Random = None):
+        self.rng = rng or random.Random()
+
+    def choose_action(self, game, player, actions: list[Action]) -> Action | None:
+        raise NotImplementedError
+
+    def choose_targets(self, game, player, action: Action) -> dict | None:
+        targets = {}
+        for req in action.get_requirements():
+            candidates = game.rules.get_attack_targets(game, player, req)
+            if len(candidates) < req.min_targets:
+                return None
+            targets[req] = self.pick_targets(candidates, req)
+        return targets
+
+    def pick_targets(self, candidates: list, requirement) -> list:
+        return candidates[:requirement.max_targets]
+
+
+class FirstLegalAgent(Agent):
+    """Deterministic baseline: always takes the first legal action and the first targets."""
+
+    def choose_action(self, game, player, actions):
+        return actions[0] if actions else None
+
+
+class RandomAgent(Agent):
+    """Uniform over the legal actions plus passing; random targets. Seed it through rng."""
+
+    def choose_action(self, game, player, actions):
+        i = self.rng.randrange(len(actions) + 1)
+        return actions[i] if i < len(actions) else None
+
+    def pick_targets(self, candidates: list, requirement) -> list:
+        if len(candidates) <= requirement.max_targets:
+            return candidates
+        return self.rng.sample(candidates, requirement.max_targets)
+
+
+AGENTS = {
+    "first": FirstLegalAgent,
+    "random": RandomAgent,
+}
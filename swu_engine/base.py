@@ -1,8 +1,14 @@
 class Base:
-    def __init__(self, name: str, health: int = 30):
+    def __init__(self, name: str, health: int = 30, card=None):
         self.name = name
         self.max_health = health
         self.health = health
+        self.card = card   # base card definition (aspects), if loaded from the database
+
+    def copy(self) -> 'Base':
+        base = Base(self.name, self.max_health, self.card)
+        base.health = self.health
+        return base
 
     def take_damage(self, amount: int):
         self.health = max(0, self.health - max(0, amount))
@@ -0,0 +1,47 @@
+# bench_card_db.py
+"""
+Card database load benchmark: CSV parse vs compiled snapshot.
+
+    python -m swu_engine.bench_card_db [--cards path] [--repeat 10]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.sim import DEFAULT_CARDS
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark card database loading.")
+    parser.add_argument("--cards", default=DEFAULT_CARDS)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "cards.cdb")
+        CardDatabase(args.cards, cache_path=cache_path)  # build the snapshot once
+
+        csv_time = best_of(lambda: CardDatabase(args.cards, use_cache=False), args.repeat)
+        cache_time = best_of(lambda: CardDatabase(args.cards, cache_path=cache_path), args.repeat)
+        cache_size = os.path.getsize(cache_path)
+
+    cards = len(CardDatabase(args.cards, use_cache=False).cards_by_id)
+    print(f"{cards} cards, best of {args.repeat}")
+    print(f"CSV parse:      {csv_time * 1000:7.1f} ms  ({os.path.getsize(args.cards) / 1024:.0f} KB)")
+    print(f"Snapshot load:  {cache_time * 1000:7.1f} ms  ({cache_size / 1024:.0f} KB)")
+    print(f"Speedup:        {csv_time / cache_time:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# bench_memory.py
+"""
+Memory benchmark: bytes per in-play CardBundle.
+
+    python -m swu_engine.bench_memory [--bundles 100000]
+
+Builds --bundles bundles from real database cards, the way decks do, and
+reports the traced allocation per bundle. A second figure adds the cost of
+placing them in an arena (pile list slot plus location index entry).
+"""
+import argparse
+import tracemalloc
+
+from swu_engine.board import Board
+from swu_engine.cardbundle import CardBundle
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.sim import DEFAULT_CARDS, card_pools
+
+
+def measure(build) -> tuple[int, object]:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure CardBundle memory use.")
+    parser.add_argument("--bundles", type=int, default=100_000)
+    parser.add_argument("--cards", default=DEFAULT_CARDS)
+    args = parser.parse_args(argv)
+
+    db = CardDatabase(args.cards)
+    _, _, playables = card_pools(db)
+    cards = [db.get_card(card_id) for card_id in playables]
+    n = args.bundles
+
+    bundles = []
+    size, _ = measure(lambda: bundles.extend(CardBundle(cards[i % len(cards)], owner_id=1) for i in range(n)))
+    print(f"CardBundle:           {size / n:7.1f} bytes/bundle ({n} bundles)")
+
+    board = Board("bench", owner_id=1)
+
+    def place():
+        for bundle in bundles:
+            board.move_bundle(bundle, "Ground Arena")
+
+    size, _ = measure(place)
+    print(f"  + arena placement:  {size / n:7.1f} bytes/bundle")
+
+
+if __name__ == "__main__":
+    main()
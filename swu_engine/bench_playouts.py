@@ -0,0 +1,65 @@
+# bench_playouts.py
+"""
+Playout speed: how fast random games run to the end, headless.
+
+    python -m swu_engine.bench_playouts [--games 500] [--seed 0]
+
+Both random policies play the bundled all_cards.csv decks (new_game with
+per-game seeds):
+  agent  RandomAgent through sim.play_game / get_legal_actions
+  ids    playout.random_playout on the integer action space
+Game setup (deck building, shuffles, opening draws) is timed separately,
+so a rules-engine regression shows up in the playout figures.
+"""
+import argparse
+import random
+import time
+
+from swu_engine.agents import RandomAgent
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.playout import random_playout
+from swu_engine.sim import DEFAULT_CARDS, derive_seed, new_agents, new_game, play_game
+
+
+def run(db, mode: str, games: int, seed: int) -> tuple[float, float, int, int]:
+    """(setup seconds, playout seconds, actions, finished games)"""
+    setup = playing = 0.0
+    actions = finished = 0
+    for i in range(games):
+        game_seed = derive_seed(seed, i)
+        start = time.perf_counter()
+        game = new_game(db, game_seed)
+        if mode == "agent":
+            agents = new_agents(game, game_seed, RandomAgent)
+        else:
+            rng = random.Random(derive_seed(game_seed, 1))
+        mid = time.perf_counter()
+        if mode == "agent":
+            actions += play_game(game, agents)
+        else:
+            actions += random_playout(game, rng)
+        end = time.perf_counter()
+        setup += mid - start
+        playing += end - mid
+        finished += game.over
+    return setup, playing, actions, finished
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure random playouts per second.")
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode", choices=("agent", "ids", "both"), default="both")
+    parser.add_argument("--cards", default=DEFAULT_CARDS)
+    args = parser.parse_args(argv)
+
+    db = CardDatabase(args.cards)
+    for mode in (("agent", "ids") if args.mode == "both" else (args.mode,)):
+        setup, playing, actions, finished = run(db, mode, args.games, args.seed)
+        print(f"{mode:>5}: {args.games / playing:8.1f} playouts/s  {actions / playing:9.0f} actions/s  "
+              f"({actions / args.games:.1f} actions/game, {finished}/{args.games} decided, "
+              f"setup {setup / args.games * 1e3:.2f} ms/game)")
+
+
+if __name__ == "__main__":
+    main()
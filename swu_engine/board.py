@@ -1,20 +1,175 @@
+import random
+from collections import deque
+from collections.abc import Sequence
 from swu_engine.cardbundle import CardBundle
+from swu_engine.vocab import KEYWORDS
+
+_new = object.__new__
 
 class Pile:
     def __init__(self, pile_id: str):
         self.pile_id = pile_id
         self.bundles: list[CardBundle] = []
+        self.zone: 'Zone | None' = None  # set by Zone.add_pile
+        # bumped when the pile's cards, their order or their readiness change (see action_cache.py)
+        self.version = 0
+
+    def _board(self):
+        return self.zone.board if self.zone is not None else None
 
     def add_bundle(self, bundle: CardBundle):
         self.bundles.append(bundle)
+        board = self._board()
+        if board is not None:
+            board.set_location(bundle, (self.zone, self))
+            if board.journal is not None and board.journal.recording:
+                board.journal.record(self._undo_add, 1)
+
+    def add_bundles(self, bundles: list[CardBundle]):
+        self.bundles.extend(bundles)
+        board = self._board()
+        if board is not None:
+            loc = (self.zone, self)
+            for b in bundles:
+                board.set_location(b, loc)
+            if board.journal is not None and board.journal.recording:
+                board.journal.record(self._undo_add, len(bundles))
 
     def remove_bundle(self, bundle: CardBundle):
-        if bundle in self.bundles:
-            self.bundles.remove(bundle)
+        """
+        Remove bundle, keeping the order of the rest (hand slots and logged
+        action indexes depend on it). Constant time for the last card, else
+        linear in this pile's size: one C-level scan of a single pile, which
+        in play is a hand or arena of a few cards (the deck's top goes
+        through DeckPile.take_top instead).
+        """
+        bundles = self.bundles
+        if bundles and bundles[-1] is bundle:
+            index = len(bundles) - 1
+            bundles.pop()
+        else:
+            try:
+                index = bundles.index(bundle)
+            except ValueError:
+                return
+            del bundles[index]
+        board = self._board()
+        if board is not None:
+            if board.locations.get(bundle, (None, None))[1] is self:
+                board.clear_location(bundle)
+            if board.journal is not None and board.journal.recording:
+                board.journal.record(self._undo_remove, index, bundle)
+
+    # undo entries for Board.journal
+
+    def _undo_add(self, n: int):
+        board = self._board()
+        for _ in range(n):
+            board.clear_location(self.bundles.pop())
+
+    def _undo_remove(self, index: int, bundle: CardBundle):
+        self.bundles.insert(index, bundle)
+        board = self._board()
+        if bundle not in board.locations:
+            board.set_location(bundle, (self.zone, self))
+
+    def _undo_reorder(self, order: list[CardBundle]):
+        self.version += 1
+        self.bundles.clear()
+        self.bundles.extend(order)
+
+    def _record_order(self):
+        self.version += 1
+        board = self._board()
+        if board is not None and board.journal is not None:
+            board.journal.bump()
+            if board.journal.recording:
+                board.journal.record(self._undo_reorder, list(self.bundles))
 
     def get_bundles(self):
         return self.bundles
 
+    def shuffle(self, rng: random.Random = None):
+        self._record_order()
+        (rng or random).shuffle(self.bundles)
+
+
+class DeckPile(Pile):
+    """
+    Pile backed by a deque: index 0 is the top card, so drawing, milling and
+    revealing from the top are O(1) per card instead of list.pop(0).
+    """
+
+    def __init__(self, pile_id: str):
+        super().__init__(pile_id)
+        self.bundles: deque[CardBundle] = deque()
+
+    def take_top(self, n: int) -> list[CardBundle]:
+        """Remove and return the top n bundles (fewer if the pile is short)."""
+        n = min(n, len(self.bundles))
+        popleft = self.bundles.popleft
+        taken = [popleft() for _ in range(n)]
+        board = self._board()
+        if board is not None:
+            for b in taken:
+                board.clear_location(b)
+            if taken and board.journal is not None and board.journal.recording:
+                board.journal.record(self._undo_take_top, taken)
+        return taken
+
+    def _undo_take_top(self, taken: list[CardBundle]):
+        self.bundles.extendleft(reversed(taken))
+        loc = (self.zone, self)
+        board = self._board()
+        for b in taken:
+            board.set_location(b, loc)
+
+    def peek_top(self, n: int) -> list[CardBundle]:
+        """Return the top n bundles without moving them."""
+        bundles = self.bundles
+        return [bundles[i] for i in range(min(n, len(bundles)))]
+
+    def shuffle(self, rng: random.Random = None):
+        # shuffle a list copy: random.shuffle indexes into the middle of the deque
+        self._record_order()
+        cards = list(self.bundles)
+        (rng or random).shuffle(cards)
+        self.bundles.clear()
+        self.bundles.extend(cards)
+
+
+class PileView(Sequence):
+    """
+    Read-only view of a pile's bundles (e.g. Player.hand). Reads go straight
+    to the pile; membership uses the board's location index. Mutate through
+    Board.move_bundle() / Game methods instead.
+    """
+    __slots__ = ("pile",)
+
+    def __init__(self, pile: Pile):
+        self.pile = pile
+
+    def __len__(self):
+        return len(self.pile.bundles)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self.pile.bundles)[index]
+        return self.pile.bundles[index]
+
+    def __iter__(self):
+        return iter(self.pile.bundles)
+
+    def __contains__(self, bundle):
+        board = self.pile._board()
+        if board is None:
+            return bundle in self.pile.bundles
+        loc = board.locations.get(bundle)
+        return loc is not None and loc[1] is self.pile
+
+    def __repr__(self):
+        return f"PileView({self.pile.pile_id}, {len(self)} bundles)"
+
 
 class Zone:
     def __init__(self, zone_id: str, owner_id: int, name: str = "", visibility: str = "public"):
@@ -29,9 +184,14 @@ class Zone:
         self.name = name
         self.visibility = visibility
         self.piles: list[Pile] = []
+        self.board: 'Board | None' = None  # set by Board.add_zone
+        self.is_arena = name in ARENA_NAMES
 
     def add_pile(self, pile: Pile):
         self.piles.append(pile)
+        pile.zone = self
+        if self.board is not None:
+            self.board.index_pile(pile)
 
     def get_piles(self):
         return self.piles
@@ -40,42 +200,223 @@ class Zone:
         return self.name
 
 
+ARENA_NAMES = ("Ground Arena", "Space Arena")
+
+# (zone_id, name, visibility) for the zones every player board starts with
+DEFAULT_ZONES = [
+    ("hand", "Hand", "hidden_owner"),
+    ("deck", "Deck", "hidden_owner"),
+    ("discard", "Discard", "public"),
+    ("exile", "Exile", "public"),
+    ("resources", "Resources", "hidden_all"),
+    ("ground_arena", "Ground Arena", "public"),
+    ("space_arena", "Space Arena", "public"),
+]
+
+
 class Board:
     def __init__(self, board_id: str, owner_id: int):
         self.board_id = board_id
         self.owner_id = owner_id
         self.zones: list[Zone] = []
-        self.zones.append(Zone("leader", owner_id, "Leader", "public"))
+        # zone name (as given and lowercased) -> Zone
+        self.zones_by_name: dict[str, Zone] = {}
+        # bundle -> (zone, pile) it currently sits in, maintained by Pile/Zone
+        self.locations: dict[CardBundle, tuple[Zone, Pile]] = {}
+        # keyword bit -> number of units in this board's arenas that have it (printed or temporary)
+        self.arena_keywords: dict[int, int] = {}
+        # undo journal of the game this board belongs to (set by Game.add_player)
+        self.journal: 'Journal | None' = None
+        self.add_zone(Zone("leader", owner_id, "Leader", "public"))
+        for zone_id, name, visibility in DEFAULT_ZONES:
+            zone = Zone(zone_id, owner_id, name, visibility)
+            pile_cls = DeckPile if zone_id == "deck" else Pile
+            zone.add_pile(pile_cls(f"{zone_id}_pile"))
+            self.add_zone(zone)
 
     def add_zone(self, zone: Zone):
         self.zones.append(zone)
+        self.zones_by_name[zone.get_name()] = zone
+        self.zones_by_name[zone.get_name().lower()] = zone
+        zone.board = self
+        for pile in zone.get_piles():
+            self.index_pile(pile)
+
+    def index_pile(self, pile: Pile):
+        for bundle in pile.get_bundles():
+            self.set_location(bundle, (pile.zone, pile))
+
+    # --- location and keyword index (written only by Pile and Game) ---
+
+    def set_location(self, bundle: 'CardBundle', loc: 'tuple[Zone, Pile]'):
+        if self.journal is not None:
+            self.journal.touch(bundle)
+        old = self.locations.get(bundle)
+        self.locations[bundle] = loc
+        loc[1].version += 1
+        if old is not None and old[1] is not loc[1]:
+            old[1].version += 1
+        in_arena = loc[0].is_arena
+        if in_arena != (old is not None and old[0].is_arena):
+            self.count_keywords(bundle, 1 if in_arena else -1)
+
+    def clear_location(self, bundle: 'CardBundle'):
+        if self.journal is not None:
+            self.journal.touch(bundle)
+        old = self.locations.pop(bundle, None)
+        if old is not None:
+            old[1].version += 1
+            if old[0].is_arena:
+                self.count_keywords(bundle, -1)
+
+    def bump(self, bundle: 'CardBundle'):
+        """A card's readiness changed: bump the version of the pile it is in."""
+        loc = self.locations.get(bundle)
+        if loc is not None:
+            loc[1].version += 1
+
+    def count_keywords(self, bundle: 'CardBundle', delta: int):
+        counts = self.arena_keywords
+        mask = bundle.effective_keywords()
+        while mask:
+            bit = mask & -mask
+            counts[bit] = counts.get(bit, 0) + delta
+            mask ^= bit
+
+    def in_arena(self, bundle: 'CardBundle') -> bool:
+        loc = self.locations.get(bundle)
+        return loc is not None and loc[0].is_arena
+
+    def has_arena_keyword(self, keyword: str) -> bool:
+        """True if any unit in this board's arenas has the keyword. Constant time."""
+        return self.arena_keywords.get(KEYWORDS.bit(keyword), 0) > 0
 
     def get_zones(self):
         return self.zones
 
     def find_zone(self, zone_name: str) -> 'Zone | None':
-        """Find a zone on this board by name."""
-        for z in self.zones:
-            if z.get_name().lower() == zone_name.lower():
-                return z
-        return None
+        """Find a zone on this board by name (case-insensitive)."""
+        zone = self.zones_by_name.get(zone_name)
+        if zone is None:
+            zone = self.zones_by_name.get(zone_name.lower())
+        return zone
+
+    def locate(self, bundle: 'CardBundle') -> 'tuple[Zone, Pile] | None':
+        """Return the (zone, pile) a bundle is in on this board, or None."""
+        return self.locations.get(bundle)
+
+    def find_bundle_zone(self, bundle: 'CardBundle') -> 'Zone | None':
+        loc = self.locations.get(bundle)
+        return loc[0] if loc else None
+
+    def move_bundle(self, bundle: 'CardBundle', to_zone: 'Zone | str'):
+        """
+        Move a bundle from wherever it is on this board (or from nowhere, for
+        new cards) into the first pile of to_zone. Returns the target zone.
+        The bundle is found through the location index; taking it out of its
+        pile costs what Pile.remove_bundle does.
+        """
+        if isinstance(to_zone, str):
+            to_zone = self.find_zone(to_zone)
+        loc = self.locations.get(bundle)
+        if loc is not None:
+            loc[1].remove_bundle(bundle)
+        if not to_zone.get_piles():
+            to_zone.add_pile(Pile(f"{to_zone.zone_id}_pile"))
+        to_zone.get_piles()[0].add_bundle(bundle)
+        return to_zone
+
+    def deck_pile(self) -> DeckPile:
+        return self.find_zone("Deck").get_piles()[0]
+
+    def move_top_of_deck(self, n: int, to_zone: 'Zone | str') -> list['CardBundle']:
+        """Move the top n deck cards to to_zone in one step. Returns the moved bundles."""
+        if isinstance(to_zone, str):
+            to_zone = self.find_zone(to_zone)
+        moved = self.deck_pile().take_top(n)
+        if moved:
+            to_zone.get_piles()[0].add_bundles(moved)
+        return moved
 
     def move_to_zone(self, bundle: 'CardBundle', from_zone: 'Zone', to_zone: 'Zone'):
         """Move a card bundle between zones (removes from one, adds to another)."""
-        for pile in from_zone.get_piles():
-            if bundle in pile.get_bundles():
-                pile.remove_bundle(bundle)
-                # put into first pile of target zone (create if none exist)
-                if not to_zone.get_piles():
-                    to_zone.add_pile(Pile(f"{to_zone.zone_id}_pile"))
-                to_zone.get_piles()[0].add_bundle(bundle)
-                return True
-        return False
+        loc = self.locations.get(bundle)
+        if loc is None or loc[0] is not from_zone:
+            return False
+        loc[1].remove_bundle(bundle)
+        # put into first pile of target zone (create if none exist)
+        if not to_zone.get_piles():
+            to_zone.add_pile(Pile(f"{to_zone.zone_id}_pile"))
+        to_zone.get_piles()[0].add_bundle(bundle)
+        return True
+
+    def clone(self, memo: dict) -> 'Board':
+        """
+        Copy of this board for a cloned game. Bundles are copied through memo
+        (original bundle -> copy), so the caller can remap its own references.
+        """
+        board = Board.__new__(Board)
+        board.board_id = self.board_id
+        board.owner_id = self.owner_id
+        board.zones = zones = []
+        board.zones_by_name = zones_by_name = {}
+        board.locations = locations = {}
+        board.arena_keywords = dict(self.arena_keywords)
+        board.journal = None
+        for zone in self.zones:
+            new_zone = _new(Zone)
+            new_zone.__dict__.update(zone.__dict__)
+            new_zone.board = board
+            new_zone.piles = []
+            for pile in zone.piles:
+                new_pile = _new(pile.__class__)
+                new_pile.pile_id = pile.pile_id
+                new_pile.zone = new_zone
+                new_pile.version = 0
+                loc = (new_zone, new_pile)
+                copies = []
+                for b in pile.bundles:
+                    copy = b.copy(memo)
+                    copies.append(copy)
+                    locations[copy] = loc
+                new_pile.bundles = deque(copies) if isinstance(pile.bundles, deque) else copies
+                new_zone.piles.append(new_pile)
+            zones.append(new_zone)
+        for key, zone in self.zones_by_name.items():
+            zones_by_name[key] = zones[self.zones.index(zone)]
+        return board
+
+    def get_state(self) -> tuple:
+        """Pile layout of every zone, for Game.snapshot()."""
+        return tuple(
+            (zone, tuple((pile, tuple(pile.bundles)) for pile in zone.piles))
+            for zone in self.zones
+        )
+
+    def set_state(self, state: tuple):
+        """Put every zone back to a layout from get_state() and rebuild the location index."""
+        self.locations.clear()
+        self.arena_keywords.clear()
+        for zone, piles in state:
+            zone.piles[:] = [pile for pile, _ in piles]
+            for pile, bundles in piles:
+                if isinstance(pile.bundles, deque):
+                    pile.bundles.clear()
+                    pile.bundles.extend(bundles)
+                else:
+                    pile.bundles[:] = bundles
+                loc = (zone, pile)
+                for b in bundles:
+                    self.set_location(b, loc)
 
     def move_to_pile(self, bundle: 'CardBundle', from_pile: 'Pile', to_pile: 'Pile'):
         """Move a card bundle between two specific piles."""
-        if bundle in from_pile.get_bundles():
-            from_pile.remove_bundle(bundle)
-            to_pile.add_bundle(bundle)
-            return True
-        return False
+        loc = self.locations.get(bundle)
+        if loc is not None:
+            if loc[1] is not from_pile:
+                return False
+        elif bundle not in from_pile.get_bundles():
+            return False
+        from_pile.remove_bundle(bundle)
+        to_pile.add_bundle(bundle)
+        return True
@@ -1,46 +1,94 @@
+from swu_engine.vocab import KEYWORDS, TRAITS, aspect_masks
+
+# Card data; everything else in __slots__ is derived from it (see _derive)
+_FIELDS = ("name", "back_info", "cost", "card_type", "subtype", "attack", "health", "aspects",
+           "keywords", "leader_attack", "leader_health", "leader_subtype", "leader_ability_fn",
+           "extra_cost_fn", "effect_fn", "token_info", "arenas", "traits")
+
+
 class Card:
-    def __init__(self, name, back_info, token_info: str, card_type="unit", cost=0, subtype=None,
+    """
+    Immutable card definition. One Card is shared by every bundle (and every
+    game) that uses it, so per-game state lives on CardBundle, never here.
+    """
+    __slots__ = _FIELDS + ("keyword_mask", "aspect_mask", "double_aspect_mask", "trait_mask")
+
+    def __init__(self, name, back_info, token_info: str = "", card_type="unit", cost=0, subtype=None,
                  aspects=None, leader_attack=0, leader_health=0, leader_subtype=None,
                  leader_ability_fn=None, extra_cost_fn=None, effect_fn=None, attack:int=None, health: int=None,
-                 keywords: list[str] = None, arenas: list[str] = None, **kwargs):
-        self.name = name
-        self.back_info = back_info
-        self.cost = cost
-        self.card_type = card_type
-        self.subtype = subtype
-        self.attack = attack
-        self.health = health
-        self.aspects = aspects or []
-        self.keywords = set(keywords or [])
-        self.leader_attack = leader_attack
-        self.leader_health = leader_health
-        self.leader_subtype = leader_subtype
-        self.leader_ability_fn = leader_ability_fn
-        self.extra_cost_fn = extra_cost_fn
-        self.effect_fn = effect_fn
-        self.token_info = token_info
-        self.attack = attack
-        self.health = health
-        self.keywords = keywords or []
-        # Normalize arenas to ["Ground Arena"] or ["Space Arena"]
+                 keywords: list[str] = None, arenas: list[str] = None, traits: list[str] = None, **kwargs):
+        # Normalize arenas to ("Ground Arena",) or ("Space Arena",)
         if arenas:
-            self.arenas = [
+            arenas = tuple(
                 "Ground Arena" if a.lower() == "ground" else
                 "Space Arena" if a.lower() == "space" else a
                 for a in arenas
-            ]
+            )
         else:
-            self.arenas = ["Ground Arena"]  # default fallback
+            arenas = ("Ground Arena",)  # default fallback
+
+        init = object.__setattr__
+        init(self, "name", name)
+        init(self, "back_info", back_info)
+        init(self, "cost", cost)
+        init(self, "card_type", card_type)
+        init(self, "subtype", subtype)
+        init(self, "attack", attack)
+        init(self, "health", health)
+        init(self, "aspects", tuple(aspects or ()))
+        init(self, "keywords", tuple(keywords or ()))
+        init(self, "leader_attack", leader_attack)
+        init(self, "leader_health", leader_health)
+        init(self, "leader_subtype", leader_subtype)
+        init(self, "leader_ability_fn", leader_ability_fn)
+        init(self, "extra_cost_fn", extra_cost_fn)
+        init(self, "effect_fn", effect_fn)
+        init(self, "token_info", token_info)
+        init(self, "arenas", arenas)
+        init(self, "traits", tuple(traits or ()))
+        self._derive()
+
+    def _derive(self):
+        """Intern keywords, aspects and traits as bitmasks (see vocab.py)."""
+        init = object.__setattr__
+        init(self, "keyword_mask", KEYWORDS.mask(self.keywords))
+        aspect_mask, double_aspect_mask = aspect_masks(self.aspects)
+        init(self, "aspect_mask", aspect_mask)
+        init(self, "double_aspect_mask", double_aspect_mask)
+        init(self, "trait_mask", TRAITS.mask(self.traits))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Card is immutable (tried to set {name!r})")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Card is immutable (tried to delete {name!r})")
+
+    # Masks are not pickled: bits of names first seen in card data depend on
+    # load order, so they are re-derived in the loading process.
+    def __getstate__(self):
+        return tuple(getattr(self, field) for field in _FIELDS)
+
+    def __setstate__(self, state):
+        for field, value in zip(_FIELDS, state):
+            object.__setattr__(self, field, value)
+        self._derive()
+
+    def fields(self) -> tuple:
+        """All card data, in _FIELDS order (used to intern identical cards)."""
+        return self.__getstate__()
+
+    def has_keyword(self, keyword: str) -> bool:
+        return bool(self.keyword_mask & KEYWORDS.bit(keyword))
 
     def get_default_arena(self) -> str:
         """
         Return the primary arena for this card, if any.
         Units usually specify Ground or Space; defaults to Ground Arena.
         """
-        if hasattr(self, "arenas") and self.arenas:
+        if self.arenas:
             arena_key = self.arenas[0].lower()
             if "ground" in arena_key:
                 return "Ground Arena"
             elif "space" in arena_key:
                 return "Space Arena"
-        return "Ground Arena"
\ No newline at end of file
+        return "Ground Arena"
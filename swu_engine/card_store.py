@@ -0,0 +1,322 @@
+# card_store.py
+"""
+Columnar, memory-mapped card store.
+
+The CSV is compiled once into a single file next to it (all_cards.cols):
+
+    header | records[n_cards] | string offsets[n_strings + 1] | string blob
+
+records is a NumPy structured array: numeric columns are stored directly,
+text columns hold indices into one interned string table (every distinct
+string is stored once, index 0 is ""). Everything is opened with
+np.memmap, so worker processes share the OS page cache instead of each
+holding their own copy. CardView objects read numeric fields from the
+record and decode text fields only when they are accessed.
+"""
+import csv
+import os
+import struct
+from collections.abc import Mapping
+
+import numpy as np
+
+from swu_engine.deck_loader import csv_digest
+from swu_engine.vocab import ASPECTS, KEYWORDS, TRAITS, aspect_masks
+
+STORE_MAGIC = b"SWUCOL"
+STORE_VERSION = 1
+_HEADER = struct.Struct("<6sH32sIII")   # magic, version, sha256(csv), n_cards, n_strings, blob bytes
+
+# CSV column -> record field
+NUMERIC_COLUMNS = {
+    "Cost": ("cost", np.int16),
+    "Power": ("power", np.int16),
+    "HP": ("hp", np.int16),
+    "Number": ("number", np.int16),
+    "DoubleSided": ("double_sided", np.bool_),
+    "Unique": ("unique", np.bool_),
+    "MarketPrice": ("market_price", np.float32),
+    "LowPrice": ("low_price", np.float32),
+    "FoilPrice": ("foil_price", np.float32),
+    "LowFoilPrice": ("low_foil_price", np.float32),
+}
+TEXT_COLUMNS = {
+    "ID": "card_id",
+    "Name": "name",
+    "Subtitle": "subtitle",
+    "Type": "type",
+    "Arenas": "arenas",
+    "Aspects": "aspects",
+    "Keywords": "keywords",
+    "Traits": "traits",
+    "FrontText": "front_text",
+    "BackText": "back_text",
+    "EpicAction": "epic_action",
+    "Rarity": "rarity",
+    "Set": "set",
+    "Artist": "artist",
+    "FrontArt": "front_art",
+    "BackArt": "back_art",
+    "VariantType": "variant_type",
+}
+RECORD_DTYPE = np.dtype(
+    [(field, dtype) for field, dtype in NUMERIC_COLUMNS.values()]
+    + [(field, np.uint32) for field in TEXT_COLUMNS.values()]
+)
+
+_ARENA_NAMES = {"ground": "Ground Arena", "space": "Space Arena"}
+
+
+def _parse_numeric(value: str, dtype):
+    if dtype is np.bool_:
+        return value == "True"
+    if dtype is np.float32:
+        return float(value) if value else float("nan")
+    return int(value) if value else 0
+
+
+def build_store(csv_path: str, store_path: str, digest: bytes = None):
+    """Compile the CSV into the columnar store file (written atomically)."""
+    digest = digest or csv_digest(csv_path)
+    strings = {"": 0}
+    rows = []
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            if not row.get("ID"):
+                row["ID"] = f"{row['Set']}_{row['Number']}"
+            record = [_parse_numeric(row.get(col, ""), dtype) for col, (_, dtype) in NUMERIC_COLUMNS.items()]
+            for col in TEXT_COLUMNS:
+                record.append(strings.setdefault(row.get(col) or "", len(strings)))
+            rows.append(tuple(record))
+
+    records = np.array(rows, dtype=RECORD_DTYPE)
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint32)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    blob = b"".join(encoded)
+
+    tmp_path = f"{store_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(STORE_MAGIC, STORE_VERSION, digest, len(records), len(encoded), len(blob)))
+            f.write(records.tobytes())
+            f.write(offsets.tobytes())
+            f.write(blob)
+        os.replace(tmp_path, store_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def default_store_path(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + ".cols"
+
+
+def _read_header(store_path: str):
+    try:
+        with open(store_path, "rb") as f:
+            return _HEADER.unpack(f.read(_HEADER.size))
+    except (OSError, struct.error):
+        return None
+
+
+class CardStore:
+    """
+    Read-only card database backed by the columnar store file.
+
+    Drop-in for CardDatabase where cards are only read: get_card() and
+    cards_by_id return CardView objects (one per row, created on first use).
+    """
+    def __init__(self, csv_path: str, store_path: str = None):
+        store_path = store_path or default_store_path(csv_path)
+        digest = csv_digest(csv_path)
+        header = _read_header(store_path)
+        if header is None or header[:3] != (STORE_MAGIC, STORE_VERSION, digest):
+            build_store(csv_path, store_path, digest)
+            header = _read_header(store_path)
+        _, _, _, n_cards, n_strings, blob_len = header
+
+        offset = _HEADER.size
+        self.records = np.memmap(store_path, dtype=RECORD_DTYPE, mode="r", offset=offset, shape=(n_cards,))
+        offset += RECORD_DTYPE.itemsize * n_cards
+        self._offsets = np.memmap(store_path, dtype=np.uint32, mode="r", offset=offset, shape=(n_strings + 1,))
+        offset += 4 * (n_strings + 1)
+        self._blob = np.memmap(store_path, dtype=np.uint8, mode="r", offset=offset, shape=(blob_len,)) \
+            if blob_len else np.zeros(0, dtype=np.uint8)
+        # plain ndarray views of the mapping: skips np.memmap's per-item overhead
+        table = self.records.view(np.ndarray)
+        self.columns = {name: table[name] for name in RECORD_DTYPE.names}
+
+        self._strings: dict[int, str] = {}      # decoded strings, by table index
+        self._lists: dict[int, tuple] = {}      # ';'-separated strings split once, by table index
+        self._masks: dict[tuple, int | tuple] = {}  # (vocabulary, table index) -> interned mask(s)
+        self._views: dict[int, CardView] = {}
+        self._rows: dict[str, int] | None = None
+        self.cards_by_id = _CardIndex(self)
+
+    def __len__(self):
+        return len(self.records)
+
+    def string(self, index: int) -> str:
+        """Decode one entry of the interned string table."""
+        s = self._strings.get(index)
+        if s is None:
+            start, end = self._offsets[index], self._offsets[index + 1]
+            s = self._strings[index] = self._blob[start:end].tobytes().decode("utf-8")
+        return s
+
+    def string_list(self, index: int) -> tuple[str, ...]:
+        """Decode a ';'-separated text field (keywords, aspects, ...) as a tuple."""
+        items = self._lists.get(index)
+        if items is None:
+            items = self._lists[index] = tuple(p.strip() for p in self.string(index).split(";") if p.strip())
+        return items
+
+    def string_mask(self, index: int, vocab) -> int | tuple[int, int]:
+        """A ';'-separated field interned into vocab (aspects give (single, double) masks)."""
+        key = (vocab.kind, index)
+        mask = self._masks.get(key)
+        if mask is None:
+            names = self.string_list(index)
+            mask = self._masks[key] = aspect_masks(names) if vocab is ASPECTS else vocab.mask(names)
+        return mask
+
+    def row_index(self) -> dict[str, int]:
+        """card id -> row, decoded on first use."""
+        if self._rows is None:
+            self._rows = {self.string(i): row for row, i in enumerate(self.columns["card_id"].tolist())}
+        return self._rows
+
+    def row_of(self, card_id: str) -> int | None:
+        return self.row_index().get(card_id)
+
+    def view(self, row: int) -> "CardView":
+        card = self._views.get(row)
+        if card is None:
+            card = self._views[row] = CardView(self, row)
+        return card
+
+    def get_card(self, card_id: str) -> "CardView | None":
+        row = self.row_of(card_id)
+        return self.view(row) if row is not None else None
+
+
+class _CardIndex(Mapping):
+    """cards_by_id for a CardStore: card id -> CardView, in CSV order."""
+    __slots__ = ("store",)
+
+    def __init__(self, store: CardStore):
+        self.store = store
+
+    def __getitem__(self, card_id):
+        card = self.store.get_card(card_id)
+        if card is None:
+            raise KeyError(card_id)
+        return card
+
+    def __iter__(self):
+        return iter(self.store.row_index())
+
+    def __len__(self):
+        return len(self.store)
+
+
+def _numeric(field):
+    return property(lambda self: self._store.columns[field][self._row].item())
+
+
+def _text(field):
+    return property(lambda self: self._store.string(int(self._store.columns[field][self._row])))
+
+
+def _text_list(field):
+    return property(lambda self: self._store.string_list(int(self._store.columns[field][self._row])))
+
+
+class CardView:
+    """
+    Lightweight, read-only Card backed by one row of a CardStore.
+    Exposes the same attributes as Card plus the remaining CSV columns.
+    """
+    __slots__ = ("_store", "_row")
+
+    # Card attributes the CSV does not provide
+    back_info = ""
+    token_info = ""
+    subtype = None
+    leader_attack = 0
+    leader_health = 0
+    leader_subtype = None
+    leader_ability_fn = None
+    extra_cost_fn = None
+    effect_fn = None
+
+    def __init__(self, store: CardStore, row: int):
+        self._store = store
+        self._row = row
+
+    cost = _numeric("cost")
+    attack = _numeric("power")
+    health = _numeric("hp")
+    number = _numeric("number")
+    double_sided = _numeric("double_sided")
+    unique = _numeric("unique")
+    market_price = _numeric("market_price")
+    low_price = _numeric("low_price")
+    foil_price = _numeric("foil_price")
+    low_foil_price = _numeric("low_foil_price")
+
+    card_id = _text("card_id")
+    name = _text("name")
+    subtitle = _text("subtitle")
+    front_text = _text("front_text")
+    back_text = _text("back_text")
+    epic_action = _text("epic_action")
+    rarity = _text("rarity")
+    set = _text("set")
+    artist = _text("artist")
+    front_art = _text("front_art")
+    back_art = _text("back_art")
+    variant_type = _text("variant_type")
+
+    keywords = _text_list("keywords")
+    aspects = _text_list("aspects")
+    traits = _text_list("traits")
+
+    @property
+    def keyword_mask(self) -> int:
+        return self._store.string_mask(int(self._store.columns["keywords"][self._row]), KEYWORDS)
+
+    @property
+    def aspect_mask(self) -> int:
+        return self._store.string_mask(int(self._store.columns["aspects"][self._row]), ASPECTS)[0]
+
+    @property
+    def double_aspect_mask(self) -> int:
+        return self._store.string_mask(int(self._store.columns["aspects"][self._row]), ASPECTS)[1]
+
+    @property
+    def trait_mask(self) -> int:
+        return self._store.string_mask(int(self._store.columns["traits"][self._row]), TRAITS)
+
+    def has_keyword(self, keyword: str) -> bool:
+        return bool(self.keyword_mask & KEYWORDS.bit(keyword))
+
+    @property
+    def card_type(self) -> str:
+        return self._store.string(int(self._store.columns["type"][self._row])).lower()
+
+    @property
+    def arenas(self) -> tuple[str, ...]:
+        arenas = self._store.string_list(int(self._store.columns["arenas"][self._row]))
+        return tuple(_ARENA_NAMES.get(a.lower(), a) for a in arenas) or ("Ground Arena",)
+
+    def get_default_arena(self) -> str:
+        arena_key = self.arenas[0].lower()
+        if "space" in arena_key:
+            return "Space Arena"
+        return "Ground Arena"
+
+    def __repr__(self):
+        return f"CardView({self.card_id!r}, {self.name!r})"
@@ -1,27 +1,166 @@
 from swu_engine.card import Card
+from swu_engine.events import next_bundle_id
+from swu_engine.modifiers import apply_layers
+from swu_engine.vocab import KEYWORDS
+
+
+def _lazy(slot: str, factory):
+    """Container attribute that is only allocated on first access (most bundles never need it)."""
+    def get(self):
+        value = getattr(self, slot)
+        if value is None:
+            value = factory()
+            setattr(self, slot, value)
+        return value
+
+    def set(self, value):
+        setattr(self, slot, value)
+
+    return property(get, set)
+
+
+def _invalidating(slot: str):
+    """Attribute that clears the bundle's cached effective stats when written."""
+    def get(self):
+        return getattr(self, slot)
+
+    def set(self, value):
+        setattr(self, slot, value)
+        self._stats = None
+
+    return property(get, set)
+
+
+_new_bundle = object.__new__
+
 
 class CardBundle:
+    __slots__ = ("bundle_id", "primary_card", "owner_id", "damage", "exhausted", "_attack_buff", "_health_buff",
+                 "_temp_keyword_mask", "_modifiers", "_stats", "_secondary_cards", "_tokens", "_upgrades", "_peekers")
+
     def __init__(self, primary_card: Card, owner_id: int, secondary_cards=None, tokens=None):
+        self.bundle_id = next_bundle_id()
         self.primary_card = primary_card
         self.owner_id = owner_id
-        self.secondary_cards = secondary_cards or []
-        self.tokens = tokens or []
-        self.upgrades: list[CardBundle] = []
+        self._secondary_cards = secondary_cards or None
+        self._tokens = tokens or None
+        self._upgrades = None
         self.damage = 0
         self.exhausted = False
-        self.attack_buff = 0
-        self.health_buff = 0
-        self.temp_keywords: set[str] = set()
-        self.peekers: set[int] = set()
+        self._attack_buff = 0
+        self._health_buff = 0
+        self._temp_keyword_mask = 0   # KEYWORDS bits granted until a delayed effect removes them
+        self._modifiers = ()          # Modifiers in layer order (see modifiers.py)
+        self._stats = None            # cached (attack, health, keyword mask); None = recompute on read
+        self._peekers = None
+
+    secondary_cards: list[Card] = _lazy("_secondary_cards", list)
+    tokens: list = _lazy("_tokens", list)
+    upgrades: "list[CardBundle]" = _lazy("_upgrades", list)
+    peekers: set[int] = _lazy("_peekers", set)
 
-    def effective_attack(self):
-        return self.primary_card.attack + self.attack_buff
+    # writes clear the cached effective stats (change them through Game methods)
+    attack_buff: int = _invalidating("_attack_buff")
+    health_buff: int = _invalidating("_health_buff")
+    temp_keyword_mask: int = _invalidating("_temp_keyword_mask")
+    modifiers: tuple = _invalidating("_modifiers")
 
-    def effective_health(self):
-        return self.primary_card.health + self.health_buff
+    @property
+    def temp_keywords(self) -> tuple[str, ...]:
+        """Names of the temporary keywords (change them through Game.add/remove_temp_keywords)."""
+        return KEYWORDS.names(self.temp_keyword_mask)
+
+    @temp_keywords.setter
+    def temp_keywords(self, names):
+        self.temp_keyword_mask = KEYWORDS.mask(names)
+
+    def copy(self, memo: dict = None) -> "CardBundle":
+        """
+        Independent copy for a cloned game: same bundle_id and shared Card,
+        copied counters and containers (attached upgrades are copied too).
+        memo: original -> copy, filled in for this bundle and its upgrades.
+        """
+        new = _new_bundle(CardBundle)
+        new.bundle_id = self.bundle_id
+        new.primary_card = self.primary_card
+        new.owner_id = self.owner_id
+        new.damage = self.damage
+        new.exhausted = self.exhausted
+        new._attack_buff = self._attack_buff
+        new._health_buff = self._health_buff
+        new._modifiers = self._modifiers
+        new._stats = self._stats
+        new._secondary_cards = self._secondary_cards[:] if self._secondary_cards else None
+        new._tokens = self._tokens[:] if self._tokens else None
+        new._upgrades = [u.copy(memo) for u in self._upgrades] if self._upgrades else None
+        new._temp_keyword_mask = self._temp_keyword_mask
+        new._peekers = set(self._peekers) if self._peekers else None
+        if memo is not None:
+            memo[self] = new
+        return new
+
+    def get_state(self) -> tuple:
+        """Mutable state as a tuple, for Game.snapshot()."""
+        return (self.damage, self.exhausted, self._attack_buff, self._health_buff,
+                tuple(self._secondary_cards) if self._secondary_cards else None,
+                tuple(self._tokens) if self._tokens else None,
+                tuple((u, u.get_state()) for u in self._upgrades) if self._upgrades else None,
+                self._temp_keyword_mask, self._modifiers,
+                frozenset(self._peekers) if self._peekers else None)
+
+    def set_state(self, state: tuple):
+        (self.damage, self.exhausted, self._attack_buff, self._health_buff,
+         secondary, tokens, upgrades, self._temp_keyword_mask, self._modifiers, peekers) = state
+        self._stats = None
+        self._secondary_cards = list(secondary) if secondary else None
+        self._tokens = list(tokens) if tokens else None
+        if upgrades:
+            for upgrade, upgrade_state in upgrades:
+                upgrade.set_state(upgrade_state)
+            self._upgrades = [u for u, _ in upgrades]
+        else:
+            self._upgrades = None
+        self._peekers = set(peekers) if peekers else None
+
+    def effective_attack(self) -> int:
+        stats = self._stats
+        return (stats or self._compute_stats())[0]
+
+    def effective_health(self) -> int:
+        stats = self._stats
+        return (stats or self._compute_stats())[1]
+
+    def effective_keywords(self) -> int:
+        """KEYWORDS mask after modifiers and temporary keywords."""
+        stats = self._stats
+        return (stats or self._compute_stats())[2]
+
+    def _compute_stats(self) -> tuple[int, int, int]:
+        """Printed (or token) stats through the modifier layers, then buffs; cached until invalidated."""
+        card = self.primary_card
+        if card:
+            attack, health, keywords = card.attack or 0, card.health or 0, card.keyword_mask
+        else:
+            attack = health = keywords = 0
+            for t in self._tokens or ():
+                attack += t.attack or 0
+                health += t.health or 0
+                keywords |= KEYWORDS.mask(t.keywords)
+        if self._modifiers:
+            attack, health, keywords = apply_layers(attack, health, keywords, self._modifiers)
+        stats = self._stats = (max(0, attack + self._attack_buff), max(0, health + self._health_buff),
+                               keywords | self._temp_keyword_mask)
+        return stats
 
     def has_keyword(self, keyword: str):
-        return keyword in self.primary_card.keywords or keyword in self.temp_keywords
+        return bool(self.effective_keywords() & KEYWORDS.bit(keyword))
+
+    def has_any_keyword(self, mask: int) -> bool:
+        """True if the bundle has any keyword in mask, e.g. KEYWORDS.mask(["Sentinel", "Overwhelm"])."""
+        return bool(self.effective_keywords() & mask)
+
+    def is_peeked_by(self, player_id: int) -> bool:
+        return bool(self._peekers) and player_id in self._peekers
 
     def ready(self):
         self.exhausted = False
@@ -35,6 +174,6 @@ class CardBundle:
         """
         if self.primary_card:
             return self.primary_card.get_default_arena()
-        elif self.tokens:
-            return self.tokens[0].get_default_arena()
-        return "Ground Arena"
\ No newline at end of file
+        elif self._tokens:
+            return self._tokens[0].get_default_arena()
+        return "Ground Arena"
@@ -1,17 +1,41 @@
 # deck_loader.py
 import csv
+import hashlib
+import os
+import pickle
 import random
+import struct
+from collections import deque
 from swu_engine.card import Card
 from swu_engine.cardbundle import CardBundle
 
 
+# Compiled card-DB snapshot: MAGIC + version + sha256(csv) + pickled cards.
+# Bump CACHE_VERSION whenever Card or the CSV parsing changes.
+CACHE_MAGIC = b"SWUCDB"
+CACHE_VERSION = 4
+_HEADER = struct.Struct("<6sH32s")
+
+
 class CardDatabase:
-    """Holds all card definitions loaded from cards.csv"""
-    def __init__(self, csv_path: str):
+    """
+    Holds all card definitions loaded from cards.csv.
+
+    By default the parsed cards are also written to a binary snapshot next to
+    the CSV (all_cards.cdb). Later loads read the snapshot instead of parsing
+    the CSV, as long as the CSV's hash and CACHE_VERSION still match; otherwise
+    the snapshot is rebuilt.
+    """
+    def __init__(self, csv_path: str, cache_path: str = None, use_cache: bool = True):
         self.cards_by_id = {}
-        self.load_cards(csv_path)
+        if use_cache:
+            self.load_cached(csv_path, cache_path or default_cache_path(csv_path))
+        else:
+            self.load_cards(csv_path)
 
     def load_cards(self, csv_path: str):
+        # Printings with identical game data (variants, reprints) share one Card.
+        interned = {}
         with open(csv_path, newline='', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
@@ -27,18 +51,68 @@ class CardDatabase:
                     attack=int(row.get("Power", 0) or 0),
                     health=int(row.get("HP", 0) or 0),
                     keywords=[k.strip() for k in row.get("Keywords", "").split(";") if k.strip()],
+                    aspects=[a.strip() for a in row.get("Aspects", "").split(";") if a.strip()],
+                    traits=[t.strip() for t in row.get("Traits", "").split(";") if t.strip()],
                 )
-                self.cards_by_id[card_id] = card
+                self.cards_by_id[card_id] = interned.setdefault(card.fields(), card)
+
+    def load_cached(self, csv_path: str, cache_path: str):
+        """Load from the compiled snapshot, rebuilding it if it is missing or stale."""
+        digest = csv_digest(csv_path)
+        cards = read_cache(cache_path, digest)
+        if cards is not None:
+            self.cards_by_id = cards
+            return
+        self.load_cards(csv_path)
+        write_cache(cache_path, digest, self.cards_by_id)
 
     def get_card(self, card_id: str) -> Card | None:
         return self.cards_by_id.get(card_id)
 
 
+def csv_digest(csv_path: str) -> bytes:
+    with open(csv_path, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def default_cache_path(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + ".cdb"
+
+
+def read_cache(cache_path: str, digest: bytes) -> dict[str, Card] | None:
+    """Return the cached cards if the snapshot matches this CSV digest, else None."""
+    try:
+        with open(cache_path, "rb") as f:
+            magic, version, cached_digest = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != CACHE_MAGIC or version != CACHE_VERSION or cached_digest != digest:
+                return None
+            try:
+                cards = pickle.load(f)
+            except Exception:   # a damaged body can fail in many ways (ValueError, ImportError, ...): rebuild
+                return None
+    except (OSError, struct.error):
+        return None
+    return cards if isinstance(cards, dict) else None
+
+
+def write_cache(cache_path: str, digest: bytes, cards: dict[str, Card]):
+    """Write the snapshot atomically; an unwritable location just means no cache."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, digest))
+            pickle.dump(cards, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 class Deck:
-    """Wrapper for a player's deck (list of CardBundles)."""
+    """Wrapper for a player's deck (deque of CardBundles, index 0 is the top)."""
     def __init__(self, player_id: int):
         self.player_id = player_id
-        self.cards: list[CardBundle] = []
+        self.cards: deque[CardBundle] = deque()
 
     def add_card(self, card: Card):
         self.cards.append(CardBundle(primary_card=card, owner_id=self.player_id))
@@ -47,19 +121,19 @@ class Deck:
         for _ in range(count):
             self.add_card(card)
 
-    def shuffle(self):
-        random.shuffle(self.cards)
+    def shuffle(self, rng: random.Random = None):
+        cards = list(self.cards)
+        (rng or random).shuffle(cards)
+        self.cards = deque(cards)
 
     def draw(self, n: int = 1):
-        drawn = []
-        for _ in range(min(n, len(self.cards))):
-            drawn.append(self.cards.pop(0))
-        return drawn
+        popleft = self.cards.popleft
+        return [popleft() for _ in range(min(n, len(self.cards)))]
 
-    def mulligan(self, hand: list[CardBundle]):
+    def mulligan(self, hand: list[CardBundle], rng: random.Random = None):
         """Shuffle hand back into deck, draw new hand of same size."""
         self.cards.extend(hand)
-        self.shuffle()
+        self.shuffle(rng)
         return self.draw(len(hand))
 
     def summary(self):
@@ -119,27 +193,28 @@ class Deck:
     def __iter__(self):
         return iter(self.cards)
 
-    def load_deck_from_list(player, db: CardDatabase, decklist: dict[str, int]) -> Deck:
-        deck = Deck(player.get_player_id())
-        for card_id, count in decklist.items():
-            base_card = db.get_card(card_id)
-            if not base_card:
-                raise ValueError(f"Card ID {card_id} not found in database.")
-            deck.add_cards(base_card, count)
-        deck.validate()
-        return deck
-
-    def load_deck_from_file(player, db: CardDatabase, deck_file: str) -> Deck:
-        decklist = {}
-        with open(deck_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                parts = line.split(",")
-                if len(parts) != 2:
-                    raise ValueError(f"Invalid line in deck file: {line}")
-                card_id, count = parts[0].strip(), int(parts[1].strip())
-                decklist[card_id] = decklist.get(card_id, 0) + count
-
-        return load_deck_from_list(player, db, decklist)
+
+def load_deck_from_list(player, db: CardDatabase, decklist: dict[str, int]) -> Deck:
+    deck = Deck(player.get_player_id())
+    for card_id, count in decklist.items():
+        base_card = db.get_card(card_id)
+        if not base_card:
+            raise ValueError(f"Card ID {card_id} not found in database.")
+        deck.add_cards(base_card, count)
+    deck.validate()
+    return deck
+
+def load_deck_from_file(player, db: CardDatabase, deck_file: str) -> Deck:
+    decklist = {}
+    with open(deck_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = line.split(",")
+            if len(parts) != 2:
+                raise ValueError(f"Invalid line in deck file: {line}")
+            card_id, count = parts[0].strip(), int(parts[1].strip())
+            decklist[card_id] = decklist.get(card_id, 0) + count
+
+    return load_deck_from_list(player, db, decklist)
@@ -0,0 +1,259 @@
+# env.py
+"""
+Gym-style environments for training agents on the integer action space.
+
+SWUEnv wraps one self-play game. Every step is a decision of the player to
+move; observations (ObservationEncoder) are from that player's point of view
+and the reward goes to the player who took the action: +1 if it won the
+game, -1 if it lost, 0 otherwise. Phases without a real choice (only pass is
+legal) are skipped automatically.
+
+    env = SWUEnv(db, seed=0)
+    obs, info = env.reset()
+    obs, reward, done, info = env.step(action_id)   # info["mask"]: legal ids
+
+VecEnv steps N games with one batch of actions and returns stacked arrays,
+auto-resetting finished games:
+
+    venv = VecEnv(DEFAULT_CARDS, n=64, seed=0, workers=4)
+    obs, masks = venv.reset()
+    obs, rewards, dones, masks, info = venv.step(actions)
+
+The returned arrays are reused by the next step; copy what you keep. The
+observation of a finished game is already the first one of its next
+episode (info["winners"] says how the finished one ended). With
+workers > 1 the games are split into shards run by worker processes that
+write straight into shared memory, so only the actions cross a pipe.
+"""
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from swu_engine.action_space import ACTION_SPACE, PASS
+from swu_engine.observation import ObservationEncoder
+from swu_engine.sim import MAX_ACTIONS_PER_PHASE, MAX_ROUNDS, derive_seed, load_card_db, new_game
+
+DECISION_PHASES = ("Main", "Combat")
+
+
+class SWUEnv:
+    """One self-play game. obs/mask may be rows of a caller's stacked buffers."""
+
+    def __init__(self, db, seed: int = 0, encoder: ObservationEncoder = None, action_space=ACTION_SPACE,
+                 max_rounds: int = MAX_ROUNDS, obs: np.ndarray = None, mask: np.ndarray = None):
+        self.db = db
+        self.seed = seed
+        self.encoder = encoder or ObservationEncoder(db)
+        self.action_space = action_space
+        self.max_rounds = max_rounds
+        self.obs = obs if obs is not None else self.encoder.new_buffer()
+        self.mask = mask if mask is not None else action_space.new_mask()
+        self.episode = 0
+        self.game = None
+        self.phase_actions = 0
+        self.truncated = False
+
+    def reset(self, seed: int = None):
+        """Start the next episode (seeded from self.seed and the episode number unless seed is given)."""
+        if seed is None:
+            seed = derive_seed(self.seed, self.episode)
+        self.episode += 1
+        self.game = new_game(self.db, seed)
+        self.phase_actions = 0
+        self.truncated = False
+        self._advance()
+        return self._observe(), self._info()
+
+    def step(self, action_id: int):
+        game = self.game
+        tm = game.turn_manager
+        player = tm.get_current_player()
+        if action_id == PASS:
+            tm.next_phase()
+            self.phase_actions = 0
+        else:
+            self.action_space.apply(game, action_id)
+            self.phase_actions += 1
+        self._advance()
+
+        reward = 0.0
+        if game.over:
+            reward = 1.0 if game.winner is player else -1.0 if game.winner is not None else 0.0
+        done = game.over or self.truncated
+        if done:
+            self.encoder.encode(game, player, self.obs)
+            self.mask[:] = False
+        else:
+            self._observe()
+        return self.obs, reward, done, self._info()
+
+    def current_player_id(self) -> int:
+        return self.game.turn_manager.get_current_player().get_player_id()
+
+    def winner_id(self) -> int:
+        return self.game.winner.get_player_id() if self.game.winner else 0
+
+    def _advance(self):
+        """Run the turn loop until the player to move has a real choice, or the game ends."""
+        game = self.game
+        tm = game.turn_manager
+        while not game.over:
+            if tm.round_number > self.max_rounds:
+                self.truncated = True
+                return
+            if tm.get_current_phase().name in DECISION_PHASES and self.phase_actions < MAX_ACTIONS_PER_PHASE:
+                if self.action_space.legal_mask(game, self.mask)[1:].any():
+                    return
+            tm.next_phase()
+            self.phase_actions = 0
+
+    def _observe(self):
+        return self.encoder.encode(self.game, self.game.turn_manager.get_current_player(), self.obs)
+
+    def _info(self) -> dict:
+        return {"mask": self.mask, "player": self.current_player_id(), "winner": self.winner_id(),
+                "truncated": self.truncated}
+
+
+class _Batch:
+    """N in-process SWUEnvs writing into one set of stacked arrays."""
+
+    def __init__(self, db, n: int, seed: int, first: int, arrays: dict):
+        self.arrays = arrays
+        encoder = ObservationEncoder(db)
+        self.envs = [SWUEnv(db, derive_seed(seed, first + i), encoder,
+                            obs=arrays["obs"][i], mask=arrays["masks"][i]) for i in range(n)]
+
+    def reset(self):
+        players = self.arrays["players"]
+        for i, env in enumerate(self.envs):
+            env.reset()
+            players[i] = env.current_player_id()
+
+    def step(self, actions):
+        rewards, dones = self.arrays["rewards"], self.arrays["dones"]
+        players, winners = self.arrays["players"], self.arrays["winners"]
+        for i, env in enumerate(self.envs):
+            _, rewards[i], done, _ = env.step(int(actions[i]))
+            dones[i] = done
+            if done:
+                winners[i] = env.winner_id()
+                env.reset()
+            players[i] = env.current_player_id()
+
+
+def _array_specs(n: int, encoder_size: int, mask_size: int) -> dict:
+    return {
+        "obs": ((n, encoder_size), np.float32),
+        "masks": ((n, mask_size), np.bool_),
+        "rewards": ((n,), np.float32),
+        "dones": ((n,), np.bool_),
+        "players": ((n,), np.int8),
+        "winners": ((n,), np.int8),
+        "actions": ((n,), np.int32),
+    }
+
+
+def _shard_main(conn, csv_path: str, shm_name: str, specs: dict, start: int, count: int, seed: int):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    arrays = _views(shm.buf, specs)
+    shard = {name: array[start:start + count] for name, array in arrays.items()}
+    batch = _Batch(load_card_db(csv_path), count, seed, start, shard)
+    try:
+        while True:
+            command = conn.recv()
+            if command == "step":
+                batch.step(shard["actions"])
+            elif command == "reset":
+                batch.reset()
+            else:
+                break
+            conn.send(True)
+    finally:
+        del arrays, shard, batch
+        shm.close()
+
+
+def _views(buf, specs: dict) -> dict:
+    arrays, offset = {}, 0
+    for name, (shape, dtype) in specs.items():
+        size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        arrays[name] = np.ndarray(shape, dtype=dtype, buffer=buf, offset=offset)
+        offset += (size + 63) // 64 * 64
+    return arrays
+
+
+def _total_size(specs: dict) -> int:
+    return sum((int(np.prod(shape)) * np.dtype(dtype).itemsize + 63) // 64 * 64 for shape, dtype in specs.values())
+
+
+class VecEnv:
+    """
+    N self-play games stepped together. workers > 1 splits them into shards,
+    each run by a worker process over shared memory.
+    """
+
+    def __init__(self, csv_path: str, n: int, seed: int = 0, workers: int = 1):
+        self.n = n
+        db = load_card_db(csv_path)
+        specs = _array_specs(n, ObservationEncoder(db).size, ACTION_SPACE.size)
+        self.workers = []
+        if workers <= 1:
+            self.shm = None
+            self.arrays = {name: np.zeros(shape, dtype) for name, (shape, dtype) in specs.items()}
+            self.batch = _Batch(db, n, seed, 0, self.arrays)
+        else:
+            self.shm = shared_memory.SharedMemory(create=True, size=_total_size(specs))
+            self.arrays = _views(self.shm.buf, specs)
+            self.batch = None
+            bounds = np.linspace(0, n, min(workers, n) + 1).astype(int)
+            for start, end in zip(bounds[:-1], bounds[1:]):
+                parent, child = mp.Pipe()
+                proc = mp.Process(target=_shard_main, daemon=True,
+                                  args=(child, csv_path, self.shm.name, specs, start, end - start, seed))
+                proc.start()
+                self.workers.append((proc, parent))
+
+    def reset(self):
+        self._run("reset")
+        return self.arrays["obs"], self.arrays["masks"]
+
+    def step(self, actions):
+        """
+        Play actions[i] in game i. Returns (obs, rewards, dones, masks, info);
+        info holds "players" (who moves next) and "winners" (valid where done).
+        """
+        self.arrays["actions"][:] = actions
+        self._run("step")
+        a = self.arrays
+        return a["obs"], a["rewards"], a["dones"], a["masks"], {"players": a["players"], "winners": a["winners"]}
+
+    def _run(self, command: str):
+        if self.batch is not None:
+            if command == "step":
+                self.batch.step(self.arrays["actions"])
+            else:
+                self.batch.reset()
+            return
+        for _, conn in self.workers:
+            conn.send(command)
+        for _, conn in self.workers:
+            conn.recv()
+
+    def close(self):
+        for proc, conn in self.workers:
+            conn.send("close")
+            proc.join()
+        self.workers = []
+        if self.shm is not None:
+            self.arrays = None
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
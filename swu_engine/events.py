@@ -0,0 +1,262 @@
+# events.py
+"""
+Typed game-event bus.
+
+Game, TurnManager, hooks and RulesEngine report state changes through
+game.events.emit(...) instead of printing. An event is a small record
+(type, player id, bundle id, amount) plus references to the objects involved;
+nothing is formatted until a sink asks for text. With no sinks (or only a
+NullSink) attached, emit() returns immediately.
+"""
+import itertools
+import sys
+from enum import IntEnum
+from typing import NamedTuple
+
+
+class EventType(IntEnum):
+    # cards moving between zones
+    DRAW = 1
+    DECK_EMPTY = 2
+    MILL = 3
+    DISCARD = 4
+    DISCARD_FAILED = 5
+    MOVED_TO_DISCARD = 6
+    EVENT_TO_DISCARD = 7
+    EXILE = 8
+    RETURN_TO_HAND = 9
+    SEARCH_FIND = 10
+    SHUFFLE = 11
+    RESOURCE = 12
+    PLACE_RESOURCE = 13
+    RESOURCE_REMOVED = 14
+    RESOURCE_NOT_FOUND = 15
+    RESOURCE_REMOVE_FAILED = 16
+    # playing cards
+    UNIT_ENTERS = 20
+    PLAY_EVENT = 21
+    PLAY_UPGRADE = 22
+    TOKEN_CREATED = 23
+    TOKEN_ENTERS = 24
+    DETACH_UPGRADE = 25
+    ATTACH_UPGRADE = 26
+    # damage and combat
+    DAMAGE = 30
+    HEAL = 31
+    ATTACK = 32
+    COMBAT = 33
+    COMBAT_DAMAGE = 34
+    INVALID_COMBAT = 35
+    DESTROY = 36
+    GAME_OVER = 37
+    AMBUSH_ENTERS = 38
+    AMBUSH_ATTACK = 39
+    AMBUSH_NO_TARGET = 40
+    # information
+    REVEAL = 50
+    PEEK = 51
+    CONDITION_MET = 52
+    TOP_REVEALED = 53
+    REVEAL_CLEARED = 54
+    # stat and keyword changes
+    BUFF = 60
+    BUFF_EXPIRED = 61
+    DEBUFF = 62
+    DEBUFF_EXPIRED = 63
+    KEYWORD_GAINED = 64
+    KEYWORD_LOST = 65
+    KEYWORD_EXPIRED = 66
+    KEYWORD_REGAINED = 67
+    DELAYED_REGISTERED = 68
+    DELAYED_FIRED = 69
+    # turn structure and hooks
+    PRIORITY_WINDOW = 80
+    NEW_ROUND = 81
+    INITIATIVE = 82
+    RESOURCES_REFRESHED = 83
+    UNITS_READIED = 84
+    LEADER_READIED = 85
+    TURN_DRAW = 87
+    MULLIGAN = 88
+    END_TURN_DISCARD = 89
+    HAND_LIMIT_DISCARD = 90
+
+
+class GameEvent(NamedTuple):
+    type: EventType
+    player_id: int | None
+    bundle_id: int | None
+    amount: int = 0
+    subject: object = None   # bundle / base the event is about (a list for bulk moves)
+    target: object = None    # second object or extra detail (defender, zone name, ...)
+
+
+# Unique ids for CardBundles, so events can identify cards without names.
+next_bundle_id = itertools.count(1).__next__
+
+
+class NullSink:
+    """Discards everything. Attaching it keeps the bus inactive (headless runs)."""
+
+    def handle(self, event: GameEvent):
+        pass
+
+
+class ListSink:
+    """Collects events in memory (tests, replays, analytics)."""
+
+    def __init__(self):
+        self.events: list[GameEvent] = []
+
+    def handle(self, event: GameEvent):
+        self.events.append(event)
+
+
+class EventBus:
+    def __init__(self):
+        self.sinks = []
+        self.active = False
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+        self._refresh()
+
+    def remove_sink(self, sink):
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+        self._refresh()
+
+    def _refresh(self):
+        self.active = any(not isinstance(s, NullSink) for s in self.sinks)
+
+    def emit(self, etype: EventType, player=None, subject=None, amount: int = 0, target=None):
+        if not self.active:
+            return
+        event = GameEvent(
+            etype,
+            player.player_id if player is not None else None,
+            getattr(subject, "bundle_id", None),
+            amount,
+            subject,
+            target,
+        )
+        for sink in self.sinks:
+            sink.handle(event)
+
+
+# --- Text rendering (the engine's classic console messages) ---
+
+def _card(obj):
+    if obj is None:
+        return "target"
+    if hasattr(obj, "primary_card"):
+        return obj.primary_card.name
+    return obj.name
+
+
+def _each(event, fmt):
+    """Render one line per card for bulk events (draw/mill/reveal of several cards)."""
+    if isinstance(event.subject, (list, tuple)):
+        return "\n".join(fmt(b) for b in event.subject)
+    return fmt(event.subject)
+
+
+def _stats(bundle):
+    return f"{bundle.primary_card.name} ({bundle.effective_attack()}/{bundle.effective_health()})"
+
+
+def _damage_text(e, p):
+    if hasattr(e.subject, "primary_card"):
+        return f"{_card(e.subject)} takes {e.amount} damage (damage={e.subject.damage})."
+    return f"{e.subject.name} takes {e.amount} damage (health={e.subject.health})."
+
+
+def _combat_damage_text(e, p):
+    if hasattr(e.subject, "primary_card"):
+        return f"{_card(e.subject)} takes {e.amount} damage (total {e.subject.damage})"
+    return f"{e.subject.name} takes {e.amount} damage (health={e.subject.health})"
+
+
+def _combat_text(e, p):
+    if hasattr(e.target, "primary_card"):
+        return f"{_stats(e.subject)} fights {_stats(e.target)}"
+    return f"{_stats(e.subject)} attacks {e.target.name}!"
+
+
+TEXT_TEMPLATES = {
+    EventType.DRAW: lambda e, p: _each(e, lambda b: f"{p} draws {_card(b)}."),
+    EventType.DECK_EMPTY: lambda e, p: f"{p} has no more cards to draw.",
+    EventType.MILL: lambda e, p: _each(e, lambda b: f"{p} mills {_card(b)}."),
+    EventType.DISCARD: lambda e, p: f"{p} discards {_card(e.subject)}.",
+    EventType.DISCARD_FAILED: lambda e, p: f"{_card(e.subject)} not in {p}'s hand.",
+    EventType.MOVED_TO_DISCARD: lambda e, p: f"{_card(e.subject)} moved to discard pile of {p}.",
+    EventType.EVENT_TO_DISCARD: lambda e, p: f"{_card(e.subject)} is moved to discard.",
+    EventType.EXILE: lambda e, p: f"{_card(e.subject)} is exiled from {p}.",
+    EventType.RETURN_TO_HAND: lambda e, p: f"{_card(e.subject)} is returned to {p}'s hand.",
+    EventType.SEARCH_FIND: lambda e, p: f"{p} finds {_card(e.subject)}.",
+    EventType.SHUFFLE: lambda e, p: f"{p} shuffles their deck.",
+    EventType.RESOURCE: lambda e, p: f"{p} resources {_card(e.subject)}.",
+    EventType.PLACE_RESOURCE: lambda e, p: f"{p} places a resource ({_card(e.subject)}).",
+    EventType.RESOURCE_REMOVED: lambda e, p: f"{p} removes resource {_card(e.subject)} → {e.target}.",
+    EventType.RESOURCE_NOT_FOUND: lambda e, p: f"{_card(e.subject)} is not in {p}'s resources.",
+    EventType.RESOURCE_REMOVE_FAILED: lambda e, p: f"Failed to move {_card(e.subject)} from resources to {e.target}.",
+    EventType.UNIT_ENTERS: lambda e, p: f"{_card(e.subject)} enters the {e.target}.",
+    EventType.PLAY_EVENT: lambda e, p: f"{p} plays event {_card(e.subject)}.",
+    EventType.PLAY_UPGRADE: lambda e, p: f"{p} plays upgrade {_card(e.subject)} (attach via action).",
+    EventType.TOKEN_CREATED: lambda e, p: f"{p} creates a {e.target} token.",
+    EventType.TOKEN_ENTERS: lambda e, p: f"{p} creates a token in the {e.target}: {e.subject.tokens[0].token_info}",
+    EventType.DETACH_UPGRADE: lambda e, p: f"{_card(e.subject)} detached from {_card(e.target)} and discarded.",
+    EventType.ATTACH_UPGRADE: lambda e, p: f"{_card(e.subject)} attached to {_card(e.target)}.",
+    EventType.DAMAGE: _damage_text,
+    EventType.HEAL: lambda e, p: f"{_card(e.subject)} heals {e.amount} damage (damage={e.subject.damage}).",
+    EventType.ATTACK: lambda e, p: f"{_card(e.subject)} attacks {_card(e.target)}!",
+    EventType.COMBAT: _combat_text,
+    EventType.COMBAT_DAMAGE: _combat_damage_text,
+    EventType.INVALID_COMBAT: lambda e, p: "Invalid defender for combat.",
+    EventType.DESTROY: lambda e, p: f"{_card(e.subject)} is destroyed and moved to discard.",
+    EventType.GAME_OVER: lambda e, p: f"{e.subject.name} is destroyed! {p} wins.",
+    EventType.AMBUSH_ENTERS: lambda e, p: f"{_card(e.subject)} enters play with Ambush!",
+    EventType.AMBUSH_ATTACK: lambda e, p: f"{_card(e.subject)} (Ambush) attacks {_card(e.target)} immediately!",
+    EventType.AMBUSH_NO_TARGET: lambda e, p: f"{_card(e.subject)} had no legal Ambush targets.",
+    EventType.REVEAL: lambda e, p: _each(e, lambda b: f"Revealed: {_card(b)}"),
+    EventType.PEEK: lambda e, p: f"{p} peeks at {_card(e.subject)}.",
+    EventType.CONDITION_MET: lambda e, p: f"Condition met for {_card(e.subject)}.",
+    EventType.TOP_REVEALED: lambda e, p: f"{p}'s top card remains revealed: {_card(e.subject)}",
+    EventType.REVEAL_CLEARED: lambda e, p: f"{p}'s deck is empty, top card reveal cleared.",
+    EventType.BUFF: lambda e, p: f"{_card(e.subject)} buffed: +{e.target[0]}/+{e.target[1]} {e.target[2] or ''}",
+    EventType.BUFF_EXPIRED: lambda e, p: f"{_card(e.subject)}'s temporary buff expired.",
+    EventType.DEBUFF: lambda e, p: f"{_card(e.subject)} debuffed: -{e.target[0]}/-{e.target[1]} remove {e.target[2] or ''}",
+    EventType.DEBUFF_EXPIRED: lambda e, p: f"{_card(e.subject)}'s temporary debuff expired.",
+    EventType.KEYWORD_GAINED: lambda e, p: f"{_card(e.subject)} gains keyword {e.target}",
+    EventType.KEYWORD_LOST: lambda e, p: f"{_card(e.subject)} loses keyword {e.target}",
+    EventType.KEYWORD_EXPIRED: lambda e, p: f"{_card(e.subject)} loses temporary keyword {e.target}",
+    EventType.KEYWORD_REGAINED: lambda e, p: f"{_card(e.subject)} regains temporary keyword {e.target}",
+    EventType.DELAYED_REGISTERED: lambda e, p: f"Delayed effect registered for {e.target}.",
+    EventType.DELAYED_FIRED: lambda e, p: "Delayed effect expired.",
+    EventType.PRIORITY_WINDOW: lambda e, p: f"Priority window opened during {e.target} phase.",
+    EventType.NEW_ROUND: lambda e, p: f"--- New Round {e.amount} ---",
+    EventType.INITIATIVE: lambda e, p: f"Initiative passes to {p}",
+    EventType.RESOURCES_REFRESHED: lambda e, p: "All resources refreshed.",
+    EventType.UNITS_READIED: lambda e, p: "All units readied.",
+    EventType.LEADER_READIED: lambda e, p: f"{p}'s leader is ready.",
+    EventType.TURN_DRAW: lambda e, p: f"{p} draws 1 card at the start of their turn.",
+    EventType.MULLIGAN: lambda e, p: f"{p} mulligans and redraws {e.amount} cards.",
+    EventType.END_TURN_DISCARD: lambda e, p: f"{p} discards 1 card at the end of their turn.",
+    EventType.HAND_LIMIT_DISCARD: lambda e, p: f"{p} discards down to {e.amount} card limit.",
+}
+
+
+class TextSink:
+    """Renders events as the engine's console messages."""
+
+    def __init__(self, game, stream=None):
+        self.game = game
+        self.stream = stream
+
+    def format(self, event: GameEvent) -> str:
+        player = self.game.get_player_by_id(event.player_id) if event.player_id is not None else None
+        name = player.get_name() if player else ""
+        return TEXT_TEMPLATES[event.type](event, name)
+
+    def handle(self, event: GameEvent):
+        print(self.format(event), file=self.stream or sys.stdout)
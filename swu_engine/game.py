@@ -4,23 +4,63 @@ from swu_engine.turn_manager import TurnManager
 from swu_engine.rules_engine import RulesEngine
 from swu_engine.cardbundle import CardBundle
 from swu_engine.board import Zone, Pile
+from swu_engine.events import EventBus, EventType, TextSink
+from swu_engine.action_cache import ActionCache
+from swu_engine.journal import Journal
+from swu_engine.modifiers import LAYER_UPGRADE, Modifier, insert_modifier, remap_modifiers
+from swu_engine.hooks import HOOK_REGISTRY, HookRegistry
+from swu_engine.scheduler import EffectScheduler
+from swu_engine.targets import TargetIndex
+from swu_engine.zobrist import StateHasher
+from swu_engine.vocab import KEYWORDS
 import random
 
+class Phase:
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+_new_random = random.Random.__new__   # unseeded; clone() sets its state
+
+
+# Phase objects are plain names and shared by every game.
+PHASES = (Phase("Start"), Phase("Main"), Phase("Combat"), Phase("End"))
+
+
 class Game:
-    def __init__(self):
+    def __init__(self, sinks: list = None, hooks: HookRegistry = None, seed: int = None,
+                 rng: random.Random = None):
+        """
+        sinks: event sinks to attach to game.events. Defaults to a TextSink
+        (console messages); pass [] or [NullSink()] for headless games.
+        hooks: turn/round hooks for this game. Defaults to a fresh registry
+        built from hooks.HOOK_REGISTRY.
+        seed: seed for game.rng, the game's own random stream (shuffles,
+        agents); None seeds it from the OS. rng: use this stream instead.
+        """
         self.players: list[Player] = []
-        self.phases = [
-            type("Phase", (), {"name": "Start"})(),
-            type("Phase", (), {"name": "Main"})(),
-            type("Phase", (), {"name": "Combat"})(),
-            type("Phase", (), {"name": "End"})(),
-        ]
+        self.events = EventBus()
+        for sink in (sinks if sinks is not None else [TextSink(self)]):
+            self.events.add_sink(sink)
+        self.phases = list(PHASES)
         self.turn_manager = TurnManager(self.players, self.phases, self)  # 🔹 now has reference back to Game
-        self.rules = RulesEngine()
-        self.delayed_effects: list[tuple[str, dict]] = []
+        self.rules = RulesEngine(self)
+        self.targets = TargetIndex(self)   # legal targets per Requirement, cached per state version
+        self.action_cache = ActionCache(self)   # behind rules.get_legal_actions / get_response_actions
+        self.scheduler = EffectScheduler()   # delayed effects, see register_delayed_effect
+        self.winner: Player | None = None
+        self.over = False
+        self.journal = Journal()
+        self.hooks = hooks if hooks is not None else HookRegistry(HOOK_REGISTRY)
+        self.rng = rng if rng is not None else random.Random(seed)
 
     def add_player(self, player: Player):
         self.players.append(player)
+        player.get_board().journal = self.journal
+        if self.journal.hasher is not None:
+            self.journal.hasher.rehash()
 
         # Put leader in Leader zone if defined
         if hasattr(player, "leader") and player.leader:
@@ -39,9 +79,200 @@ class Game:
     def get_active_player(self):
         return self.turn_manager.get_active_player(self)
 
-    def register_delayed_effect(self, trigger_phase: str, effect_fn, **kwargs):
-        self.delayed_effects.append((trigger_phase, {"fn": effect_fn, "kwargs": kwargs}))
-        print(f"Delayed effect registered for {trigger_phase}.")
+    def get_opponent(self, player: Player):
+        return next((p for p in self.players if p.get_player_id() != player.get_player_id()), None)
+
+    def is_over(self):
+        return self.over
+
+    # --- Cloning and snapshots (search / simulation) ---
+
+    def clone(self, sinks: list = None) -> 'Game':
+        """
+        Independent copy of this game for search. Cards are shared, all mutable
+        state (bundles, piles, bases, turn position) is copied. The clone is
+        headless unless sinks are given and gets its own copy of the hook
+        registry. Delayed effects are carried over with bundle/player/modifier
+        arguments remapped to the clone's objects (attached upgrades
+        included), and modifiers from a copied source name the copy.
+        """
+        rng = _new_random(random.Random)
+        rng.setstate(self.rng.getstate())
+        game = Game(sinks=sinks or [], hooks=self.hooks.copy(), rng=rng)
+        memo = {}
+        for player in self.players:
+            new_player = player.clone(memo)
+            new_player.get_board().journal = game.journal
+            memo[player] = new_player
+            game.players.append(new_player)
+
+        game.turn_manager.set_position(self.turn_manager.get_position())
+
+        for copy in list(memo.values()):   # modifiers from copied sources must name the copies
+            if type(copy) is CardBundle and copy._modifiers:
+                copy._modifiers = remap_modifiers(copy._modifiers, memo)
+        game.scheduler = self.scheduler.clone(memo)
+        game.winner = memo.get(self.winner) if self.winner is not None else None
+        game.over = self.over
+        if self.journal.hasher is not None:
+            game.journal.hasher = StateHasher(game, self.journal.hasher.get())
+        return game
+
+    def snapshot(self) -> tuple:
+        """
+        Capture the mutable state of this game in place (no copies of bundles).
+        restore() puts the same objects back into that state. For undoing a
+        few moves, checkpoint()/rollback() is cheaper.
+        """
+        bundle_states = []
+        for player in self.players:
+            for bundle in player.get_board().locations:
+                bundle_states.append((bundle, bundle.get_state()))
+            if player.leader is not None:
+                bundle_states.append((player.leader, player.leader.get_state()))
+        return (
+            tuple((p, p.get_state(), p.get_board().get_state()) for p in self.players),
+            bundle_states,
+            self.turn_manager.get_position(),
+            self.scheduler.get_state(),
+            self.rng.getstate(),
+            self.winner,
+            self.over,
+        )
+
+    def restore(self, snapshot: tuple):
+        """Return this game to the state captured by snapshot(). Not journaled."""
+        players, bundle_states, turn, delayed, rng_state, self.winner, self.over = snapshot
+        self.players[:] = [p for p, _, _ in players]
+        for bundle, state in bundle_states:   # before the boards: their keyword index reads these
+            bundle.set_state(state)
+        for player, player_state, board_state in players:
+            player.set_state(player_state)
+            player.get_board().set_state(board_state)
+        self.turn_manager.set_position(turn)
+        self.scheduler.set_state(delayed)
+        self.rng.setstate(rng_state)
+        self.journal.epoch += 1
+        self.journal.version += 1
+        if self.journal.hasher is not None:
+            self.journal.hasher.rehash()
+
+    def state_hash(self) -> int:
+        """
+        64-bit hash of the game state (see zobrist.py). The first call starts
+        incremental tracking, so later calls only pay for what changed.
+        """
+        hasher = self.journal.hasher
+        if hasher is None:
+            hasher = self.journal.hasher = StateHasher(self)
+        return hasher.get()
+
+    # --- Undo journal ---
+
+    def checkpoint(self) -> int:
+        """Start recording undo entries; rollback(cp) returns the game to this point."""
+        return self.journal.checkpoint()
+
+    def rollback(self, cp: int):
+        self.journal.rollback(cp)
+
+    def release(self, cp: int):
+        """Keep the changes made since cp and stop recording (unless an outer checkpoint is open)."""
+        self.journal.release(cp)
+
+    # --- Primitive bundle mutations (journaled) ---
+
+    def exhaust(self, bundle: CardBundle):
+        self.journal.save(bundle, "exhausted")
+        bundle.exhaust()
+        self._bump_pile(bundle)
+
+    def ready(self, bundle: CardBundle):
+        self.journal.save(bundle, "exhausted")
+        bundle.ready()
+        self._bump_pile(bundle)
+
+    def _bump_pile(self, bundle: CardBundle):
+        for player in self.players:
+            if player.player_id == bundle.owner_id:
+                player.board.bump(bundle)
+                return
+
+    def modify_stats(self, bundle: CardBundle, attack: int = 0, health: int = 0):
+        """Add to a bundle's attack/health buffs (negative values debuff)."""
+        self.journal.save(bundle, "attack_buff")
+        self.journal.save(bundle, "health_buff")
+        bundle.attack_buff += attack
+        bundle.health_buff += health
+
+    def add_temp_keywords(self, bundle: CardBundle, keywords):
+        self.set_temp_keywords(bundle, bundle.temp_keyword_mask | KEYWORDS.mask(keywords))
+
+    def remove_temp_keywords(self, bundle: CardBundle, keywords):
+        self.set_temp_keywords(bundle, bundle.temp_keyword_mask & ~KEYWORDS.mask(keywords))
+
+    def set_temp_keywords(self, bundle: CardBundle, mask: int):
+        """Replace a bundle's temporary keyword mask, keeping the owner's arena keyword index in step."""
+        owner = self.get_player_by_id(bundle.owner_id)
+        board = owner.get_board() if owner else None
+        in_arena = board is not None and board.in_arena(bundle)
+        if in_arena:
+            board.count_keywords(bundle, -1)
+        self.journal.record(self.set_temp_keywords, bundle, bundle.temp_keyword_mask)
+        self.journal.touch(bundle)
+        bundle.temp_keyword_mask = mask
+        if in_arena:
+            board.count_keywords(bundle, 1)
+
+    # --- Continuous modifiers (see modifiers.py) ---
+
+    def add_modifier(self, bundle: CardBundle, modifier: Modifier) -> Modifier:
+        """Apply modifier to bundle until remove_modifier(); returns it."""
+        self.set_modifiers(bundle, insert_modifier(bundle.modifiers, modifier))
+        return modifier
+
+    def remove_modifier(self, bundle: CardBundle, modifier: Modifier) -> bool:
+        if modifier not in bundle.modifiers:
+            return False
+        self.set_modifiers(bundle, tuple(m for m in bundle.modifiers if m is not modifier))
+        return True
+
+    def remove_modifiers_from(self, bundle: CardBundle, source) -> int:
+        """Remove every modifier on bundle that comes from source; returns how many."""
+        kept = tuple(m for m in bundle.modifiers if m.source is not source)
+        removed = len(bundle.modifiers) - len(kept)
+        if removed:
+            self.set_modifiers(bundle, kept)
+        return removed
+
+    def add_lasting_modifier(self, bundle: CardBundle, modifier: Modifier, duration: str) -> Modifier:
+        """add_modifier() until the duration ends (see register_delayed_effect)."""
+        self.add_modifier(bundle, modifier)
+        self.register_delayed_effect(duration, Game.remove_modifier, bundle=bundle, modifier=modifier)
+        return modifier
+
+    def set_modifiers(self, bundle: CardBundle, modifiers: tuple):
+        """Replace a bundle's modifiers (in layer order); clears only its cached stats."""
+        owner = self.get_player_by_id(bundle.owner_id)
+        board = owner.get_board() if owner else None
+        in_arena = board is not None and board.in_arena(bundle)
+        if in_arena:
+            board.count_keywords(bundle, -1)
+        self.journal.record(self.set_modifiers, bundle, bundle.modifiers)
+        self.journal.touch(bundle)
+        bundle.modifiers = modifiers
+        if in_arena:
+            board.count_keywords(bundle, 1)
+
+    def register_delayed_effect(self, duration: str, effect_fn, **kwargs):
+        """
+        Call effect_fn(game, **kwargs) when the duration ends: "phase", "turn"
+        or "round" (end of the current one), or a phase name (end of the next
+        time that phase is reached).
+        """
+        key = self.scheduler.due_key(self.turn_manager, duration)
+        self.scheduler.schedule(self.journal, key, effect_fn, kwargs)
+        self.events.emit(EventType.DELAYED_REGISTERED, target=duration)
 
     def play_card(self, player: Player, bundle: CardBundle, extra_targets=None):
         card = bundle.primary_card
@@ -49,42 +280,41 @@ class Game:
             return False
 
         # Hand → Arena/Discard/Resources
-        hand_zone = player.get_board().find_zone("Hand")
-        if bundle in player.hand:
-            player.hand.remove(bundle)  # keep internal list synced
+        board = player.get_board()
 
         if card.card_type == "unit":
-            zone_name = bundle.get_default_arena()
-            arena = player.get_board().find_zone(zone_name)
-            if not arena.get_piles():
-                from swu_engine.board import Pile
-                arena.add_pile(Pile(f"{arena.zone_id}_pile"))
-            arena.get_piles()[0].add_bundle(bundle)
-            print(f"{card.name} enters the {arena.get_name()}.")
-
+            arena = board.move_bundle(bundle, bundle.get_default_arena())
+            self.events.emit(EventType.UNIT_ENTERS, player, bundle, target=arena.get_name())
 
         elif card.card_type == "event":
-            print(f"{player.get_name()} plays event {card.name}.")
+            self.events.emit(EventType.PLAY_EVENT, player, bundle)
             if card.effect_fn:
                 if getattr(card.effect_fn, "requires_target", False):
                     card.effect_fn(self, player, extra_targets or {})
                 else:
                     card.effect_fn(self, player, {})
-            discard_zone = player.get_board().find_zone("Discard")
-            player.get_board().move_to_zone(bundle, hand_zone, discard_zone)
-            player.discard_pile.append(bundle)   # keep discard list synced
-            print(f"{card.name} is moved to discard.")
+            board.move_bundle(bundle, "Discard")
+            self.events.emit(EventType.EVENT_TO_DISCARD, player, bundle)
 
         elif card.card_type == "upgrade":
-            print(f"{player.get_name()} plays upgrade {card.name} (attach via action).")
-            # implement attachment logic here later
+            self.events.emit(EventType.PLAY_UPGRADE, player, bundle)
+            # implement attachment logic here later; until then it leaves hand for discard
+            board.move_bundle(bundle, "Discard")
 
         elif card.card_type == "resource":
-            res_zone = player.get_board().find_zone("Resources")
-            player.get_board().move_to_zone(bundle, hand_zone, res_zone)
-            player.resources.append(bundle)   # keep resource list synced
-            print(f"{player.get_name()} places a resource ({card.name}).")
+            board.move_bundle(bundle, "Resources")
+            self.events.emit(EventType.PLACE_RESOURCE, player, bundle)
+
+        return True
 
+    def resource_card(self, player: Player, bundle: CardBundle):
+        """Put a card from hand face-down into the resource zone (once per turn)."""
+        if bundle not in player.hand:
+            return False
+        player.get_board().move_bundle(bundle, "Resources")
+        self.journal.save(player, "resources_played_this_turn")
+        player.resources_played_this_turn += 1
+        self.events.emit(EventType.RESOURCE, player, bundle)
         return True
 
     def show_board(self):
@@ -126,20 +356,8 @@ class Game:
             else:
                 print("  Leader: (none)")
 
-            # Hand
-            hand_zone = Zone("hand", p.player_id, "Hand", "hidden_owner")
-            pile = Pile("hand_pile")
-            for b in p.hand:
-                pile.add_bundle(b)
-            hand_zone.add_pile(pile)
-            print(" ", self._format_zone(p, hand_zone, p))
-
-            # Deck
-            deck_zone = Zone("deck", p.player_id, "Deck", "hidden_owner")
-            deck_pile = Pile("deck_pile")
-            for b in p.deck:
-                deck_pile.add_bundle(b)
-            deck_zone.add_pile(deck_pile)
+            board = p.get_board()
+            print(" ", self._format_zone(p, board.find_zone("Hand"), p))
 
             if p.top_deck_revealed and p.deck:
                 top_card = p.deck[0].primary_card.name
@@ -147,34 +365,14 @@ class Game:
                 if len(p.deck) > 1:
                     print(f"    + {len(p.deck) - 1} more card(s) (hidden)")
             else:
-                print(" ", self._format_zone(p, deck_zone, p))
-
-
-            # Discard
-            discard_zone = Zone("discard", p.player_id, "Discard", "public")
-            discard_pile = Pile("discard_pile")
-            for b in p.discard_pile:
-                discard_pile.add_bundle(b)
-            discard_zone.add_pile(discard_pile)
-            print(" ", self._format_zone(p, discard_zone, p))
-
-            # Exile
-            exile_zone = Zone("exile", p.player_id, "Exile", "public")
-            exile_pile = Pile("exile_pile")
-            for b in p.exile_pile:
-                exile_pile.add_bundle(b)
-            exile_zone.add_pile(exile_pile)
-            print(" ", self._format_zone(p, exile_zone, p))
-            # Resources
-            res_zone = Zone("resources", p.player_id, "Resources", "hidden_all")
-            res_pile = Pile("resource_pile")
-            for b in p.resources:
-                res_pile.add_bundle(b)
-            res_zone.add_pile(res_pile)
-            print(" ", self._format_zone(p, res_zone, p))
+                print(" ", self._format_zone(p, board.find_zone("Deck"), p))
+
+            print(" ", self._format_zone(p, board.find_zone("Discard"), p))
+            print(" ", self._format_zone(p, board.find_zone("Exile"), p))
+            print(" ", self._format_zone(p, board.find_zone("Resources"), p))
 
             # Arenas
-            for z in p.get_board().get_zones():
+            for z in board.get_zones():
                 if z.get_name() in ("Ground Arena", "Space Arena"):
                     print(f"  {z.get_name()}:")
                     any_units = False
@@ -196,27 +394,27 @@ class Game:
 
     def deal_damage(self, target, amount: int):
         if isinstance(target, Base):
+            self.journal.save(target, "health")
             target.take_damage(amount)
-            print(f"{target.name} takes {amount} damage (health={target.health}).")
+            self.events.emit(EventType.DAMAGE, subject=target, amount=amount)
+            self._check_base_defeat()
         elif isinstance(target, CardBundle):
+            self.journal.save(target, "damage")
             target.damage += amount
-            print(f"{target.primary_card.name} takes {amount} damage (damage={target.damage}).")
+            self.events.emit(EventType.DAMAGE, subject=target, amount=amount)
 
     def heal_unit(self, bundle: CardBundle, amount: int):
         healed = min(amount, bundle.damage)
+        self.journal.save(bundle, "damage")
         bundle.damage -= healed
-        print(f"{bundle.primary_card.name} heals {healed} damage (damage={bundle.damage}).")
+        self.events.emit(EventType.HEAL, subject=bundle, amount=healed)
 
     def discard_card_from_hand(self, player: Player, bundle: CardBundle):
         if bundle not in player.hand:
-            print(f"{bundle.primary_card.name} not in {player.get_name()}'s hand.")
+            self.events.emit(EventType.DISCARD_FAILED, player, bundle)
             return False
-        hand_zone = player.get_board().find_zone("Hand")
-        discard_zone = player.get_board().find_zone("Discard")
-        player.get_board().move_to_zone(bundle, hand_zone, discard_zone)
-        player.hand.remove(bundle)          # keep list synced
-        player.discard_pile.append(bundle)  # keep list synced
-        print(f"{player.get_name()} discards {bundle.primary_card.name}.")
+        player.get_board().move_bundle(bundle, "Discard")
+        self.events.emit(EventType.DISCARD, player, bundle)
         return True
 
     def move_to_discard(self, player: 'Player', bundle: 'CardBundle'):
@@ -226,31 +424,20 @@ class Game:
             discard_zone = Zone("discard", player.get_player_id(), "Discard", "public")
             player.get_board().add_zone(discard_zone)
 
-        # Ensure pile exists
-        if not discard_zone.get_piles():
-            discard_zone.add_pile(Pile("discard_pile"))
+        # Pull it from wherever it is (hand, arena, ...) into discard
+        player.get_board().move_bundle(bundle, discard_zone)
 
-        # Add to discard zone
-        discard_zone.get_piles()[0].add_bundle(bundle)
-
-        # Track in player's discard list
-        if bundle not in player.discard_pile:
-            player.discard_pile.append(bundle)
-
-        print(f"{bundle.primary_card.name} moved to discard pile of {player.get_name()}.")
+        self.events.emit(EventType.MOVED_TO_DISCARD, player, bundle)
 
     def draw_cards(self, player: Player, amount: int):
-        deck_zone = player.get_board().find_zone("Deck")
-        hand_zone = player.get_board().find_zone("Hand")
-        for _ in range(min(amount, len(player.deck))):
-            b = player.deck.pop(0)
+        drawn = player.get_board().move_top_of_deck(amount, "Hand")
+        if drawn:
+            self.journal.save(player, "top_deck_revealed")
             player.top_deck_revealed = False
-            hand_zone.get_piles()[0].add_bundle(b)
-            player.hand.append(b)  # keep list synced
-            print(f"{player.get_name()} draws {b.primary_card.name}.")
+            self.events.emit(EventType.DRAW, player, drawn, amount=len(drawn))
             self.update_top_deck_reveal(player)
-        if amount > len(player.deck):
-            print(f"{player.get_name()} has no more cards to draw.")
+        if len(drawn) < amount:
+            self.events.emit(EventType.DECK_EMPTY, player)
         return True
 
     def create_token(self, player: Player, name: str, attack: int, health: int):
@@ -258,172 +445,180 @@ class Game:
         token_card = Card(name, "Token Back", cost=0, card_type="unit", attack=attack, health=health)
         token_bundle = CardBundle(token_card, owner_id=player.get_player_id())
         # Simplified: put directly into player's discard pile or future arena logic
-        player.discard_pile.append(token_bundle)
-        print(f"{player.get_name()} creates a {name} token.")
+        player.get_board().move_bundle(token_bundle, "Discard")
+        self.events.emit(EventType.TOKEN_CREATED, player, token_bundle, target=name)
         return token_bundle
 
     def exile_card(self, player: Player, bundle: CardBundle):
-        exile_zone = player.get_board().find_zone("Exile")
-        moved = False
-        for z in player.get_board().get_zones():
-            for p in z.get_piles():
-                if bundle in p.get_bundles():
-                    player.get_board().move_to_zone(bundle, z, exile_zone)
-                    player.exile_pile.append(bundle)  # keep list synced
-                    moved = True
-                    break
-            if moved: break
-        if not moved:
-            for coll_name, coll in [
-                ("hand", player.hand),
-                ("deck", player.deck),
-                ("discard_pile", player.discard_pile),
-                ("resources", player.resources),
-            ]:
-                if bundle in coll:
-                    coll.remove(bundle)
-                    exile_zone.get_piles()[0].add_bundle(bundle)
-                    player.exile_pile.append(bundle)  # keep list synced
-                    moved = True
-                    break
-        print(f"{bundle.primary_card.name} is exiled from {player.get_name()}.")
+        player.get_board().move_bundle(bundle, "Exile")
+        self.events.emit(EventType.EXILE, player, bundle)
         return True
 
     def return_to_hand(self, bundle: CardBundle):
         owner = self.get_player_by_id(bundle.owner_id)
         if owner:
-            if bundle in owner.discard_pile:
-                owner.discard_pile.remove(bundle)
-            owner.hand.append(bundle)
-            print(f"{bundle.primary_card.name} is returned to {owner.get_name()}'s hand.")
+            owner.get_board().move_bundle(bundle, "Hand")
+            self.events.emit(EventType.RETURN_TO_HAND, owner, bundle)
 
     def destroy_unit(self, bundle: CardBundle):
         owner = self.get_player_by_id(bundle.owner_id)
-        for z in owner.get_board().get_zones():
-            if z.get_name() in ("Ground Arena", "Space Arena"):
-                for p in z.get_piles():
-                    if bundle in p.get_bundles():
-                        discard_zone = owner.get_board().find_zone("Discard")
-                        owner.get_board().move_to_zone(bundle, z, discard_zone)
-                        owner.discard_pile.append(bundle)  # keep list synced
-                        print(f"{bundle.primary_card.name} is destroyed and moved to discard.")
-                        return True
+        z = owner.get_board().find_bundle_zone(bundle)
+        if z is not None and z.get_name() in ("Ground Arena", "Space Arena"):
+            owner.get_board().move_bundle(bundle, "Discard")
+            self.events.emit(EventType.DESTROY, owner, bundle)
+            return True
         return False
 
     def mill_cards(self, player: Player, amount: int):
-        deck_zone = player.get_board().find_zone("Deck")
-        discard_zone = player.get_board().find_zone("Discard")
-        for _ in range(min(amount, len(player.deck))):
-            bundle = player.deck.pop(0)
+        milled = player.get_board().move_top_of_deck(amount, "Discard")
+        if milled:
+            self.journal.save(player, "top_deck_revealed")
             player.top_deck_revealed = False
-            discard_zone.get_piles()[0].add_bundle(bundle)
-            player.discard_pile.append(bundle)  # keep list synced
-            print(f"{player.get_name()} mills {bundle.primary_card.name}.")
+            self.events.emit(EventType.MILL, player, milled, amount=len(milled))
             self.update_top_deck_reveal(player)
         return True
 
+    def reveal_top(self, player: Player, amount: int = 1) -> list[CardBundle]:
+        """Reveal the top cards of a player's deck without moving them."""
+        revealed = player.get_board().deck_pile().peek_top(amount)
+        if revealed:
+            self.events.emit(EventType.REVEAL, player, revealed, amount=len(revealed))
+        return revealed
+
     def resolve_combat(self, attacker: CardBundle, defender):
         """Resolve a combat between attacker (unit) and defender (unit or base)."""
-        atk_card = attacker.primary_card
         atk_power = attacker.effective_attack()
-        atk_health = attacker.effective_health()
 
         # Defender stats
         if isinstance(defender, CardBundle):  # defending unit
-            def_card = defender.primary_card
             def_power = defender.effective_attack()
-            def_health = defender.effective_health()
 
-            print(f"{atk_card.name} ({atk_power}/{atk_health}) fights {def_card.name} ({def_power}/{def_health})")
+            self.events.emit(EventType.COMBAT, subject=attacker, target=defender)
 
             # simultaneous damage
+            self.journal.save(defender, "damage")
+            self.journal.save(attacker, "damage")
             defender.damage += atk_power
             attacker.damage += def_power
 
-            print(f"{def_card.name} takes {atk_power} damage (total {defender.damage})")
-            print(f"{atk_card.name} takes {def_power} damage (total {attacker.damage})")
+            self.events.emit(EventType.COMBAT_DAMAGE, subject=defender, amount=atk_power)
+            self.events.emit(EventType.COMBAT_DAMAGE, subject=attacker, amount=def_power)
 
             # check defeat for each
             self._check_defeat(defender)
             self._check_defeat(attacker)
 
         elif isinstance(defender, Base):
-            print(f"{atk_card.name} ({atk_power}/{atk_health}) attacks {defender.name}!")
+            self.events.emit(EventType.COMBAT, subject=attacker, target=defender)
+            self.journal.save(defender, "health")
             defender.take_damage(atk_power)
-            print(f"{defender.name} takes {atk_power} damage (health={defender.health})")
+            self.events.emit(EventType.COMBAT_DAMAGE, subject=defender, amount=atk_power)
             self._check_base_defeat()
 
         else:
-            print("Invalid defender for combat.")
+            self.events.emit(EventType.INVALID_COMBAT, subject=attacker, target=defender)
+
+    def _check_defeat(self, bundle: CardBundle):
+        """Destroy a unit whose damage has reached its effective health."""
+        if bundle.damage >= bundle.effective_health():
+            return self.destroy_unit(bundle)
+        return False
+
+    def _check_base_defeat(self):
+        """End the game as soon as a player's base is defeated."""
+        if self.over:
+            return True
+        for p in self.players:
+            if p.base and p.base.is_defeated():
+                self.journal.save(self, "over")
+                self.journal.save(self, "winner")
+                self.over = True
+                self.winner = self.get_opponent(p)
+                self.events.emit(EventType.GAME_OVER, self.winner, p.base)
+                return True
+        return False
+
+    def spawn_rng(self) -> random.Random:
+        """Independent random stream seeded from game.rng (e.g. one per agent)."""
+        return random.Random(self.rng.getrandbits(64))
 
     def shuffle_deck(self, player: Player):
-        import random
-        random.shuffle(player.deck)
-        print(f"{player.get_name()} shuffles their deck.")
+        if self.journal.recording:
+            self.journal.record(self.rng.setstate, self.rng.getstate())
+        player.get_board().deck_pile().shuffle(self.rng)
+        self.events.emit(EventType.SHUFFLE, player)
 
     def reveal_card(self, bundle: CardBundle):
-        print(f"Revealed: {bundle.primary_card.name}")
+        self.events.emit(EventType.REVEAL, subject=bundle)
         return True
 
     def peek_card(self, player: Player, bundle: CardBundle):
         # grant temporary peek permission
-        bundle.peekers.add(player.get_player_id())
-        print(f"{player.get_name()} peeks at {bundle.primary_card.name}.")
+        self.journal.save(bundle, "peekers")
+        bundle.peekers = bundle.peekers | {player.get_player_id()}
+        self.events.emit(EventType.PEEK, player, bundle)
         return True
 
     def search_deck(self, player: Player, results: list[CardBundle]):
-        deck_zone = player.get_board().find_zone("Deck")
-        hand_zone = player.get_board().find_zone("Hand")
         for b in list(results):
             if b in player.deck:
-                player.deck.remove(b)
-                hand_zone.get_piles()[0].add_bundle(b)
-                player.hand.append(b)  # keep list synced
-                print(f"{player.get_name()} finds {b.primary_card.name}.")
+                player.get_board().move_bundle(b, "Hand")
+                self.events.emit(EventType.SEARCH_FIND, player, b)
                 self.update_top_deck_reveal(player)
         return True
 
     def mill_and_reveal(self, player: Player, amount: int = 1,
                         condition_fn=None, followup_fn=None):
-        for _ in range(min(amount, len(player.deck))):
-            card_bundle = player.deck.pop(0)
-            player.discard_pile.append(card_bundle)
-            print(f"{player.get_name()} mills {card_bundle.primary_card.name}.")
-            print(f"Revealed: {card_bundle.primary_card.name}")
+        milled = player.get_board().move_top_of_deck(amount, "Discard")
+        if milled:
+            self.events.emit(EventType.MILL, player, milled, amount=len(milled))
+            self.events.emit(EventType.REVEAL, player, milled, amount=len(milled))
 
+        for card_bundle in milled:
             # Conditional follow-up
             if condition_fn and condition_fn(card_bundle):
-                print(f"Condition met for {card_bundle.primary_card.name}.")
+                self.events.emit(EventType.CONDITION_MET, player, card_bundle)
                 if followup_fn:
                     followup_fn(self, player, card_bundle)
         return True
 
     def return_unit_to_hand(self, bundle: CardBundle):
         owner = self.get_player_by_id(bundle.owner_id)
-        for z in owner.get_board().get_zones():
-            if z.get_name() in ("Ground Arena", "Space Arena"):
-                for p in z.get_piles():
-                    if bundle in p.get_bundles():
-                        hand_zone = owner.get_board().find_zone("Hand")
-                        owner.get_board().move_to_zone(bundle, z, hand_zone)
-                        owner.hand.append(bundle)  # keep list synced
-                        bundle.damage = 0
-                        bundle.exhausted = False
-                        print(f"{bundle.primary_card.name} is returned to {owner.get_name()}'s hand.")
-                        return True
+        z = owner.get_board().find_bundle_zone(bundle)
+        if z is not None and z.get_name() in ("Ground Arena", "Space Arena"):
+            owner.get_board().move_bundle(bundle, "Hand")
+            self.journal.save(bundle, "damage")
+            bundle.damage = 0
+            self.ready(bundle)
+            self.events.emit(EventType.RETURN_TO_HAND, owner, bundle)
+            return True
         return False
 
+    def attach_upgrade(self, target_bundle: CardBundle, upgrade_bundle: CardBundle):
+        """
+        Attach an upgrade to a unit: it leaves its pile, and its printed
+        stats and keywords apply to the unit in the upgrade layer.
+        """
+        owner = self.get_player_by_id(upgrade_bundle.owner_id)
+        loc = owner.get_board().locate(upgrade_bundle) if owner else None
+        if loc is not None:
+            loc[1].remove_bundle(upgrade_bundle)
+        self.journal.save(target_bundle, "upgrades")
+        target_bundle.upgrades = target_bundle.upgrades + [upgrade_bundle]
+        card = upgrade_bundle.primary_card
+        self.add_modifier(target_bundle, Modifier(LAYER_UPGRADE, card.attack or 0, card.health or 0,
+                                                  card.keywords, source=upgrade_bundle))
+        self.events.emit(EventType.ATTACH_UPGRADE, owner, upgrade_bundle, target=target_bundle)
+        return True
+
     def detach_upgrade(self, target_bundle: CardBundle, upgrade_bundle: CardBundle):
         if upgrade_bundle in target_bundle.upgrades:
-            target_bundle.upgrades.remove(upgrade_bundle)
+            self.journal.save(target_bundle, "upgrades")
+            target_bundle.upgrades = [u for u in target_bundle.upgrades if u is not upgrade_bundle]
+            self.remove_modifiers_from(target_bundle, upgrade_bundle)
             owner = self.get_player_by_id(upgrade_bundle.owner_id)
-            discard_zone = owner.get_board().find_zone("Discard")
-            discard_zone.get_piles()[0].add_bundle(upgrade_bundle)
-            owner.discard_pile.append(upgrade_bundle)  # keep list synced
-            print(
-                f"{upgrade_bundle.primary_card.name} detached from "
-                f"{target_bundle.primary_card.name} and discarded."
-            )
+            owner.get_board().move_bundle(upgrade_bundle, "Discard")
+            self.events.emit(EventType.DETACH_UPGRADE, owner, upgrade_bundle, target=target_bundle)
             return True
         return False
 
@@ -473,12 +668,13 @@ class Game:
         """
         if not player.deck:
             if player.top_deck_revealed:
+                self.journal.save(player, "top_deck_revealed")
                 player.top_deck_revealed = False
-                print(f"{player.get_name()}'s deck is empty, top card reveal cleared.")
+                self.events.emit(EventType.REVEAL_CLEARED, player)
             return
 
         if player.top_deck_revealed:
-            print(f"{player.get_name()}'s top card remains revealed: {player.deck[0].primary_card.name}")
+            self.events.emit(EventType.TOP_REVEALED, player, player.deck[0])
 
     def remove_resource(self, player: Player, bundle: CardBundle, to_zone_name: str = "Discard"):
         """
@@ -486,26 +682,17 @@ class Game:
         By default, resources go to discard, but this can be changed with to_zone_name.
         """
         if bundle not in player.resources:
-            print(f"{bundle.primary_card.name} is not in {player.get_name()}'s resources.")
+            self.events.emit(EventType.RESOURCE_NOT_FOUND, player, bundle)
             return False
 
-        res_zone = player.get_board().find_zone("Resources")
         target_zone = player.get_board().find_zone(to_zone_name)
 
-        if res_zone and target_zone:
-            player.resources.remove(bundle)             # keep list synced
-            player.get_board().move_to_zone(bundle, res_zone, target_zone)
-
-            # Update target list for discard/exile
-            if to_zone_name.lower() == "discard":
-                player.discard_pile.append(bundle)
-            elif to_zone_name.lower() == "exile":
-                player.exile_pile.append(bundle)
-
-            print(f"{player.get_name()} removes resource {bundle.primary_card.name} → {to_zone_name}.")
+        if target_zone:
+            player.get_board().move_bundle(bundle, target_zone)
+            self.events.emit(EventType.RESOURCE_REMOVED, player, bundle, target=to_zone_name)
             return True
 
-        print(f"Failed to move {bundle.primary_card.name} from resources to {to_zone_name}.")
+        self.events.emit(EventType.RESOURCE_REMOVE_FAILED, player, bundle, target=to_zone_name)
         return False
 
     def validate_decks(self):
@@ -0,0 +1,172 @@
+# game_log.py
+"""
+Compact binary record of one game, for auditing, training data and replay
+(see replay.py).
+
+A log holds only what is needed to re-run the game exactly: the game seed,
+both decklists (card ids in deck order) and every agent decision, i.e. the
+index of the chosen action in RulesEngine.get_legal_actions() plus the
+index of each target in get_attack_targets() for its requirements, or a
+pass. Shuffles and draws follow from the seed. A typical game is a few
+hundred bytes.
+
+Layout (little endian): header "<6sHQHB" (magic, version, seed,
+max_rounds, player count); per player a varint entry count then (varint
+id length, id bytes, varint count) per decklist entry; varint decision
+count and the decisions; trailer varints winner, rounds. A decision is
+varint action index + 1 (0 = pass); for an action, a varint requirement
+count, then per requirement a varint target count and the target indexes.
+"""
+import struct
+
+LOG_MAGIC = b"SWURPL"
+LOG_VERSION = 1
+LOG_SUFFIX = ".swurpl"
+_HEADER = struct.Struct("<6sHQHB")
+
+
+class GameLog:
+    __slots__ = ("seed", "decklists", "max_rounds", "decisions", "winner", "rounds")
+
+    def __init__(self, seed: int, decklists: list[dict[str, int]], max_rounds: int):
+        self.seed = seed
+        self.decklists = decklists
+        self.max_rounds = max_rounds
+        # None for a pass, else (action index, ((target index, ...) per requirement))
+        self.decisions: list[tuple | None] = []
+        self.winner = 0
+        self.rounds = 0
+
+    def __len__(self):
+        return len(self.decisions)
+
+    def count_actions(self) -> int:
+        return sum(1 for d in self.decisions if d is not None)
+
+    # --- Recording ---
+
+    def record_pass(self):
+        self.decisions.append(None)
+
+    def record_action(self, game, player, legal: list, action, targets: dict):
+        """Record action (one of legal) with its targets; call before executing it."""
+        indexes = []
+        for req in action.get_requirements():
+            candidates = game.rules.get_attack_targets(game, player, req)
+            indexes.append(tuple(_index_of(candidates, t) for t in targets.get(req, ())))
+        self.decisions.append((_index_of(legal, action), tuple(indexes)))
+
+    def finish(self, game):
+        self.winner = game.winner.get_player_id() if game.winner else 0
+        self.rounds = game.turn_manager.round_number
+
+    # --- Encoding ---
+
+    def to_bytes(self) -> bytes:
+        out = bytearray(_HEADER.pack(LOG_MAGIC, LOG_VERSION, self.seed, self.max_rounds, len(self.decklists)))
+        for decklist in self.decklists:
+            _put(out, len(decklist))
+            for card_id, count in decklist.items():
+                raw = card_id.encode("utf-8")
+                _put(out, len(raw))
+                out += raw
+                _put(out, count)
+        _put(out, len(self.decisions))
+        for decision in self.decisions:
+            if decision is None:
+                out.append(0)
+                continue
+            index, requirements = decision
+            _put(out, index + 1)
+            _put(out, len(requirements))
+            for indexes in requirements:
+                _put(out, len(indexes))
+                for i in indexes:
+                    _put(out, i)
+        _put(out, self.winner)
+        _put(out, self.rounds)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "GameLog":
+        """Parse a log; raises ValueError if data is not a complete log."""
+        try:
+            return cls._parse(data)
+        except (IndexError, struct.error, UnicodeDecodeError) as err:
+            raise ValueError("Truncated or corrupt game log") from err
+
+    @classmethod
+    def _parse(cls, data: bytes) -> "GameLog":
+        magic, version, seed, max_rounds, n_players = _HEADER.unpack_from(data)
+        if magic != LOG_MAGIC or version != LOG_VERSION:
+            raise ValueError(f"Not a version {LOG_VERSION} game log")
+        reader = _Reader(data, _HEADER.size)
+        get = reader.get
+        decklists = []
+        for _ in range(n_players):
+            decklist = {}
+            for _ in range(get()):
+                card_id = reader.take(get()).decode("utf-8")
+                decklist[card_id] = get()
+            decklists.append(decklist)
+        log = cls(seed, decklists, max_rounds)
+        decisions = log.decisions
+        for _ in range(get()):
+            index = get()
+            if index == 0:
+                decisions.append(None)
+                continue
+            requirements = tuple(tuple(get() for _ in range(get())) for _ in range(get()))
+            decisions.append((index - 1, requirements))
+        log.winner = get()
+        log.rounds = get()
+        return log
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "GameLog":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def _index_of(items: list, item) -> int:
+    for i, candidate in enumerate(items):
+        if candidate is item:
+            return i
+    raise ValueError(f"{item!r} is not among the offered choices; it cannot be logged")
+
+
+def _put(out: bytearray, value: int):
+    """Append value as an unsigned LEB128 varint."""
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class _Reader:
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: bytes, pos: int):
+        self.data = data
+        self.pos = pos
+
+    def get(self) -> int:
+        data, pos = self.data, self.pos
+        value = shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                self.pos = pos
+                return value
+            shift += 7
+
+    def take(self, n: int) -> bytes:
+        start = self.pos
+        self.pos = start + n
+        return self.data[start:self.pos]
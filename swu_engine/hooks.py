@@ -1,4 +1,5 @@
 # hooks.py
+from swu_engine.events import EventType
 
 # --- Hook function definitions ---
 
@@ -6,8 +7,8 @@ def refresh_resources(turn_manager, game, *_):
     """Ready all exhausted resources at the start of each round."""
     for player in game.players:
         for res in player.resources:
-            res.exhausted = False
-    print("All resources refreshed.")
+            game.ready(res)
+    game.events.emit(EventType.RESOURCES_REFRESHED)
 
 
 def ready_all_units(turn_manager, game, *_):
@@ -17,22 +18,20 @@ def ready_all_units(turn_manager, game, *_):
             if zone.get_name() in ("Ground Arena", "Space Arena"):
                 for pile in zone.get_piles():
                     for bundle in pile.get_bundles():
-                        bundle.exhausted = False
-    print("All units readied.")
-
-
-def clean_up_delayed_effects(turn_manager, game, *_):
-    """Clear delayed effects at the end of the round."""
-    if hasattr(game, "delayed_effects"):
-        game.delayed_effects.clear()
-        print("Delayed effects cleared.")
+                        game.ready(bundle)
+    game.events.emit(EventType.UNITS_READIED)
 
 
 def draw_at_start_of_turn(turn_manager, player, game, *_):
     """Each player draws 1 card at the start of their turn."""
     if hasattr(game, "draw_cards"):
         game.draw_cards(player, 1)
-        print(f"{player.get_name()} draws 1 card at the start of their turn.")
+        game.events.emit(EventType.TURN_DRAW, player)
+
+def reset_turn_limits(turn_manager, player, game, *_):
+    """Reset once-per-turn limits (e.g. resourcing a card) for the new active player."""
+    game.journal.save(player, "resources_played_this_turn")
+    player.resources_played_this_turn = 0
 
 def ready_leaders(turn_manager, game, *_):
     """At the start of each round, ready all leaders."""
@@ -41,8 +40,8 @@ def ready_leaders(turn_manager, game, *_):
         if leader_zone:
             for pile in leader_zone.get_piles():
                 for bundle in pile.get_bundles():
-                    bundle.exhausted = False
-                    print(f"{player.get_name()}'s leader is ready.")
+                    game.ready(bundle)
+                    game.events.emit(EventType.LEADER_READIED, player, bundle)
 
 def mulligan(turn_manager, game, *_):
     """Round 1: each player may mulligan (redraw hand)."""
@@ -51,25 +50,25 @@ def mulligan(turn_manager, game, *_):
             if hasattr(player, "hand") and player.hand:
                 count = len(player.hand)
                 while player.hand:
-                    game.move_to_discard(player, player.hand.pop(0))
+                    game.move_to_discard(player, player.hand[0])
                 game.draw_cards(player, count)
-                print(f"{player.get_name()} mulligans and redraws {count} cards.")
+                game.events.emit(EventType.MULLIGAN, player, amount=count)
 
 def discard_at_end_of_turn(turn_manager, player, game, *_):
     """Each player discards 1 card at the end of their turn if they have any."""
     if hasattr(player, "hand") and player.hand:
-        discarded = player.hand.pop(0)
+        discarded = player.hand[0]
         game.move_to_discard(player, discarded)
-        print(f"{player.get_name()} discards 1 card at the end of their turn.")
+        game.events.emit(EventType.END_TURN_DISCARD, player, discarded)
 
 
 def enforce_hand_limit(turn_manager, player, game, *_):
     """At end of turn, enforce a maximum hand size of 7 cards."""
     limit = 7
     while len(player.hand) > limit:
-        discarded = player.hand.pop(0)  # discard the first card
+        discarded = player.hand[0]  # discard the first card
         game.move_to_discard(player, discarded)
-        print(f"{player.get_name()} discards down to {limit} card limit.")
+        game.events.emit(EventType.HAND_LIMIT_DISCARD, player, discarded, amount=limit)
 
 # --- Hook registry ---
 
@@ -84,14 +83,14 @@ HOOK_REGISTRY.update({
         "fn": ready_all_units,
         "timing": "start_of_round",
     },
-    "clean_up_delayed_effects": {
-        "fn": clean_up_delayed_effects,
-        "timing": "end_of_round",
-    },
     "draw_at_start_of_turn": {
         "fn": draw_at_start_of_turn,
         "timing": "start_of_turn",
     },
+    "reset_turn_limits": {
+        "fn": reset_turn_limits,
+        "timing": "start_of_turn",
+    },
     "discard_at_end_of_turn": {
         "fn": discard_at_end_of_turn,
         "timing": "end_of_turn",
@@ -114,10 +113,70 @@ HOOK_REGISTRY.update({
 # --- Hook helpers ---
 
 def get_hooks_by_timing(timing: str):
-    """Return all registered hook functions for a given timing."""
-    return [entry["fn"] for entry in HOOK_REGISTRY.values() if entry["timing"] == timing]
-
-
-def register(name: str, fn, timing: str):
-    """Register a new hook dynamically."""
-    HOOK_REGISTRY[name] = {"fn": fn, "timing": timing}
+    """Return all registered default hook functions for a given timing (games use game.hooks)."""
+    return list(HookRegistry(HOOK_REGISTRY).get(timing))
+
+
+def register(name: str, fn, timing: str, priority: int = 0):
+    """Register a new default hook; games created afterwards pick it up."""
+    HOOK_REGISTRY[name] = {"fn": fn, "timing": timing, "priority": priority}
+
+
+class HookRegistry:
+    """
+    Hook set of one game. Hooks are compiled into a timing -> tuple of
+    functions table whenever the set changes, so TurnManager only does a
+    dict lookup per timing. Lower priority runs first; equal priorities run
+    in registration order. Each game has its own registry, so games in one
+    process can run different rule sets.
+    """
+
+    def __init__(self, entries: dict = None):
+        self.entries: dict[str, dict] = {}
+        self.compiled: dict[str, tuple] = {}
+        for name, entry in (entries or {}).items():
+            self.entries[name] = {"fn": entry["fn"], "timing": entry["timing"],
+                                  "priority": entry.get("priority", 0), "enabled": entry.get("enabled", True)}
+        self._compile()
+
+    def register(self, name: str, fn, timing: str, priority: int = 0, enabled: bool = True):
+        """Add or replace a hook (a replaced hook keeps its registration order)."""
+        self.entries[name] = {"fn": fn, "timing": timing, "priority": priority, "enabled": enabled}
+        self._compile()
+
+    def unregister(self, name: str):
+        if self.entries.pop(name, None) is not None:
+            self._compile()
+
+    def enable(self, name: str):
+        self.set_enabled(name, True)
+
+    def disable(self, name: str):
+        self.set_enabled(name, False)
+
+    def set_enabled(self, name: str, enabled: bool):
+        entry = self.entries[name]
+        if entry["enabled"] != enabled:
+            entry["enabled"] = enabled
+            self._compile()
+
+    def is_enabled(self, name: str) -> bool:
+        return name in self.entries and self.entries[name]["enabled"]
+
+    def get(self, timing: str) -> tuple:
+        """Enabled hook functions for timing, in run order."""
+        return self.compiled.get(timing, ())
+
+    def copy(self) -> "HookRegistry":
+        new = HookRegistry.__new__(HookRegistry)
+        new.entries = {name: dict(entry) for name, entry in self.entries.items()}
+        new.compiled = self.compiled   # tuples are immutable; replaced on the next change
+        return new
+
+    def _compile(self):
+        by_timing: dict[str, list] = {}
+        for entry in self.entries.values():
+            if entry["enabled"]:
+                by_timing.setdefault(entry["timing"], []).append(entry)
+        self.compiled = {timing: tuple(e["fn"] for e in sorted(entries, key=lambda e: e["priority"]))
+                         for timing, entries in by_timing.items()}
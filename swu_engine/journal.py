@@ -0,0 +1,84 @@
+# journal.py
+"""
+Undo journal for game search.
+
+While at least one checkpoint is open, primitive mutations (pile moves,
+damage, healing, exhaust/ready, buffs, temporary keywords, turn position,
+...) append an undo entry. rollback(cp) pops and applies entries back to
+the checkpoint, so trying an action and undoing it costs only what the
+action changed. With no checkpoint open, nothing is recorded.
+
+    cp = game.checkpoint()
+    action.execute(targets)
+    ...
+    game.rollback(cp)      # or game.release(cp) to keep the changes
+"""
+
+
+class Journal:
+    __slots__ = ("entries", "marks", "recording", "hasher", "version", "epoch")
+
+    def __init__(self):
+        self.entries: list[tuple] = []   # (undo_fn, args)
+        self.marks: list[int] = []       # open checkpoints, outermost first (positions in entries)
+        self.recording = False
+        self.hasher = None               # StateHasher of the game, once Game.state_hash() is used
+        self.version = 0                 # bumped by every mutation (and rollback)
+        self.epoch = 0                   # bumped by rollback and Game.restore(): drop all cached state
+
+    def touch(self, obj):
+        """obj is about to change in a way save() does not cover (pile moves, turn position, keywords)."""
+        self.version += 1
+        if self.hasher is not None:
+            self.hasher.touch(obj)
+
+    def bump(self):
+        """Something changed that does not affect the state hash (pile order)."""
+        self.version += 1
+
+    def checkpoint(self) -> int:
+        """Open a checkpoint; the returned token is its nesting depth."""
+        cp = len(self.marks)
+        self.marks.append(len(self.entries))
+        self.recording = True
+        return cp
+
+    def record(self, undo_fn, *args):
+        """Remember how to undo a mutation that is about to happen."""
+        if self.recording:
+            self.entries.append((undo_fn, args))
+
+    def save(self, obj, attr: str):
+        """Remember obj.attr's current value; call before changing it."""
+        self.version += 1
+        if self.hasher is not None:
+            self.hasher.touch(obj)
+        if self.recording:
+            self.entries.append((setattr, (obj, attr, getattr(obj, attr))))
+
+    def rollback(self, cp: int):
+        """Undo everything recorded since checkpoint cp and close it (and any nested ones)."""
+        entries = self.entries
+        start = self.marks[cp]
+        self.recording = False   # undo functions may go through journaled primitives
+        hasher = self.hasher
+        while len(entries) > start:
+            undo_fn, args = entries.pop()
+            if undo_fn is setattr and hasher is not None:
+                hasher.touch(args[0])
+            undo_fn(*args)
+        self.recording = True
+        self.version += 1
+        self.epoch += 1
+        self._close(cp)
+
+    def release(self, cp: int):
+        """Keep the changes made since cp and close it; outer checkpoints can still roll them back."""
+        self._close(cp)
+
+    def _close(self, cp: int):
+        marks = self.marks
+        del marks[cp:]
+        if not marks:
+            self.entries.clear()
+            self.recording = False
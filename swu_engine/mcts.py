@@ -0,0 +1,290 @@
+# mcts.py
+"""
+Monte Carlo tree search agent for the headless turn loop.
+
+MCTSAgent plugs into sim.play_game like any other Agent: when asked for a
+move it searches the integer action space (action_space.py) and answers
+with the matching Action from RulesEngine.get_legal_actions().
+
+Hidden information is handled by determinization: every simulation starts
+from a clone of the game in which the opponent's unseen hand cards are
+shuffled back into their deck and redrawn, and both decks are reshuffled
+(the tree is shared across determinizations, information-set style, so a
+node is "play hand slot 2", not a specific card). Leaves are scored with a
+random_playout() to the end of the game. Given a TranspositionTable
+(zobrist.py), leaves reached again through another move order reuse the
+rollout results stored for their state hash instead of playing out again.
+
+Each decision gets a wall-clock budget. With workers > 1 the search is root
+parallel: forked worker processes search independent determinizations until
+the deadline and the root visit counts are merged; the most visited move is
+played. Per-move statistics (simulations, sims/s, tree nodes) are kept in
+agent.history:
+
+    agent = MCTSAgent(rng=random.Random(1), time_budget=0.2, workers=4)
+    play_game(game, {1: agent, 2: RandomAgent()})
+    agent.history[-1]["sims_per_sec"]
+
+    python -m swu_engine.mcts --budget 0.2 --workers 4
+"""
+import argparse
+import math
+import multiprocessing as mp
+import random
+import time
+
+from swu_engine.action_space import ACTION_SPACE, PASS
+from swu_engine.agents import Agent, RandomAgent
+from swu_engine.playout import DECISION_PHASES, random_playout
+from swu_engine.sim import DEFAULT_CARDS, MAX_ROUNDS, derive_seed, load_card_db, new_game, play_game
+from swu_engine.zobrist import TranspositionTable, shared_table
+
+EXPLORATION = 1.4
+TABLE_MIN_PLAYOUTS = 4   # rollouts stored for a position before the table answers for it
+
+
+class _Node:
+    """Tree node: the move into it was made by player_id. avail counts how often it was legal."""
+    __slots__ = ("player_id", "children", "visits", "value", "avail")
+
+    def __init__(self, player_id: int):
+        self.player_id = player_id
+        self.children = {}
+        self.visits = 0
+        self.value = 0.0
+        self.avail = 1
+
+
+def determinize(game, player_id: int, rng: random.Random):
+    """
+    Clone of game consistent with what player_id knows: the opponent's hand
+    cards player_id has not peeked at are redrawn from their shuffled deck,
+    both decks are reshuffled, and the clone's rng is reseeded from rng.
+    """
+    state = game.clone()
+    state.rng.seed(rng.getrandbits(64))
+    for p in state.players:
+        board = p.get_board()
+        hidden = []
+        if p.get_player_id() != player_id:
+            hidden = [b for b in p.hand if not b.is_peeked_by(player_id)]
+            for bundle in hidden:
+                board.move_bundle(bundle, "Deck")
+        board.deck_pile().shuffle(rng)
+        if hidden:
+            board.move_top_of_deck(len(hidden), "Hand")
+    return state
+
+
+def _advance(game, max_rounds: int, action_space) -> list[int] | None:
+    """Step phases until someone has a real choice; their legal ids, or None if the game is done."""
+    tm = game.turn_manager
+    while not game.over and tm.round_number <= max_rounds:
+        if tm.get_current_phase().name in DECISION_PHASES:
+            legal = action_space.legal_ids(game)
+            if len(legal) > 1:
+                return legal
+        tm.next_phase()
+    return None
+
+
+def search(game, player_id: int, rng: random.Random, deadline: float, max_simulations: int = None,
+           exploration: float = EXPLORATION, max_rounds: int = MAX_ROUNDS, action_space=ACTION_SPACE,
+           table: TranspositionTable = None):
+    """
+    Search from game (player_id to move) until the perf_counter() deadline or
+    max_simulations. Returns ({root action id: (visits, value)}, simulations,
+    tree nodes). Values are wins for the player making the move (draws 0.5).
+    table: leaf results by state hash, as (playouts, wins of the first player).
+    """
+    if table is not None:
+        game = game.clone()
+        game.state_hash()   # determinizations inherit incremental hashing from here
+    first_id = game.players[0].get_player_id()
+    root = _Node(0)
+    nodes = 1
+    sims = 0
+    legal_ids, apply = action_space.legal_ids, action_space.apply
+    while sims == 0 or (time.perf_counter() < deadline and (max_simulations is None or sims < max_simulations)):
+        state = determinize(game, player_id, rng)
+        tm = state.turn_manager
+        node, path = root, []
+        legal = legal_ids(state)
+
+        # selection / expansion
+        while legal is not None:
+            mover = tm.get_current_player().get_player_id()
+            children = node.children
+            untried = [a for a in legal if a not in children]
+            for a in legal:
+                child = children.get(a)
+                if child is not None:
+                    child.avail += 1
+            if untried:
+                action_id = untried[rng.randrange(len(untried))]
+                node = children[action_id] = _Node(mover)
+                nodes += 1
+            else:
+                action_id, node = max(((a, children[a]) for a in legal), key=lambda item: (
+                    item[1].value / item[1].visits
+                    + exploration * math.sqrt(math.log(item[1].avail) / item[1].visits)))
+            path.append(node)
+            if action_id == PASS:
+                tm.next_phase()
+            else:
+                apply(state, action_id)
+            legal = _advance(state, max_rounds, action_space)
+            if untried:
+                break
+
+        # rollout (or table lookup) and backpropagation
+        key = entry = None
+        if table is not None and legal is not None:
+            key = state.state_hash()
+            entry = table.get(key)
+        if entry is not None and entry[0] >= TABLE_MIN_PLAYOUTS:
+            result = entry[1] / entry[0]
+        else:
+            if legal is not None:
+                random_playout(state, rng, max_rounds, action_space)
+            winner = state.winner.get_player_id() if state.winner is not None else None
+            result = 0.5 if winner is None else float(winner == first_id)
+            if key is not None:
+                playouts, wins = entry or (0, 0.0)
+                table.store(key, (playouts + 1, wins + result), playouts + 1)
+        for n in path:
+            n.visits += 1
+            n.value += result if n.player_id == first_id else 1.0 - result
+        sims += 1
+
+    return {a: (c.visits, c.value) for a, c in root.children.items()}, sims, nodes
+
+
+# Root of the current parallel search; forked workers inherit it instead of unpickling a Game
+_root = None
+
+
+def _search_worker(seed: int):
+    game, player_id, kwargs = _root
+    return search(game, player_id, random.Random(seed), **kwargs)
+
+
+class MCTSAgent(Agent):
+    """
+    Determinized UCT under a per-decision time budget (seconds). workers > 1
+    adds that many forked root-parallel searchers (fork start method only;
+    elsewhere the search stays in process). history holds one stats dict
+    per searched move. table: a TranspositionTable for leaf results, e.g.
+    zobrist.shared_table() to share one between agents in this process.
+    """
+
+    def __init__(self, rng: random.Random = None, time_budget: float = 0.5, workers: int = 1,
+                 max_simulations: int = None, exploration: float = EXPLORATION, max_rounds: int = MAX_ROUNDS,
+                 action_space=ACTION_SPACE, table: TranspositionTable = None):
+        super().__init__(rng)
+        self.time_budget = time_budget
+        self.workers = workers if "fork" in mp.get_all_start_methods() else 1
+        self.max_simulations = max_simulations
+        self.exploration = exploration
+        self.max_rounds = max_rounds
+        self.action_space = action_space
+        self.table = table
+        self.history = []
+        self._chosen = (None, None)
+
+    def choose_action(self, game, player, actions):
+        if not actions or len(self.action_space.legal_ids(game)) == 1:
+            return None
+        action_id = self.search(game, player)
+        action, targets = self.action_space.to_action(game, action_id, actions)
+        self._chosen = (action, targets)
+        return action
+
+    def choose_targets(self, game, player, action):
+        chosen, targets = self._chosen
+        self._chosen = (None, None)
+        if action is chosen and targets is not None:
+            return targets
+        return super().choose_targets(game, player, action)
+
+    def search(self, game, player) -> int:
+        """Best action id for player (to move in game); appends the move's stats to history."""
+        global _root
+        start = time.perf_counter()
+        kwargs = {"deadline": start + self.time_budget, "max_simulations": self.max_simulations,
+                  "exploration": self.exploration, "max_rounds": self.max_rounds,
+                  "action_space": self.action_space, "table": self.table}
+        player_id = player.get_player_id()
+        seeds = [self.rng.getrandbits(64) for _ in range(self.workers)]
+
+        if self.workers > 1:
+            _root = (game, player_id, kwargs)
+            try:
+                with mp.get_context("fork").Pool(self.workers - 1) as pool:
+                    pending = pool.map_async(_search_worker, seeds[1:])
+                    results = [_search_worker(seeds[0])] + pending.get()
+            finally:
+                _root = None
+        else:
+            results = [search(game, player_id, random.Random(seeds[0]), **kwargs)]
+
+        merged = {}
+        for children, _, _ in results:
+            for a, (visits, value) in children.items():
+                total = merged.get(a, (0, 0.0))
+                merged[a] = (total[0] + visits, total[1] + value)
+        action_id = max(merged, key=lambda a: (merged[a][0], merged[a][1]))
+
+        seconds = time.perf_counter() - start
+        sims = sum(r[1] for r in results)
+        self.history.append({
+            "round": game.turn_manager.round_number,
+            "action": action_id,
+            "simulations": sims,
+            "seconds": seconds,
+            "sims_per_sec": sims / seconds if seconds else 0.0,
+            "tree_nodes": sum(r[2] for r in results),
+            "workers": self.workers,
+            "win_rate": merged[action_id][1] / merged[action_id][0],
+        })
+        return action_id
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play MCTS against the random agent and report search statistics.")
+    parser.add_argument("--games", type=int, default=1)
+    parser.add_argument("--budget", type=float, default=0.2, help="seconds per decision")
+    parser.add_argument("--workers", type=int, default=1, help="root-parallel search processes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--table", action="store_true", help="share a transposition table for leaf results")
+    parser.add_argument("--cards", default=DEFAULT_CARDS)
+    args = parser.parse_args(argv)
+    table = shared_table() if args.table else None
+
+    db = load_card_db(args.cards)
+    wins = 0
+    moves = []
+    for i in range(args.games):
+        seed = derive_seed(args.seed, i)
+        game = new_game(db, seed)
+        agent = MCTSAgent(rng=random.Random(derive_seed(seed, 1)), time_budget=args.budget, workers=args.workers,
+                           table=table)
+        play_game(game, {1: agent, 2: RandomAgent(rng=random.Random(derive_seed(seed, 2)))})
+        wins += game.winner is not None and game.winner.get_player_id() == 1
+        moves += agent.history
+        for m in agent.history:
+            print(f"game {i} round {m['round']:>2}  action {m['action']:>3}  sims {m['simulations']:>5}  "
+                  f"{m['sims_per_sec']:8.0f} sims/s  tree {m['tree_nodes']:>6} nodes  p(win) {m['win_rate']:.2f}")
+
+    if moves:
+        sims = sum(m["simulations"] for m in moves)
+        seconds = sum(m["seconds"] for m in moves)
+        print(f"{len(moves)} searched moves, {args.workers} worker(s): {sims / seconds:.0f} sims/s, "
+              f"{sum(m['tree_nodes'] for m in moves) / len(moves):.0f} tree nodes/move on average")
+    if table is not None:
+        print(f"transposition table: {len(table)}/{table.capacity()} entries, {table.hits} hits, {table.misses} misses")
+    print(f"MCTS won {wins}/{args.games} games against random")
+
+
+if __name__ == "__main__":
+    main()
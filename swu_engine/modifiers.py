@@ -0,0 +1,100 @@
+# modifiers.py
+"""
+Layered continuous effects on units.
+
+A Modifier changes a bundle's attack, health and keywords while it is
+applied (Game.add_modifier / remove_modifier, or add_lasting_modifier for
+one that expires with a duration). A bundle's effective stats are its
+printed stats with its modifiers applied layer by layer, lowest layer
+first and in order of application within a layer:
+
+    LAYER_SET       "becomes X/Y": replaces the values computed so far
+    LAYER_UPGRADE   attached upgrades (Game.attach_upgrade)
+    LAYER_ABILITY   leader and unit abilities while their source is in play
+    LAYER_LASTING   lasting effects ("for this phase", "for this round", ...)
+
+followed by the bundle's attack_buff/health_buff and temporary keywords
+(Game.modify_stats / add_temp_keywords). Attack and health stop at 0.
+
+The result is cached on the bundle. Changing a bundle's modifiers, buffs
+or temporary keywords only clears that bundle's cache, and the next read
+recomputes it once; reads in between (combat, observations, agents) are a
+tuple lookup. An effect that covers many units (an aura) adds the same
+Modifier to each of them.
+"""
+from swu_engine.vocab import KEYWORDS
+
+LAYER_SET = 0
+LAYER_UPGRADE = 1
+LAYER_ABILITY = 2
+LAYER_LASTING = 3
+
+
+class Modifier:
+    """
+    One continuous effect. attack/health are added; set_attack/set_health
+    (for LAYER_SET) replace. keywords are granted, remove_keywords taken
+    away (printed ones included). source: the bundle or name it comes from.
+    """
+    __slots__ = ("layer", "attack", "health", "set_attack", "set_health", "keyword_mask", "remove_mask",
+                 "source")
+
+    def __init__(self, layer: int = LAYER_LASTING, attack: int = 0, health: int = 0, keywords=(),
+                 remove_keywords=(), set_attack: int = None, set_health: int = None, source=None):
+        self.layer = layer
+        self.attack = attack
+        self.health = health
+        self.set_attack = set_attack
+        self.set_health = set_health
+        self.keyword_mask = KEYWORDS.mask(keywords)
+        self.remove_mask = KEYWORDS.mask(remove_keywords)
+        self.source = source
+
+    def copy(self, source) -> 'Modifier':
+        """This modifier with another source (Game.clone)."""
+        new = Modifier.__new__(Modifier)
+        for slot in Modifier.__slots__:
+            setattr(new, slot, getattr(self, slot))
+        new.source = source
+        return new
+
+    def __repr__(self):
+        return (f"Modifier(layer={self.layer}, {self.attack:+d}/{self.health:+d}, "
+                f"keywords={KEYWORDS.names(self.keyword_mask)}, remove={KEYWORDS.names(self.remove_mask)})")
+
+
+def apply_layers(attack: int, health: int, keywords: int, modifiers: tuple) -> tuple[int, int, int]:
+    """(attack, health, keyword mask) after modifiers, which are already in layer order."""
+    for m in modifiers:
+        if m.set_attack is not None:
+            attack = m.set_attack
+        if m.set_health is not None:
+            health = m.set_health
+        attack += m.attack
+        health += m.health
+        keywords = (keywords | m.keyword_mask) & ~m.remove_mask
+    return attack, health, keywords
+
+
+def remap_modifiers(modifiers: tuple, memo: dict) -> tuple:
+    """
+    modifiers for a cloned game: one whose source was copied (memo: original
+    -> copy) is replaced by a copy pointing at the new source, recorded in
+    memo so bundles sharing a modifier keep sharing its copy.
+    """
+    out = []
+    for m in modifiers:
+        new = memo.get(m)
+        if new is None:
+            source = memo.get(m.source) if m.source is not None else None
+            new = memo[m] = m.copy(source) if source is not None else m
+        out.append(new)
+    return tuple(out)
+
+
+def insert_modifier(modifiers: tuple, modifier: Modifier) -> tuple:
+    """modifiers with modifier added after the others of its layer."""
+    i = len(modifiers)
+    while i and modifiers[i - 1].layer > modifier.layer:
+        i -= 1
+    return modifiers[:i] + (modifier,) + modifiers[i:]
@@ -0,0 +1,143 @@
+# observation.py
+"""
+Fixed-shape NumPy observations for learning agents.
+
+ObservationEncoder writes one game, as seen by one player, into a flat
+float32 vector of encoder.size values. The layout is egocentric: seat 0 is
+the viewing player and seat 1 the opponent. Hidden information (cards in
+the opponent's hand, face-down resources) is only filled in where
+RulesEngine.can_player_see() allows it; counts are always public.
+
+    encoder = ObservationEncoder(db)
+    obs = encoder.new_buffer(len(games))          # (n, encoder.size)
+    encoder.encode_batch(games, viewer_ids, obs)  # no per-game allocation
+    encoder.fields(obs)["units"][:, 1, 0]         # opponent ground units
+
+Blocks (see fields()):
+    globals  (GLOBAL_FEATURES,)                     round, phase index
+    players  (2, PLAYER_FEATURES)                   base hp, resources, ...
+    units    (2, 2, unit_slots, unit_features)      seat x arena x slot
+    hands    (2, hand_slots)                        card index or 0
+
+Card indexes are 1-based positions in the database's cards_by_id (0 = empty
+slot or hidden card, len(db) + 1 = a card not in the database).
+"""
+import numpy as np
+
+from swu_engine.vocab import KEYWORDS
+
+GLOBAL_FEATURES = ("round", "phase")
+PLAYER_FEATURES = ("base_hp", "resources", "ready_resources", "hand", "deck", "discard",
+                   "leader_ready", "active", "initiative")
+UNIT_FEATURES = ("card", "attack", "health", "damage", "exhausted")  # followed by keyword bits
+ARENAS = ("Ground Arena", "Space Arena")
+
+
+class ObservationEncoder:
+    def __init__(self, db, unit_slots: int = 10, hand_slots: int = 12, keyword_bits: int = 16):
+        self.card_index = {}
+        for i, card in enumerate(db.cards_by_id.values()):
+            self.card_index.setdefault(card, i + 1)   # interned printings share the first index
+        self.unknown_card = len(db.cards_by_id) + 1
+        self.unit_slots = unit_slots
+        self.hand_slots = hand_slots
+        self.keyword_bits = max(keyword_bits, len(KEYWORDS))
+        self.unit_features = len(UNIT_FEATURES) + self.keyword_bits
+
+        self.players_at = len(GLOBAL_FEATURES)
+        self.units_at = self.players_at + 2 * len(PLAYER_FEATURES)
+        self.hands_at = self.units_at + 2 * len(ARENAS) * unit_slots * self.unit_features
+        self.size = self.hands_at + 2 * hand_slots
+        self._blank = memoryview(np.zeros(self.size, dtype=np.float32))   # source for clearing a slot
+
+    def new_buffer(self, n: int = None) -> np.ndarray:
+        """Zeroed buffer for one observation, or n stacked ones."""
+        return np.zeros(self.size if n is None else (n, self.size), dtype=np.float32)
+
+    def fields(self, obs: np.ndarray) -> dict[str, np.ndarray]:
+        """Named views (no copies) into one observation or a stack of them."""
+        lead = obs.shape[:-1]
+        return {
+            "globals": obs[..., :self.players_at],
+            "players": obs[..., self.players_at:self.units_at].reshape(lead + (2, len(PLAYER_FEATURES))),
+            "units": obs[..., self.units_at:self.hands_at].reshape(
+                lead + (2, len(ARENAS), self.unit_slots, self.unit_features)),
+            "hands": obs[..., self.hands_at:].reshape(lead + (2, self.hand_slots)),
+        }
+
+    def encode(self, game, player, out: np.ndarray = None) -> np.ndarray:
+        """Observation of game for player, written into out (a new buffer if None)."""
+        if out is None:
+            out = self.new_buffer()
+        self._write(memoryview(out.reshape(-1)), 0, game, player)
+        return out
+
+    def encode_batch(self, games, viewer_ids, out: np.ndarray = None) -> np.ndarray:
+        """Stack observations of games[i] for player viewer_ids[i] into out (n, size)."""
+        if out is None:
+            out = self.new_buffer(len(games))
+        flat = memoryview(out.reshape(-1))
+        size = self.size
+        for i, (game, viewer_id) in enumerate(zip(games, viewer_ids)):
+            self._write(flat, i * size, game, game.get_player_by_id(viewer_id))
+        return out
+
+    def _write(self, buf: memoryview, at: int, game, viewer):
+        buf[at:at + self.size] = self._blank
+        tm = game.turn_manager
+        buf[at] = tm.round_number
+        buf[at + 1] = tm.phase_index
+
+        opponent = game.get_opponent(viewer)
+        current, initiative = tm.get_current_player(), tm.get_initiative_player()
+        can_see = game.rules.can_player_see
+        card_index, unknown = self.card_index, self.unknown_card
+        n_player, n_unit = len(PLAYER_FEATURES), self.unit_features
+        first_bit = len(UNIT_FEATURES)
+        keyword_mask = (1 << self.keyword_bits) - 1
+
+        for seat, p in enumerate((viewer, opponent)):
+            if p is None:
+                continue
+            i = at + self.players_at + seat * n_player
+            buf[i] = p.base.health if p.base else 0
+            buf[i + 1] = len(p.resources)
+            buf[i + 2] = sum(1 for r in p.resources if not r.exhausted)
+            buf[i + 3] = len(p.hand)
+            buf[i + 4] = len(p.deck)
+            buf[i + 5] = len(p.discard_pile)
+            buf[i + 6] = p.leader is not None and not p.leader.exhausted
+            buf[i + 7] = p is current
+            buf[i + 8] = p is initiative
+
+            board = p.get_board()
+            for a, arena in enumerate(ARENAS):
+                i = at + self.units_at + ((seat * len(ARENAS) + a) * self.unit_slots) * n_unit
+                end = i + self.unit_slots * n_unit
+                for pile in board.find_zone(arena).get_piles():
+                    for bundle in pile.get_bundles():
+                        if i >= end:
+                            break
+                        if can_see(viewer, bundle, game):
+                            card = bundle.primary_card
+                            buf[i] = card_index.get(card, unknown)
+                            buf[i + 1] = bundle.effective_attack()
+                            buf[i + 2] = bundle.effective_health()
+                            buf[i + 3] = bundle.damage
+                            buf[i + 4] = bundle.exhausted
+                            mask = bundle.effective_keywords() & keyword_mask
+                            while mask:
+                                low = mask & -mask
+                                buf[i + first_bit + low.bit_length() - 1] = 1
+                                mask ^= low
+                        i += n_unit
+
+            i = at + self.hands_at + seat * self.hand_slots
+            end = i + self.hand_slots
+            for bundle in p.hand:
+                if i >= end:
+                    break
+                if can_see(viewer, bundle, game):
+                    buf[i] = card_index.get(bundle.primary_card, unknown)
+                i += 1
+
@@ -1,4 +1,4 @@
-from swu_engine.board import Board
+from swu_engine.board import Board, PileView
 from swu_engine.cardbundle import CardBundle
 
 class Player:
@@ -8,15 +8,51 @@ class Player:
         self.isAI = isAI
         self.board = Board(board_id=f"board_{player_id}", owner_id=player_id)
 
-        self.deck: list[CardBundle] = []
-        self.hand: list[CardBundle] = []
-        self.resources: list[CardBundle] = []
-        self.discard_pile: list[CardBundle] = []
-        self.exile_pile: list[CardBundle] = []
+        # Read-only views onto the board piles, which are the only store.
+        # Move cards with Board.move_bundle() or the Game methods.
+        self.deck = self._view("Deck")
+        self.hand = self._view("Hand")
+        self.resources = self._view("Resources")
+        self.discard_pile = self._view("Discard")
+        self.exile_pile = self._view("Exile")
 
         self.leader = None
         self.base = None
         self.top_deck_revealed: bool = False
+        self.resources_played_this_turn: int = 0
+
+    def clone(self, memo: dict) -> 'Player':
+        """Copy of this player for a cloned game; bundles are copied through memo."""
+        player = Player.__new__(Player)
+        player.player_id = self.player_id
+        player.name = self.name
+        player.isAI = self.isAI
+        player.board = self.board.clone(memo)
+        player.deck = player._view("Deck")
+        player.hand = player._view("Hand")
+        player.resources = player._view("Resources")
+        player.discard_pile = player._view("Discard")
+        player.exile_pile = player._view("Exile")
+        if self.leader is not None and self.leader not in memo:
+            self.leader.copy(memo)
+        player.leader = memo[self.leader] if self.leader is not None else None
+        player.base = self.base.copy() if self.base is not None else None
+        player.top_deck_revealed = self.top_deck_revealed
+        player.resources_played_this_turn = self.resources_played_this_turn
+        return player
+
+    def get_state(self) -> tuple:
+        """Mutable player state (not the board), for Game.snapshot()."""
+        return (self.leader, self.base, self.base.health if self.base else None,
+                self.top_deck_revealed, self.resources_played_this_turn)
+
+    def set_state(self, state: tuple):
+        self.leader, self.base, base_health, self.top_deck_revealed, self.resources_played_this_turn = state
+        if self.base is not None:
+            self.base.health = base_health
+
+    def _view(self, zone_name: str) -> PileView:
+        return PileView(self.board.find_zone(zone_name).get_piles()[0])
 
     def get_board(self):
         return self.board
@@ -45,16 +81,29 @@ class Player:
         """
         raise NotImplementedError("Player.mulligan() not yet implemented")
 
+    def aspect_masks(self) -> tuple[int, int]:
+        """
+        Aspect icons provided by the leader and base, as (have, have_twice)
+        ASPECTS masks; have_twice covers cards that show an aspect twice.
+        """
+        have = have_twice = 0
+        for card in (self.leader.primary_card if self.leader else None,
+                     self.base.card if self.base else None):
+            if card is not None:
+                have_twice |= card.double_aspect_mask | (have & card.aspect_mask)
+                have |= card.aspect_mask
+        return have, have_twice
+
     # 🔹 keep these INSIDE the same class
     def can_pay_for(self, game, card) -> bool:
         ready_resources = [b for b in self.resources if not getattr(b, "exhausted", False)]
-        return len(ready_resources) >= getattr(card, "cost", 0)
+        return len(ready_resources) >= game.rules.apply_aspect_penalty(self, card)
 
     def pay_for(self, game, card) -> bool:
-        cost = getattr(card, "cost", 0)
+        cost = game.rules.apply_aspect_penalty(self, card)
         ready_resources = [b for b in self.resources if not getattr(b, "exhausted", False)]
         if len(ready_resources) < cost:
             return False
         for b in ready_resources[:cost]:
-            b.exhausted = True
+            game.exhaust(b)
         return True
@@ -0,0 +1,38 @@
+# playout.py
+"""
+Random playouts on the integer action space (action_space.py): the
+rollout policy for search agents. No Action objects, no event sinks.
+
+    game = new_game(db, seed)             # or a clone of a search node
+    actions = random_playout(game, random.Random(seed))
+"""
+import random
+
+from swu_engine.action_space import ACTION_SPACE, PASS
+from swu_engine.sim import MAX_ACTIONS_PER_PHASE, MAX_ROUNDS
+
+DECISION_PHASES = ("Main", "Combat")
+
+
+def random_playout(game, rng: random.Random, max_rounds: int = MAX_ROUNDS, action_space=ACTION_SPACE) -> int:
+    """
+    Play uniformly random legal moves (pass included) for both players until
+    the game ends or max_rounds is exceeded. Returns the number of actions.
+    """
+    tm = game.turn_manager
+    legal_ids = action_space.legal_ids
+    apply = action_space.apply
+    actions = 0
+    while not game.over and tm.round_number <= max_rounds:
+        if tm.get_current_phase().name in DECISION_PHASES:
+            for _ in range(MAX_ACTIONS_PER_PHASE):
+                legal = legal_ids(game)
+                action_id = legal[rng.randrange(len(legal))]
+                if action_id == PASS:
+                    break
+                apply(game, action_id)
+                actions += 1
+                if game.over:
+                    return actions
+        tm.next_phase()
+    return actions
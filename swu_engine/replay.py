@@ -0,0 +1,166 @@
+# replay.py
+"""
+Headless replay of GameLogs.
+
+    python -m swu_engine.replay logs/ --workers 8
+
+A Replayer rebuilds the game from the log's seed and decklists and drives
+sim.play_game() with a ReplayAgent that hands back the logged decisions, so
+a replay runs the same code path as the original game. Game clones are kept
+at phase boundaries every `checkpoint_every` actions; seek(n) resumes from
+the nearest one instead of replaying from the start.
+
+    replayer = Replayer(db, GameLog.load(path))
+    game = replayer.seek(120)       # state once 120 actions were played
+    game = replayer.run()           # final state; replayer.verify() checks it
+"""
+import argparse
+import bisect
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from swu_engine.agents import Agent
+from swu_engine.game_log import LOG_SUFFIX, GameLog
+from swu_engine.sim import DEFAULT_CARDS, load_card_db, new_game, play_game
+
+
+class _StopReplay(Exception):
+    pass
+
+
+class ReplayAgent(Agent):
+    """Plays back logged decisions (for both seats) from decision `cursor` on."""
+
+    def __init__(self, decisions: list, cursor: int = 0, actions: int = 0, stop_at: int = None):
+        super().__init__()
+        self.decisions = decisions
+        self.cursor = cursor        # next decision to play
+        self.actions = actions      # actions played so far
+        self.stop_at = stop_at      # stop before playing this action number
+        self.targets = ()
+
+    def choose_action(self, game, player, actions):
+        if self.actions == self.stop_at:
+            raise _StopReplay
+        if self.cursor >= len(self.decisions):
+            raise ValueError("Game log ended before the game did (wrong card database or rules?)")
+        decision = self.decisions[self.cursor]
+        self.cursor += 1
+        if decision is None:
+            return None
+        index, self.targets = decision
+        if index >= len(actions):
+            raise ValueError(f"Logged action {index} is not legal here (the game diverged from its log)")
+        self.actions += 1
+        return actions[index]
+
+    def choose_targets(self, game, player, action):
+        targets = {}
+        for req, indexes in zip(action.get_requirements(), self.targets):
+            candidates = game.rules.get_attack_targets(game, player, req)
+            if any(i >= len(candidates) for i in indexes):
+                raise ValueError("Logged target is not legal here (the game diverged from its log)")
+            targets[req] = [candidates[i] for i in indexes]
+        return targets
+
+
+class Replayer:
+    def __init__(self, db, log: GameLog, checkpoint_every: int = 32):
+        self.db = db
+        self.log = log
+        self.checkpoint_every = checkpoint_every
+        game = new_game(db, log.seed, log.decklists)
+        # (actions played, decision cursor, game clone at a phase boundary), sorted by actions
+        self.checkpoints: list[tuple[int, int, object]] = [(0, 0, game)]
+        self.game = None
+
+    def seek(self, action_number: int = None):
+        """
+        Game state once action_number actions have been played, at the next
+        decision (None: the end of the game). Resumes from the last
+        checkpoint taken before that action.
+        """
+        if action_number is None:
+            i = len(self.checkpoints) - 1
+        else:
+            i = max(bisect.bisect_left(self.checkpoints, action_number, key=lambda cp: cp[0]) - 1, 0)
+        actions, cursor, checkpoint = self.checkpoints[i]
+        game = checkpoint.clone()
+        agent = ReplayAgent(self.log.decisions, cursor, actions, stop_at=action_number)
+
+        def on_phase(game):
+            if agent.actions >= self.checkpoints[-1][0] + self.checkpoint_every:
+                self.checkpoints.append((agent.actions, agent.cursor, game.clone()))
+
+        try:
+            play_game(game, {p.get_player_id(): agent for p in game.players}, self.log.max_rounds,
+                      on_phase=on_phase)
+        except _StopReplay:
+            pass
+        self.game = game
+        return game
+
+    def run(self):
+        return self.seek(None)
+
+    def verify(self) -> bool:
+        """Replay to the end and compare the outcome with the one stored in the log."""
+        game = self.run()
+        winner = game.winner.get_player_id() if game.winner else 0
+        return (winner, game.turn_manager.round_number) == (self.log.winner, self.log.rounds)
+
+
+# --- Batch replay ---
+
+_worker_db = None
+
+
+def _init_worker(csv_path: str):
+    global _worker_db
+    _worker_db = load_card_db(csv_path)
+
+
+def _verify(path: str) -> bool:
+    """False for a log that does not replay to its outcome, including one that cannot be read or replayed."""
+    try:
+        return Replayer(_worker_db, GameLog.load(path), checkpoint_every=1 << 30).verify()
+    except (ValueError, IndexError, struct.error):
+        return False
+
+
+def replay_files(paths: list[str], workers: int = None, csv_path: str = DEFAULT_CARDS) -> list[bool]:
+    """Replay every log headlessly; True for each one whose outcome matches (False for a corrupt log)."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker(csv_path)
+        return [_verify(p) for p in paths]
+    chunksize = max(1, len(paths) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(csv_path,)) as pool:
+        return list(pool.map(_verify, paths, chunksize=chunksize))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay and verify binary game logs.")
+    parser.add_argument("paths", nargs="+", help="log files or directories of logs")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cards", default=DEFAULT_CARDS)
+    args = parser.parse_args(argv)
+
+    paths = []
+    for path in args.paths:
+        if os.path.isdir(path):
+            paths += sorted(os.path.join(path, f) for f in os.listdir(path) if f.endswith(LOG_SUFFIX))
+        else:
+            paths.append(path)
+
+    start = time.perf_counter()
+    results = replay_files(paths, args.workers, args.cards)
+    elapsed = time.perf_counter() - start
+    print(f"{len(paths)} games replayed in {elapsed:.2f}s ({len(paths) / elapsed:.1f} games/s)")
+    print(f"{results.count(True)} match their logged outcome, {results.count(False)} differ")
+
+
+if __name__ == "__main__":
+    main()
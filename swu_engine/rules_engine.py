@@ -1,23 +1,37 @@
 from typing import Callable
 from swu_engine.cardbundle import CardBundle
 from swu_engine.base import Base
+from swu_engine.events import EventType
+from swu_engine.targets import ALL_BASES, ALL_UNITS, ENEMY_TARGETS, EVERYWHERE, OWN_DECK, OWN_HAND, enemy_arena
+from swu_engine.vocab import KEYWORDS, TRAITS
+
+# Extra cost per aspect icon the player's leader and base do not provide. The
+# game rules charge 2 per missing icon (the old placeholder docstring said +1).
+ASPECT_PENALTY = 2
 
 class Requirement:
-    def __init__(self, req_type: str, description: str, validator_fn: Callable, min_targets=1, max_targets=1):
+    def __init__(self, req_type: str, description: str, validator_fn: Callable, min_targets=1, max_targets=1,
+                 domain: tuple = None):
         self.req_type = req_type
         self.description = description
         self.validator_fn = validator_fn
         self.min_targets = min_targets
         self.max_targets = max_targets
+        # where targets can be, e.g. targets.ENEMY_UNITS; None = the caller's default
+        # (enemy units and bases in RulesEngine.get_attack_targets; see targets.py)
+        self.domain = domain
 
 
 class Action:
-    def __init__(self, player_id: int, description: str, requirements: list[Requirement], execute_fn: Callable, follow_up_fn: Callable = None):
+    def __init__(self, player_id: int, description: str, requirements: list[Requirement], execute_fn: Callable, follow_up_fn: Callable = None,
+                 move: tuple = None):
         self.player_id = player_id
         self.description = description
         self.requirements = requirements
         self.execute_fn = execute_fn
         self.follow_up_fn = follow_up_fn
+        # ("play" | "resource" | "attack", bundle) for the moves of get_legal_actions (see action_space.py)
+        self.move = move
 
     def get_requirements(self):
         return self.requirements
@@ -30,36 +44,64 @@ class Action:
 
 
 class RulesEngine:
-    def __init__(self):
-        pass
+    def __init__(self, game: 'Game' = None):
+        self.game = game   # default for the helpers whose game argument is optional
 
     def get_legal_actions(self, game: 'Game', player: 'Player') -> list[Action]:
         """
-        Return all legal actions available to a player during their turn.
-        Currently: play any card from hand.
+        Return all legal actions available to a player during their turn:
+        - play any affordable card from hand
+        - resource a card from hand (once per turn)
+        - attack with any ready unit in an arena
+        Cached between calls; only what a mutation affected is rebuilt (see action_cache.py).
         """
+        return game.action_cache.legal_actions(player)
+
+    def build_legal_actions(self, game: 'Game', player: 'Player') -> list[Action]:
+        """get_legal_actions() from scratch, without the cache."""
         actions = []
         for bundle in list(player.hand):
-            card = bundle.primary_card
-            desc = f"Play {card.name} (cost {card.cost}, type {card.card_type})"
-            actions.append(Action(
-                player_id=player.get_player_id(),
-                description=desc,
-                requirements=[],
-                execute_fn=lambda targets, b=bundle: game.play_card(player, b, extra_targets=targets)
-            ))
+            if player.can_pay_for(game, bundle.primary_card):
+                actions.append(self.create_play_action(game, player, bundle))
+
+        if player.resources_played_this_turn == 0:
+            for bundle in list(player.hand):
+                actions.append(self.create_resource_action(game, player, bundle))
+
+        for zone_name in ("Ground Arena", "Space Arena"):
+            zone = player.get_board().find_zone(zone_name)
+            for pile in zone.get_piles():
+                for bundle in pile.get_bundles():
+                    if not bundle.exhausted and bundle.primary_card:
+                        actions.append(self.create_attack_action(game, player, bundle))
         return actions
 
+    def create_play_action(self, game, player, bundle) -> Action:
+        card = bundle.primary_card
+        desc = f"Play {card.name} (cost {card.cost}, type {card.card_type})"
+        return Action(
+            player_id=player.get_player_id(),
+            description=desc,
+            requirements=[],
+            execute_fn=lambda targets, b=bundle: game.play_card(player, b, extra_targets=targets),
+            move=("play", bundle),
+        )
 
-    def can_player_see(self, player: 'Player', bundle: 'CardBundle') -> bool:
-        """Check if a player can see a given bundle."""
+    def get_attack_targets(self, game: 'Game', player: 'Player', requirement: Requirement) -> list:
+        """
+        Legal targets for a requirement (see targets.py); a requirement
+        without a domain is checked against enemy units and bases.
+        """
+        return game.targets.legal(player, requirement, ENEMY_TARGETS)
+
+    def can_player_see(self, player: 'Player', bundle: 'CardBundle', game: 'Game' = None) -> bool:
+        """
+        Check if a player can see a given bundle. Pass game to look the bundle
+        up on its owner's board (needed for the opponent's cards).
+        """
         # Find the zone the bundle belongs to
-        zone = None
-        for p in player.get_board().get_zones():
-            for pile in p.get_piles():
-                if bundle in pile.get_bundles():
-                    zone = p
-                    break
+        owner = game.get_player_by_id(bundle.owner_id) if game is not None else None
+        zone = (owner or player).get_board().find_bundle_zone(bundle)
 
         # Default: if we can’t locate zone, fall back to True
         if not zone:
@@ -79,32 +121,36 @@ class RulesEngine:
 
         # Fully hidden zones (resources face-down)
         if zone.visibility == "hidden_all":
-            return player.get_player_id() in getattr(bundle, "peekers", set())
+            return bundle.is_peeked_by(player.get_player_id())
 
         return True
 
 
 
-    def grant_peek_permission(self, viewer: 'Player', bundle: CardBundle):
-        bundle.peekers.add(viewer.get_player_id())
-        print(f"{viewer.get_name()} is granted peek permission for {bundle.primary_card.name}.")
+    def grant_peek_permission(self, viewer: 'Player', bundle: CardBundle, game: 'Game' = None):
+        """Let viewer see bundle (journaled; emits PEEK). game defaults to the engine's game."""
+        return (game or self.game).peek_card(viewer, bundle)
 
     # ---------- Validators ----------
     @staticmethod
     def _unit_in_play(game, bundle):
-        return isinstance(bundle, CardBundle) and getattr(bundle.primary_card, "card_type", None) == "unit"
+        """A unit card, or a token bundle (no primary card) made of unit tokens."""
+        if not isinstance(bundle, CardBundle):
+            return False
+        card = bundle.primary_card
+        if card is None:
+            return any(t.token_type == "unit" for t in bundle._tokens or ())
+        return card.card_type == "unit"
 
-    @staticmethod
-    def _damage_target_ok(game, target):
-        return isinstance(target, Base) or (
-            isinstance(target, CardBundle)
-            and getattr(target.primary_card, "card_type", None) == "unit"
-        )
+    @classmethod
+    def _damage_target_ok(cls, game, target):
+        return isinstance(target, Base) or cls._unit_in_play(game, target)
 
     # ---------- Action Generators ----------
     def create_damage_action(self, game, player, amount: int, description: str = None) -> Action:
         desc = description or f"Deal {amount} damage"
-        req = Requirement("target", desc, lambda g, p, t: self._damage_target_ok(g, t), 1, 1)
+        req = Requirement("target", desc, lambda g, p, t: self._damage_target_ok(g, t), 1, 1,
+                          ALL_UNITS + ALL_BASES)
         return Action(
             player.get_player_id(),
             desc,
@@ -114,7 +160,7 @@ class RulesEngine:
 
     def create_heal_action(self, game, player, amount: int, description: str = None) -> Action:
         desc = description or f"Heal {amount} damage"
-        req = Requirement("target", desc, lambda g, p, t: isinstance(t, CardBundle) and t.damage > 0, 1, 1)
+        req = Requirement("target", desc, lambda g, p, t: isinstance(t, CardBundle) and t.damage > 0, 1, 1, ALL_UNITS)
         return Action(
             player.get_player_id(),
             desc,
@@ -123,7 +169,7 @@ class RulesEngine:
         )
 
     def create_discard_action(self, game, player, description: str = "Discard a card from hand") -> Action:
-        req = Requirement("target", description, lambda g, p, b: b in player.hand, 1, 1)
+        req = Requirement("target", description, lambda g, p, b: b in player.hand, 1, 1, OWN_HAND)
         return Action(
             player.get_player_id(),
             description,
@@ -140,12 +186,23 @@ class RulesEngine:
             lambda targets: game.draw_cards(player, amount)
         )
 
-    def create_token_action(self, player: 'Player', token: 'Token') -> Action:
+    def create_resource_action(self, game, player, bundle: CardBundle) -> Action:
+        return Action(
+            player.get_player_id(),
+            f"Resource {bundle.primary_card.name}",
+            [],
+            lambda targets, b=bundle: game.resource_card(player, b),
+            move=("resource", bundle),
+        )
+
+    def create_token_action(self, player: 'Player', token: 'Token', game: 'Game' = None) -> Action:
         """
         Create a token and put it directly into play under the player's control.
         Arena is determined automatically via CardBundle.get_default_arena().
         Automatically forces token_type="unit" since these are in-play tokens.
+        Emits TOKEN_ENTERS on game's event bus (default: the engine's game).
         """
+        game = game or self.game
 
         # 🔹 Ensure token acts as a unit in play
         token.token_type = "unit"
@@ -172,7 +229,7 @@ class RulesEngine:
                 if not arena.get_piles():
                     arena.add_pile(Pile(f"{arena.zone_id}_pile"))
                 arena.get_piles()[0].add_bundle(bundle)
-                print(f"{player.get_name()} creates a token in the {zone_name}: {token.token_info}")
+                game.events.emit(EventType.TOKEN_ENTERS, player, bundle, target=zone_name)
             return True
 
         return Action(
@@ -188,25 +245,24 @@ class RulesEngine:
                            duration_phase: str = None) -> Action:
         desc = description or f"Buff a unit +{amount_attack}/+{amount_health}"
         req = Requirement("target", desc,
-                          lambda g, p, b: isinstance(b, CardBundle) and b.primary_card.card_type == "unit", 1, 1)
+                          lambda g, p, b: self._unit_in_play(g, b), 1, 1,
+                          ALL_UNITS)
 
         def _apply_buff(targets, r=req):
             bundle = targets[r][0]
-            bundle.attack_buff += amount_attack
-            bundle.health_buff += amount_health
+            game.modify_stats(bundle, amount_attack, amount_health)
             if keywords:
-                bundle.temp_keywords.update(keywords)
-            print(f"{bundle.primary_card.name} buffed: +{amount_attack}/+{amount_health} {keywords or ''}")
+                game.add_temp_keywords(bundle, keywords)
+            game.events.emit(EventType.BUFF, subject=bundle, target=(amount_attack, amount_health, keywords))
             # Register revert
             if duration_phase:
-                def _revert_buff(g: 'Game', bundle=bundle):
-                    bundle.attack_buff -= amount_attack
-                    bundle.health_buff -= amount_health
+                def _revert_buff(g: 'Game', bundle):
+                    g.modify_stats(bundle, -amount_attack, -amount_health)
                     if keywords:
-                        bundle.temp_keywords.difference_update(keywords)
-                    print(f"{bundle.primary_card.name}'s temporary buff expired.")
+                        g.remove_temp_keywords(bundle, keywords)
+                    g.events.emit(EventType.BUFF_EXPIRED, subject=bundle)
 
-                game.register_delayed_effect(duration_phase, _revert_buff)
+                game.register_delayed_effect(duration_phase, _revert_buff, bundle=bundle)
 
         return Action(player.get_player_id(), desc, [req], _apply_buff)
 
@@ -214,62 +270,63 @@ class RulesEngine:
                              remove_keywords: list[str] = None, description: str = None,
                              duration_phase: str = None) -> Action:
         desc = description or f"Debuff a unit -{amount_attack}/-{amount_health}"
-        req = Requirement("target", desc, lambda g, p, b: isinstance(b, CardBundle) and b.primary_card.card_type == "unit", 1, 1)
+        req = Requirement("target", desc, lambda g, p, b: self._unit_in_play(g, b), 1, 1,
+                          ALL_UNITS)
 
         def _apply_debuff(targets, r=req):
             bundle = targets[r][0]
-            bundle.attack_buff -= amount_attack
-            bundle.health_buff -= amount_health
+            game.modify_stats(bundle, -amount_attack, -amount_health)
             if remove_keywords:
-                bundle.temp_keywords.difference_update(remove_keywords)
-            print(f"{bundle.primary_card.name} debuffed: -{amount_attack}/-{amount_health} remove {remove_keywords or ''}")
+                game.remove_temp_keywords(bundle, remove_keywords)
+            game.events.emit(EventType.DEBUFF, subject=bundle, target=(amount_attack, amount_health, remove_keywords))
             if duration_phase:
-                def _revert_debuff(g: 'Game', bundle=bundle):
-                    bundle.attack_buff += amount_attack
-                    bundle.health_buff += amount_health
-                    print(f"{bundle.primary_card.name}'s temporary debuff expired.")
-                game.register_delayed_effect(duration_phase, _revert_debuff)
+                def _revert_debuff(g: 'Game', bundle):
+                    g.modify_stats(bundle, amount_attack, amount_health)
+                    g.events.emit(EventType.DEBUFF_EXPIRED, subject=bundle)
+                game.register_delayed_effect(duration_phase, _revert_debuff, bundle=bundle)
 
         return Action(player.get_player_id(), desc, [req], _apply_debuff)
 
     def create_add_keyword_action(self, game, player, keyword: str, description: str = None,
                                   duration_phase: str = None) -> Action:
         desc = description or f"Give unit {keyword}"
-        req = Requirement("target", desc, lambda g, p, b: isinstance(b, CardBundle) and b.primary_card.card_type == "unit", 1, 1)
+        req = Requirement("target", desc, lambda g, p, b: self._unit_in_play(g, b), 1, 1,
+                          ALL_UNITS)
 
         def _apply_kw(targets, r=req):
             bundle = targets[r][0]
-            bundle.temp_keywords.add(keyword)
-            print(f"{bundle.primary_card.name} gains keyword {keyword}")
+            game.add_temp_keywords(bundle, [keyword])
+            game.events.emit(EventType.KEYWORD_GAINED, subject=bundle, target=keyword)
             if duration_phase:
-                def _revert_kw(g: 'Game', bundle=bundle):
+                def _revert_kw(g: 'Game', bundle):
                     if keyword in bundle.temp_keywords:
-                        bundle.temp_keywords.remove(keyword)
-                        print(f"{bundle.primary_card.name} loses temporary keyword {keyword}")
-                game.register_delayed_effect(duration_phase, _revert_kw)
+                        g.remove_temp_keywords(bundle, [keyword])
+                        g.events.emit(EventType.KEYWORD_EXPIRED, subject=bundle, target=keyword)
+                game.register_delayed_effect(duration_phase, _revert_kw, bundle=bundle)
 
         return Action(player.get_player_id(), desc, [req], _apply_kw)
 
     def create_remove_keyword_action(self, game, player, keyword: str, description: str = None,
                                      duration_phase: str = None) -> Action:
         desc = description or f"Remove keyword {keyword}"
-        req = Requirement("target", desc, lambda g, p, b: isinstance(b, CardBundle) and b.primary_card.card_type == "unit", 1, 1)
+        req = Requirement("target", desc, lambda g, p, b: self._unit_in_play(g, b), 1, 1,
+                          ALL_UNITS)
 
         def _remove_kw(targets, r=req):
             bundle = targets[r][0]
             if keyword in bundle.temp_keywords:
-                bundle.temp_keywords.remove(keyword)
-                print(f"{bundle.primary_card.name} loses keyword {keyword}")
+                game.remove_temp_keywords(bundle, [keyword])
+                game.events.emit(EventType.KEYWORD_LOST, subject=bundle, target=keyword)
             if duration_phase:
-                def _revert_kw(g: 'Game', bundle=bundle):
-                    bundle.temp_keywords.add(keyword)
-                    print(f"{bundle.primary_card.name} regains temporary keyword {keyword}")
-                game.register_delayed_effect(duration_phase, _revert_kw)
+                def _revert_kw(g: 'Game', bundle):
+                    g.add_temp_keywords(bundle, [keyword])
+                    g.events.emit(EventType.KEYWORD_REGAINED, subject=bundle, target=keyword)
+                game.register_delayed_effect(duration_phase, _revert_kw, bundle=bundle)
 
         return Action(player.get_player_id(), desc, [req], _remove_kw)
 
     @staticmethod
-    def _can_attack(game, attacker, defender, attacking_player):
+    def can_attack(game, attacker, defender, attacking_player):
         # must be a unit in play and not exhausted
         if attacker.primary_card.card_type != "unit" or attacker.exhausted:
             return False
@@ -278,27 +335,21 @@ class RulesEngine:
         if not isinstance(defender, (CardBundle, Base)):
             return False
 
-        # arena match check
-        atk_type = getattr(attacker.primary_card, "subtype", None)
+        # defender must belong to an opponent
         if isinstance(defender, CardBundle):
-            def_type = getattr(defender.primary_card, "subtype", None)
-            if atk_type == "ground" and def_type == "space":
+            if defender.owner_id == attacking_player.get_player_id():
                 return False
-            if atk_type == "space" and def_type == "ground":
-                return False
-        elif isinstance(defender, Base):
-            if atk_type not in ("ground", "space"):
+        elif defender is attacking_player.base:
+            return False
+
+        # arena match check: units only fight units in the same arena
+        if isinstance(defender, CardBundle) and defender.primary_card:
+            if attacker.get_default_arena() != defender.get_default_arena():
                 return False
 
         # sentinel restriction: must attack enemy sentinels first
-        enemy = [p for p in game.players if p.get_player_id() != attacking_player.get_player_id()][0]
-        sentinels = []
-        for z in enemy.get_board().get_zones():
-            for p in z.get_piles():
-                for b in p.get_bundles():
-                    if b.has_keyword("Sentinel"):
-                        sentinels.append(b)
-        if sentinels:
+        enemy = game.get_opponent(attacking_player)
+        if enemy.get_board().has_arena_keyword("Sentinel"):
             if isinstance(defender, Base) or (isinstance(defender, CardBundle) and not defender.has_keyword("Sentinel")):
                 return False
 
@@ -310,18 +361,21 @@ class RulesEngine:
         req = Requirement(
             "target",
             desc,
-            lambda g, p, target: self._can_attack(g, attacker, target, player),
-            1, 1
+            lambda g, p, target: self.can_attack(g, attacker, target, player),
+            1, 1, enemy_arena(attacker.get_default_arena())
         )
 
         def _do_attack(targets, r=req):
-            defender = targets[r][0]
-            attacker.exhaust()
-            target_name = getattr(defender, "name", getattr(defender.primary_card, "name", "target"))
-            print(f"{attacker.primary_card.name} attacks {target_name}!")
-            game.resolve_combat(attacker, defender)
+            self.attack(game, player, attacker, targets[r][0])
 
-        return Action(player.get_player_id(), desc, [req], _do_attack)
+        return Action(player.get_player_id(), desc, [req], _do_attack, move=("attack", attacker))
+
+    @staticmethod
+    def attack(game, player, attacker, defender):
+        """Exhaust attacker and resolve combat against defender (legality is checked by the caller)."""
+        game.exhaust(attacker)
+        game.events.emit(EventType.ATTACK, player, attacker, target=defender)
+        game.resolve_combat(attacker, defender)
 
     def create_shuffle_action(self, game, player, description: str = "Shuffle your deck") -> Action:
         return Action(
@@ -332,7 +386,7 @@ class RulesEngine:
         )
 
     def create_reveal_action(self, game, player, description: str = "Reveal a card") -> Action:
-        req = Requirement("target", description, lambda g, p, b: isinstance(b, CardBundle), 1, 1)
+        req = Requirement("target", description, lambda g, p, b: isinstance(b, CardBundle), 1, 1, EVERYWHERE)
         return Action(
             player.get_player_id(),
             description,
@@ -341,7 +395,7 @@ class RulesEngine:
         )
 
     def create_peek_action(self, game, player, description: str = "Peek at a card") -> Action:
-        req = Requirement("target", description, lambda g, p, b: isinstance(b, CardBundle), 1, 1)
+        req = Requirement("target", description, lambda g, p, b: isinstance(b, CardBundle), 1, 1, EVERYWHERE)
         return Action(
             player.get_player_id(),
             description,
@@ -349,15 +403,19 @@ class RulesEngine:
             lambda targets, r=req: game.peek_card(player, targets[r][0])
         )
 
-    def create_search_action(self, game, player, match_fn, max_targets: int = 1,
-                             description: str = "Search your deck") -> Action:
-        req = Requirement(
-            "target",
-            description,
-            lambda g, p, b: isinstance(b, CardBundle) and b in player.deck and match_fn(b),
-            1,
-            max_targets
-        )
+    def create_search_action(self, game, player, match_fn=None, max_targets: int = 1,
+                             description: str = "Search your deck", traits: list[str] = None) -> Action:
+        """Search the deck for cards matching match_fn and/or having any of traits."""
+        trait_mask = TRAITS.mask(traits or ())
+
+        def _matches(g, p, b):
+            if not isinstance(b, CardBundle) or b not in player.deck:
+                return False
+            if trait_mask and not b.primary_card.trait_mask & trait_mask:
+                return False
+            return match_fn is None or match_fn(b)
+
+        req = Requirement("target", description, _matches, 1, max_targets, OWN_DECK)
         return Action(
             player.get_player_id(),
             description,
@@ -396,24 +454,31 @@ class RulesEngine:
     def get_response_actions(self, game: 'Game', player: 'Player') -> list[Action]:
         """
         Return all legal response actions available to a player.
-        Example: play an event with Ambush from hand.
+        Example: play an event with Ambush from hand. Cached like get_legal_actions().
         """
+        return game.action_cache.response_actions(player)
+
+    def build_response_actions(self, game: 'Game', player: 'Player') -> list[Action]:
+        """get_response_actions() from scratch, without the cache."""
         responses = []
 
         # Check for Ambush cards in hand
+        ambush = KEYWORDS.bit("Ambush")
         for bundle in list(player.hand):
             card = bundle.primary_card
-            if "Ambush" in getattr(card, "keywords", []):
-                desc = f"Play {card.name} with Ambush"
-                responses.append(Action(
-                    player_id=player.get_player_id(),
-                    description=desc,
-                    requirements=[],
-                    execute_fn=lambda targets, b=bundle: game.play_card(player, b, extra_targets=targets)
-                ))
+            if card is not None and card.keyword_mask & ambush:
+                responses.append(self.create_ambush_play_action(game, player, bundle))
 
         return responses
 
+    def create_ambush_play_action(self, game, player, bundle) -> Action:
+        return Action(
+            player_id=player.get_player_id(),
+            description=f"Play {bundle.primary_card.name} with Ambush",
+            requirements=[],
+            execute_fn=lambda targets, b=bundle: game.play_card(player, b, extra_targets=targets)
+        )
+
     def execute_response_action(self, game: 'Game', player: 'Player', action: dict) -> bool:
         """
         Execute a response action chosen during a priority window.
@@ -429,7 +494,7 @@ class RulesEngine:
             if not arena.get_piles():
                 arena.add_pile(game.Pile(f"{arena.zone_id}_pile"))
             arena.get_piles()[0].add_bundle(bundle)
-            print(f"{card.name} enters play with Ambush!")
+            game.events.emit(EventType.AMBUSH_ENTERS, player, bundle)
 
             # Immediately offer attack option
             legal_targets = []
@@ -447,11 +512,11 @@ class RulesEngine:
 
             if legal_targets:
                 target = legal_targets[0]  # selection logic / UI later
-                print(f"{card.name} (Ambush) attacks {getattr(target, 'name', target.primary_card.name)} immediately!")
+                game.events.emit(EventType.AMBUSH_ATTACK, player, bundle, target=target)
                 game.deal_damage(target, card.attack)
-                bundle.exhaust()  # Ambush attack still exhausts the unit
+                game.exhaust(bundle)  # Ambush attack still exhausts the unit
             else:
-                print(f"{card.name} had no legal Ambush targets.")
+                game.events.emit(EventType.AMBUSH_NO_TARGET, player, bundle)
 
             return True
 
@@ -468,12 +533,15 @@ class RulesEngine:
             "description": f"Play {bundle.primary_card.name} with Ambush",
         }
 
-    def apply_aspect_penalty(self, player, card):
+    def apply_aspect_penalty(self, player, card) -> int:
         """
-        Apply aspect penalty if the card’s aspects do not match player’s resources.
-        Typically: +1 cost per missing aspect.
+        Cost of card for player, including the aspect penalty: +ASPECT_PENALTY
+        for every aspect icon on the card that the player's leader and base
+        do not provide (a doubled icon needs the aspect twice among them).
         """
-        raise NotImplementedError("apply_aspect_penalty() not yet implemented")
+        have, have_twice = player.aspect_masks()
+        missing = (card.aspect_mask & ~have).bit_count() + (card.double_aspect_mask & ~have_twice).bit_count()
+        return card.cost + ASPECT_PENALTY * missing
 
     def handle_keyword(self, keyword, source_bundle, context):
         """
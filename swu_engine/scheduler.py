@@ -0,0 +1,126 @@
+# scheduler.py
+"""
+Delayed effects ("until end of phase/turn/round").
+
+Effects are stored under the turn position at whose end they expire,
+(round, turn, phase_index), where turn counts turns within the round from
+the initiative player. A heap holds the distinct keys, so
+TurnManager.next_phase only touches the effects that are actually due:
+
+    game.register_delayed_effect("turn", revert_fn, bundle=bundle)
+    ...
+    game.scheduler.fire_due(game, key)   # called by TurnManager.next_phase
+
+Effects are called as fn(game, **kwargs). Pass bundles/players as kwargs
+rather than closing over them so Game.clone() can remap them.
+"""
+import heapq
+
+from swu_engine.cardbundle import CardBundle
+from swu_engine.events import EventType
+from swu_engine.modifiers import Modifier
+from swu_engine.player import Player
+
+# Duration names accepted by due_key(); anything else is taken as a phase name.
+DURATIONS = {
+    "phase": "phase", "end_of_phase": "phase",
+    "turn": "turn", "end_of_turn": "turn",
+    "round": "round", "end_of_round": "round",
+}
+
+
+class EffectScheduler:
+    __slots__ = ("keys", "queued", "pending")
+
+    def __init__(self):
+        self.keys: list[tuple] = []             # heap of due keys
+        self.queued: set[tuple] = set()         # keys currently in the heap
+        self.pending: dict[tuple, list] = {}    # key -> [(fn, kwargs)] in registration order
+
+    def __len__(self):
+        return sum(len(effects) for effects in self.pending.values())
+
+    def __bool__(self):
+        return bool(self.pending)
+
+    @staticmethod
+    def due_key(turn_manager, duration: str) -> tuple:
+        """Key of the phase end at which an effect registered now with this duration expires."""
+        round_number, turn, phase_index = turn_manager.get_turn_key()
+        last_phase = len(turn_manager.phases) - 1
+        kind = DURATIONS.get(duration)
+        if kind == "phase":
+            return round_number, turn, phase_index
+        if kind == "turn":
+            return round_number, turn, last_phase
+        if kind == "round":
+            return round_number, max(len(turn_manager.players) - 1, 0), last_phase
+
+        # A phase name: the end of the next occurrence of that phase
+        target = next((i for i, p in enumerate(turn_manager.phases) if p.name == duration), None)
+        if target is None:
+            raise ValueError(f"Unknown delayed effect duration {duration!r}")
+        if target >= phase_index:
+            return round_number, turn, target
+        if turn + 1 < len(turn_manager.players):
+            return round_number, turn + 1, target
+        return round_number + 1, 0, target
+
+    def schedule(self, journal, key: tuple, fn, kwargs: dict):
+        effects = self.pending.get(key)
+        if effects is None:
+            effects = self.pending[key] = []
+            if key not in self.queued:
+                self.queued.add(key)
+                heapq.heappush(self.keys, key)
+        journal.record(self._unschedule, key)
+        effects.append((fn, kwargs))
+
+    def _unschedule(self, key: tuple):
+        # The heap keeps the key; fire_due skips keys with nothing pending.
+        effects = self.pending[key]
+        effects.pop()
+        if not effects:
+            del self.pending[key]
+
+    def fire_due(self, game, key: tuple):
+        """Run and drop every effect due at or before key."""
+        keys = self.keys
+        while keys and keys[0] <= key:
+            due = heapq.heappop(keys)
+            self.queued.discard(due)
+            effects = self.pending.pop(due, None)
+            game.journal.record(self._requeue, due, effects)
+            for fn, kwargs in effects or ():
+                fn(game, **kwargs)
+                game.events.emit(EventType.DELAYED_FIRED, target=due)
+
+    def _requeue(self, key: tuple, effects):
+        if key not in self.queued:
+            self.queued.add(key)
+            heapq.heappush(self.keys, key)
+        if effects is not None:
+            self.pending[key] = effects
+
+    def clone(self, memo: dict) -> "EffectScheduler":
+        """Copy for Game.clone(); kwargs that are players/bundles/modifiers are mapped through memo."""
+        new = EffectScheduler()
+        new.keys = self.keys[:]
+        new.queued = set(self.queued)
+        new.pending = {key: [(fn, _remap(kwargs, memo)) for fn, kwargs in effects]
+                       for key, effects in self.pending.items()}
+        return new
+
+    def get_state(self) -> tuple:
+        return tuple(self.keys), {key: tuple(effects) for key, effects in self.pending.items()}
+
+    def set_state(self, state: tuple):
+        keys, pending = state
+        self.keys = list(keys)
+        self.queued = set(keys)
+        self.pending = {key: list(effects) for key, effects in pending.items()}
+
+
+
+def _remap(kwargs: dict, memo: dict) -> dict:
+    return {k: memo.get(v, v) if isinstance(v, (CardBundle, Player, Modifier)) else v for k, v in kwargs.items()}
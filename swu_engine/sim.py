@@ -0,0 +1,284 @@
+# sim.py
+"""
+Headless batch simulation runner.
+
+    python -m swu_engine.sim --games 10000 --workers 8 --seed 1
+
+Each game builds two players with random legal decks from the card
+database, drives TurnManager.next_phase() and RulesEngine.get_legal_actions()
+with a pluggable agent until a base is destroyed (or MAX_ROUNDS is reached),
+and returns a compact GameRecord. Games are fanned out over a process pool;
+every worker loads the card database once.
+
+Game i of a batch is seeded with derive_seed(seed, i); its decks, its
+shuffles (game.rng) and each agent get separate streams derived from that
+seed, so a batch gives the same records for any worker count and can be
+split across machines with --first-game. With --log-dir every game is
+also written as a binary GameLog that replay.py can re-run.
+"""
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from swu_engine.agents import AGENTS, Agent
+from swu_engine.base import Base
+from swu_engine.card_store import CardStore
+from swu_engine.deck_loader import CardDatabase, load_deck_from_list
+from swu_engine.events import NullSink
+from swu_engine.game import Game
+from swu_engine.game_log import LOG_SUFFIX, GameLog
+from swu_engine.player import Player
+
+DEFAULT_CARDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "all_cards.csv")
+STARTING_HAND = 6
+STARTING_RESOURCES = 2
+MAX_ROUNDS = 60
+MAX_ACTIONS_PER_PHASE = 50
+
+
+class GameRecord(NamedTuple):
+    game_index: int
+    winner: int            # winning player id, 0 for a draw
+    rounds: int
+    base_hp: tuple         # remaining base health per player
+    actions: int
+    wall_time: float
+    seed: int = 0
+    log: bytes = b""       # GameLog.to_bytes() when recorded
+
+
+def derive_seed(master_seed: int, index: int) -> int:
+    """
+    64-bit seed for stream `index` under master_seed (game i of a batch, or
+    the decks/agents of one game), independent of every other index.
+    """
+    return int(np.random.SeedSequence(master_seed, spawn_key=(index,)).generate_state(1, np.uint64)[0])
+
+
+@lru_cache(maxsize=4)
+def card_pools(db) -> tuple[list[str], list[str], list[str]]:
+    """Leader, base and playable (one printing per unit/event name) card ids, scanned once per db."""
+    leaders, bases, playables, seen = [], [], [], set()
+    for card_id, card in db.cards_by_id.items():
+        if card.card_type == "leader":
+            leaders.append(card_id)
+        elif card.card_type == "base":
+            bases.append(card_id)
+        elif card.card_type in ("unit", "event") and card.name not in seen:
+            seen.add(card.name)
+            playables.append(card_id)
+    return leaders, bases, playables
+
+
+def random_decklist(db: CardDatabase, rng: random.Random) -> dict[str, int]:
+    """Pick a random legal decklist: 1 leader, 1 base and 17 x 3 units/events."""
+    leaders, bases, playables = card_pools(db)
+    decklist = {rng.choice(leaders): 1, rng.choice(bases): 1}
+    for card_id in rng.sample(playables, 17):
+        decklist[card_id] = 3
+    return decklist
+
+
+def setup_player(game: Game, db: CardDatabase, player: Player, decklist: dict[str, int], rng: random.Random):
+    """Load a decklist into a player: leader and base out of the deck, shuffle, draw, resource."""
+    deck = load_deck_from_list(player, db, decklist)
+    main_deck = []
+    for bundle in deck.cards:
+        ctype = bundle.primary_card.card_type
+        if ctype == "leader":
+            player.leader = bundle
+        elif ctype == "base":
+            player.base = Base(bundle.primary_card.name, bundle.primary_card.health or 30, bundle.primary_card)
+        else:
+            main_deck.append(bundle)
+    rng.shuffle(main_deck)
+    for bundle in main_deck:
+        player.get_board().move_bundle(bundle, "Deck")
+    game.add_player(player)
+
+    game.draw_cards(player, STARTING_HAND)
+    for bundle in list(player.hand[:STARTING_RESOURCES]):
+        game.resource_card(player, bundle)
+    player.resources_played_this_turn = 0
+
+
+def random_decklists(db: CardDatabase, seed: int) -> list[dict[str, int]]:
+    """Both players' decklists for the game with this seed (stream 0 of the seed)."""
+    rng = random.Random(derive_seed(seed, 0))
+    return [random_decklist(db, rng) for _ in range(2)]
+
+
+def new_game(db: CardDatabase, seed: int, decklists: list[dict[str, int]] = None) -> Game:
+    """Set up a game; shuffles use game.rng, which depends only on seed (not on how decks were chosen)."""
+    game = Game(sinks=[NullSink()], seed=seed)
+    decklists = decklists or random_decklists(db, seed)
+    for i in range(2):
+        player = Player(i + 1, f"Player {i + 1}", isAI=True)
+        setup_player(game, db, player, decklists[i], game.rng)
+    return game
+
+
+def new_agents(game: Game, seed: int, agent_cls) -> dict[int, Agent]:
+    """One agent per player; player n's rng is stream n of the game seed."""
+    return {p.get_player_id(): agent_cls(rng=random.Random(derive_seed(seed, p.get_player_id())))
+            for p in game.players}
+
+
+def take_actions(game: Game, player: Player, agent: Agent, limit: int = MAX_ACTIONS_PER_PHASE,
+                 log: GameLog = None) -> int:
+    """Let the agent act until it passes, runs out of actions or hits the limit."""
+    taken = 0
+    while taken < limit and not game.over:
+        actions = game.rules.get_legal_actions(game, player)
+        if not actions:
+            return taken
+        legal = actions[:] if log is not None else actions
+        while actions:
+            action = agent.choose_action(game, player, actions)
+            if action is None:
+                break
+            targets = agent.choose_targets(game, player, action)
+            if targets is None:
+                actions.remove(action)
+                continue
+            if log is not None:
+                log.record_action(game, player, legal, action, targets)
+            action.execute(targets)
+            taken += 1
+            break
+        else:
+            action = None   # the agent abandoned every offered action
+        if action is None:
+            if log is not None:
+                log.record_pass()
+            return taken
+    return taken
+
+
+def play_game(game: Game, agents: dict[int, Agent], max_rounds: int = MAX_ROUNDS,
+              log: GameLog = None, on_phase=None) -> int:
+    """
+    Drive the turn loop to completion. Returns the number of actions taken.
+    log: GameLog to record decisions into. on_phase(game) is called after
+    every phase step (replay.py uses it to place checkpoints).
+    """
+    tm = game.turn_manager
+    actions = 0
+    while not game.over and tm.round_number <= max_rounds:
+        if tm.get_current_phase().name in ("Main", "Combat"):
+            player = tm.get_current_player()
+            actions += take_actions(game, player, agents[player.get_player_id()], log=log)
+        if game.over:
+            break
+        tm.next_phase()
+        if on_phase is not None:
+            on_phase(game)
+    return actions
+
+
+def run_game(db: CardDatabase, game_index: int, seed: int, agent_cls=None, record: bool = False) -> GameRecord:
+    agent_cls = agent_cls or AGENTS["first"]
+    start = time.perf_counter()
+    decklists = random_decklists(db, seed)
+    game = new_game(db, seed, decklists)
+    agents = new_agents(game, seed, agent_cls)
+    log = GameLog(seed, decklists, MAX_ROUNDS) if record else None
+    actions = play_game(game, agents, log=log)
+    if log is not None:
+        log.finish(game)
+    return GameRecord(
+        game_index=game_index,
+        winner=game.winner.get_player_id() if game.winner else 0,
+        rounds=game.turn_manager.round_number,
+        base_hp=tuple(p.base.health for p in game.players),
+        actions=actions,
+        wall_time=time.perf_counter() - start,
+        seed=seed,
+        log=log.to_bytes() if log is not None else b"",
+    )
+
+
+# --- Process pool plumbing ---
+
+_worker_db: CardDatabase | None = None
+
+
+def load_card_db(csv_path: str, columnar: bool = False):
+    """CardDatabase, or the memory-mapped CardStore shared by all workers."""
+    return CardStore(csv_path) if columnar else CardDatabase(csv_path)
+
+
+def _init_worker(csv_path: str, columnar: bool):
+    global _worker_db
+    _worker_db = load_card_db(csv_path, columnar)
+
+
+def _run_in_worker(job):
+    return run_game(_worker_db, *job)
+
+
+def run_batch(n_games: int, workers: int = None, seed: int = 0, csv_path: str = DEFAULT_CARDS,
+              agent_cls=None, columnar: bool = False, first_game: int = 0, record: bool = False) -> list[GameRecord]:
+    """
+    Play games first_game .. first_game + n_games - 1 of the batch with master
+    seed `seed`, fanned out over a process pool. record: attach a GameLog to
+    every record.
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = [(i, derive_seed(seed, i), agent_cls, record) for i in range(first_game, first_game + n_games)]
+
+    if workers == 1:
+        db = load_card_db(csv_path, columnar)
+        return [run_game(db, *job) for job in jobs]
+
+    chunksize = max(1, n_games // (workers * 8))
+    if columnar:
+        load_card_db(csv_path, columnar)  # build the store once, before the workers map it
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(csv_path, columnar)) as pool:
+        return list(pool.map(_run_in_worker, jobs, chunksize=chunksize))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run headless SWU simulations.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0, help="master seed of the batch")
+    parser.add_argument("--first-game", type=int, default=0, help="index of the first game (to split a batch)")
+    parser.add_argument("--cards", default=DEFAULT_CARDS)
+    parser.add_argument("--agent", choices=sorted(AGENTS), default="first")
+    parser.add_argument("--columnar", action="store_true", help="use the memory-mapped card store")
+    parser.add_argument("--records", action="store_true", help="print every game record")
+    parser.add_argument("--log-dir", help="write a binary GameLog per game into this directory")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    records = run_batch(args.games, args.workers, args.seed, args.cards, AGENTS[args.agent], args.columnar,
+                        args.first_game, record=bool(args.log_dir))
+    elapsed = time.perf_counter() - start
+
+    if args.log_dir:
+        os.makedirs(args.log_dir, exist_ok=True)
+        for r in records:
+            with open(os.path.join(args.log_dir, f"game_{r.game_index:06d}{LOG_SUFFIX}"), "wb") as f:
+                f.write(r.log)
+        print(f"Logs: {sum(len(r.log) for r in records) / len(records):.0f} bytes/game in {args.log_dir}")
+    if args.records:
+        for r in records:
+            print(r._replace(log=b""))
+    wins = {}
+    for r in records:
+        wins[r.winner] = wins.get(r.winner, 0) + 1
+    print(f"{len(records)} games in {elapsed:.2f}s ({len(records) / elapsed:.1f} games/s)")
+    print(f"Wins by player: {dict(sorted(wins.items()))} (0 = draw)")
+    print(f"Avg rounds: {sum(r.rounds for r in records) / len(records):.1f}, "
+          f"avg actions: {sum(r.actions for r in records) / len(records):.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# targets.py
+"""
+Legal-target enumeration for Requirements.
+
+A Requirement can declare its domain: where its targets may be, as
+(side, zone) pairs relative to the acting player, e.g. ENEMY_UNITS or
+OWN_DECK (BASE stands for a player's base). TargetIndex builds the
+shortlist for a domain straight from the board piles and runs the
+requirement's validator on that shortlist only, instead of on every object
+in the game. A requirement without a domain is checked against the caller's
+default: EVERYWHERE for TargetIndex itself, enemy units and bases
+(ENEMY_TARGETS) for RulesEngine.get_attack_targets().
+
+Results come back as a list, or as a bitmask over candidates() (bit i set
+when candidate i is legal), and are cached per state version: the game's
+Journal counts every mutation, so asking again before anything changes is
+a dict lookup. Validators that read state outside the game (closures over
+other objects) should not rely on the cache.
+
+    targets = game.targets.legal(player, requirement)
+    mask = game.targets.mask(player, requirement)
+    pool = game.targets.candidates(player, requirement)   # what mask's bits index
+"""
+OWN, ENEMY = "own", "enemy"
+BASE = "Base"
+ZONES = ("Leader", "Hand", "Deck", "Discard", "Exile", "Resources", "Ground Arena", "Space Arena")
+
+
+def _domain(side: str, *zones: str) -> tuple:
+    return tuple((side, zone) for zone in zones)
+
+
+OWN_HAND = _domain(OWN, "Hand")
+OWN_DECK = _domain(OWN, "Deck")
+OWN_DISCARD = _domain(OWN, "Discard")
+OWN_RESOURCES = _domain(OWN, "Resources")
+OWN_UNITS = _domain(OWN, "Ground Arena", "Space Arena")
+ENEMY_UNITS = _domain(ENEMY, "Ground Arena", "Space Arena")
+ENEMY_BASE = _domain(ENEMY, BASE)
+ALL_UNITS = OWN_UNITS + ENEMY_UNITS
+ALL_BASES = _domain(OWN, BASE) + ENEMY_BASE
+ENEMY_TARGETS = ENEMY_UNITS + ENEMY_BASE      # what an attack can hit
+EVERYWHERE = _domain(OWN, *ZONES, BASE) + _domain(ENEMY, *ZONES, BASE)
+
+
+def enemy_arena(arena: str) -> tuple:
+    """Enemy units in one arena plus the enemy base: the domain of an attack from that arena."""
+    return _domain(ENEMY, arena, BASE)
+
+
+class TargetIndex:
+    """Per-game target lookup; see the module docstring."""
+    __slots__ = ("game", "version", "cache")
+
+    def __init__(self, game):
+        self.game = game
+        self.version = -1
+        self.cache = {}   # (requirement, player id, domain) -> (candidates, legal, mask)
+
+    def candidates(self, player, requirement, default: tuple = EVERYWHERE) -> list:
+        return self._lookup(player, requirement, default)[0]
+
+    def legal(self, player, requirement, default: tuple = EVERYWHERE) -> list:
+        """Legal targets in candidate order (a cached list; copy before changing it)."""
+        return self._lookup(player, requirement, default)[1]
+
+    def mask(self, player, requirement, default: tuple = EVERYWHERE) -> int:
+        return self._lookup(player, requirement, default)[2]
+
+    def shortlist(self, player, domain: tuple) -> list:
+        """Every object in domain, domain entry by entry, in pile order within a zone."""
+        out = []
+        own_id = player.get_player_id()
+        for side, zone_name in domain:
+            own = side == OWN
+            for p in self.game.players:
+                if (p.get_player_id() == own_id) != own:
+                    continue
+                if zone_name == BASE:
+                    if p.base is not None:
+                        out.append(p.base)
+                    continue
+                zone = p.get_board().find_zone(zone_name)
+                if zone is not None:
+                    for pile in zone.get_piles():
+                        out.extend(pile.get_bundles())
+        return out
+
+    def _lookup(self, player, requirement, default: tuple) -> tuple:
+        game = self.game
+        if game.journal.version != self.version:
+            self.cache.clear()
+            self.version = game.journal.version
+        domain = requirement.domain if requirement.domain is not None else default
+        key = (requirement, player.get_player_id(), domain)
+        entry = self.cache.get(key)
+        if entry is None:
+            candidates = self.shortlist(player, domain)
+            valid = requirement.validator_fn
+            legal, mask = [], 0
+            for i, target in enumerate(candidates):
+                if valid(game, player, target):
+                    legal.append(target)
+                    mask |= 1 << i
+            entry = self.cache[key] = (candidates, legal, mask)
+        return entry
@@ -0,0 +1,101 @@
+import random
+import unittest
+
+from swu_engine.card import Card
+from swu_engine.cardbundle import CardBundle
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.sim import DEFAULT_CARDS, new_game
+
+
+def signature(actions):
+    return [(a.description, a.move) for a in actions]
+
+
+class TestActionCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = CardDatabase(DEFAULT_CARDS)
+
+    def main_phase(self, seed):
+        game = new_game(self.db, seed)
+        tm = game.turn_manager
+        while tm.get_current_phase().name != "Main":
+            tm.next_phase()
+        return game, tm.get_current_player()
+
+    def test_matches_uncached_generation(self):
+        game = new_game(self.db, 8)
+        rng = random.Random(8)
+        tm = game.turn_manager
+        rules = game.rules
+        while not game.over and tm.round_number <= 12:
+            if tm.get_current_phase().name in ("Main", "Combat"):
+                for p in game.players:
+                    self.assertEqual(signature(rules.get_legal_actions(game, p)),
+                                     signature(rules.build_legal_actions(game, p)))
+                    self.assertEqual(signature(rules.get_response_actions(game, p)),
+                                     signature(rules.build_response_actions(game, p)))
+                player = tm.get_current_player()
+                actions = rules.get_legal_actions(game, player)
+                if actions and rng.random() < 0.8:
+                    action = rng.choice(actions)
+                    targets = {r: rules.get_attack_targets(game, player, r)[:1] for r in action.get_requirements()}
+                    if all(targets.values()):
+                        cp = game.checkpoint()
+                        action.execute(targets)
+                        if rng.random() < 0.3:
+                            game.rollback(cp)
+                        else:
+                            game.release(cp)
+                    continue
+            tm.next_phase()
+
+    def test_repeat_calls_and_partial_rebuilds(self):
+        game, player = self.main_phase(3)
+        cache = game.action_cache
+        first = game.rules.get_legal_actions(game, player)
+        builds = cache.builds
+        again = game.rules.get_legal_actions(game, player)
+        self.assertEqual(cache.builds, builds)
+        self.assertEqual(again, first)
+        self.assertTrue(all(a is b for a, b in zip(again, first)))
+
+        game.exhaust(list(player.resources)[0])   # only affordability can change
+        game.rules.get_legal_actions(game, player)
+        self.assertEqual(cache.builds, builds + 1)
+
+        game.resource_card(player, list(player.hand)[0])   # hand and resources change, arenas do not
+        self.assertEqual(signature(game.rules.get_legal_actions(game, player)),
+                         signature(game.rules.build_legal_actions(game, player)))
+        self.assertEqual(cache.builds, builds + 3)
+
+    def test_cache_holds_only_current_bundles(self):
+        game, player = self.main_phase(5)
+        cache = game.action_cache
+        discarded = []
+        for _ in range(3):
+            game.rules.get_legal_actions(game, player)
+            discarded.append(list(player.hand)[0])
+            game.discard_card_from_hand(player, discarded[-1])
+        game.rules.get_legal_actions(game, player)
+        hand = set(player.hand)
+        for (_, name), (key, actions, memo) in cache.sections.items():
+            self.assertEqual(list(memo.values()), actions)
+            if name in ("plays", "resources"):
+                self.assertTrue(set(memo) <= hand)
+        self.assertFalse(any(b in memo for b in discarded for _, _, memo in cache.sections.values()))
+
+    def test_ambush_responses(self):
+        game, player = self.main_phase(3)
+        self.assertEqual(game.rules.get_response_actions(game, player), [])
+        card = Card(name="Ambusher", back_info="Back", card_type="unit", cost=1, attack=1, health=1,
+                    keywords=["Ambush"])
+        bundle = CardBundle(card, owner_id=player.get_player_id())
+        player.get_board().move_bundle(bundle, "Hand")
+        responses = game.rules.get_response_actions(game, player)
+        self.assertEqual(signature(responses), signature(game.rules.build_response_actions(game, player)))
+        self.assertEqual([a.description for a in responses], ["Play Ambusher with Ambush"])
+
+
+if __name__ == "__main__":
+    unittest.main()
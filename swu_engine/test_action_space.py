@@ -0,0 +1,71 @@
+import random
+import unittest
+
+import numpy as np
+
+from swu_engine.action_space import ACTION_SPACE, PASS, apply_action_id, legal_action_mask
+from swu_engine.agents import FirstLegalAgent
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.playout import random_playout
+from swu_engine.sim import DEFAULT_CARDS, new_agents, new_game, play_game
+
+
+class TestActionSpace(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = CardDatabase(DEFAULT_CARDS)
+
+    def main_phase_game(self, seed):
+        game = new_game(self.db, seed)
+        play_game(game, new_agents(game, seed, FirstLegalAgent), max_rounds=3)
+        tm = game.turn_manager
+        while tm.get_current_phase().name != "Main":
+            tm.next_phase()
+        return game
+
+    def test_mask_matches_legal_actions(self):
+        for seed in range(5):
+            game = self.main_phase_game(seed)
+            player = game.turn_manager.get_current_player()
+            mask = legal_action_mask(game)
+            self.assertTrue(mask[PASS])
+
+            actions = game.rules.get_legal_actions(game, player)
+            plays = [a for a in actions if a.description.startswith("Play")]
+            resources = [a for a in actions if a.description.startswith("Resource")]
+            attack_targets = sum(len(game.rules.get_attack_targets(game, player, a.get_requirements()[0]))
+                                 for a in actions if a.description.startswith("Attack"))
+            kinds = [ACTION_SPACE.decode(i)[0] for i in np.flatnonzero(mask)]
+            self.assertEqual(kinds.count("play"), len(plays))
+            self.assertEqual(kinds.count("resource"), len(resources))
+            self.assertEqual(kinds.count("attack"), attack_targets)
+
+    def test_apply_every_legal_id(self):
+        game = self.main_phase_game(3)
+        for action_id in np.flatnonzero(legal_action_mask(game)):
+            cp = game.checkpoint()
+            self.assertEqual(apply_action_id(game, int(action_id)), action_id != PASS)
+            game.rollback(cp)
+
+    def test_illegal_id_raises(self):
+        game = self.main_phase_game(3)
+        mask = legal_action_mask(game)
+        illegal = int(np.flatnonzero(~mask)[0])
+        with self.assertRaises(ValueError):
+            apply_action_id(game, illegal)
+        with self.assertRaises(ValueError):
+            apply_action_id(game, ACTION_SPACE.size)
+
+    def test_random_playout_is_seeded(self):
+        results = []
+        for _ in range(2):
+            game = new_game(self.db, 5)
+            actions = random_playout(game, random.Random(9))
+            results.append((actions, game.winner.get_player_id() if game.winner else 0,
+                            tuple(p.base.health for p in game.players)))
+        self.assertEqual(results[0], results[1])
+        self.assertGreater(results[0][0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,7 +23,7 @@ class TestArenaPlacement(unittest.TestCase):
                 cost=0,
             )
             res_bundle = CardBundle(primary_card=res_card, owner_id=self.player.get_player_id())
-            self.player.resources.append(res_bundle)
+            self.player.get_board().move_bundle(res_bundle, "Resources")
 
     def test_ground_unit_placement(self):
         ground_card = Card(
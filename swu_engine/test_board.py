@@ -0,0 +1,129 @@
+import unittest
+
+from swu_engine.board import Board, Pile, Zone
+from swu_engine.card import Card
+from swu_engine.cardbundle import CardBundle
+from swu_engine.events import NullSink
+from swu_engine.game import Game
+from swu_engine.player import Player
+
+
+class TestBoardIndex(unittest.TestCase):
+    def setUp(self):
+        self.board = Board("board_1", 1)
+        card = Card(name="Stormtrooper", back_info="Back", token_info="", card_type="unit", cost=2)
+        self.bundle = CardBundle(primary_card=card, owner_id=1)
+
+    def test_find_zone_is_case_insensitive(self):
+        self.assertIs(self.board.find_zone("ground arena"), self.board.find_zone("Ground Arena"))
+        self.assertIsNone(self.board.find_zone("Nowhere"))
+
+    def test_location_follows_moves(self):
+        hand = self.board.find_zone("Hand")
+        ground = self.board.find_zone("Ground Arena")
+        hand.get_piles()[0].add_bundle(self.bundle)
+        self.assertIs(self.board.find_bundle_zone(self.bundle), hand)
+
+        self.assertTrue(self.board.move_to_zone(self.bundle, hand, ground))
+        self.assertEqual(self.board.locate(self.bundle), (ground, ground.get_piles()[0]))
+        self.assertNotIn(self.bundle, hand.get_piles()[0].get_bundles())
+
+        # moving from the wrong zone is refused
+        self.assertFalse(self.board.move_to_zone(self.bundle, hand, ground))
+
+        ground.get_piles()[0].remove_bundle(self.bundle)
+        self.assertIsNone(self.board.locate(self.bundle))
+
+    def test_zones_added_later_are_indexed(self):
+        pile = Pile("extra_pile")
+        pile.add_bundle(self.bundle)
+        zone = Zone("extra", 1, "Extra")
+        zone.add_pile(pile)
+        self.board.add_zone(zone)
+        self.assertIs(self.board.find_zone("extra"), zone)
+        self.assertEqual(self.board.locate(self.bundle), (zone, pile))
+
+    def test_remove_keeps_order_and_undoes(self):
+        game = Game(sinks=[NullSink()])
+        player = Player(1, "Alice")
+        game.add_player(player)
+        board = player.get_board()
+        cards = [CardBundle(Card(name=f"C{i}", back_info="Back", card_type="unit", cost=1), owner_id=1)
+                 for i in range(4)]
+        for b in cards:
+            board.move_bundle(b, "Hand")
+        pile = board.find_zone("Hand").get_piles()[0]
+        cp = game.checkpoint()
+        pile.remove_bundle(cards[3])   # last card
+        pile.remove_bundle(cards[1])
+        self.assertEqual(pile.get_bundles(), [cards[0], cards[2]])
+        self.assertIsNone(board.locate(cards[3]))
+        game.rollback(cp)
+        self.assertEqual(pile.get_bundles(), cards)
+        self.assertTrue(all(board.locate(b)[1] is pile for b in cards))
+
+
+
+class TestArenaKeywordIndex(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(sinks=[NullSink()])
+        self.player = Player(1, "Alice")
+        self.game.add_player(self.player)
+        self.board = self.player.get_board()
+        sentinel = Card(name="Wall", back_info="Back", card_type="unit", cost=2, attack=1, health=4,
+                        keywords=["Sentinel"])
+        plain = Card(name="Trooper", back_info="Back", card_type="unit", cost=1, attack=1, health=1)
+        self.wall = CardBundle(sentinel, owner_id=1)
+        self.trooper = CardBundle(plain, owner_id=1)
+        self.board.move_bundle(self.wall, "Hand")
+        self.board.move_bundle(self.trooper, "Ground Arena")
+
+    def test_index_follows_arena_moves(self):
+        self.assertFalse(self.board.has_arena_keyword("Sentinel"))
+        self.board.move_bundle(self.wall, "Space Arena")
+        self.assertTrue(self.board.has_arena_keyword("Sentinel"))
+        self.game.destroy_unit(self.wall)
+        self.assertFalse(self.board.has_arena_keyword("Sentinel"))
+
+    def test_index_follows_temp_keywords_and_rollback(self):
+        cp = self.game.checkpoint()
+        self.game.add_temp_keywords(self.trooper, ["Sentinel"])
+        self.assertTrue(self.board.has_arena_keyword("Sentinel"))
+        self.game.remove_temp_keywords(self.trooper, ["Sentinel"])
+        self.assertFalse(self.board.has_arena_keyword("Sentinel"))
+        self.game.add_temp_keywords(self.trooper, ["Sentinel"])
+        self.game.rollback(cp)
+        self.assertFalse(self.board.has_arena_keyword("Sentinel"))
+        self.assertFalse(self.trooper.has_keyword("Sentinel"))
+
+
+class TestPlayerZoneViews(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(sinks=[NullSink()])
+        self.player = Player(1, "Alice")
+        self.game.add_player(self.player)
+        card = Card(name="Stormtrooper", back_info="Back", token_info="", card_type="unit", cost=0)
+        self.bundle = CardBundle(primary_card=card, owner_id=1)
+        self.player.get_board().move_bundle(self.bundle, "Deck")
+
+    def test_views_are_read_only(self):
+        self.assertFalse(hasattr(self.player.hand, "append"))
+        self.assertFalse(hasattr(self.player.deck, "pop"))
+
+    def test_views_follow_the_board(self):
+        self.assertIn(self.bundle, self.player.deck)
+        self.game.draw_cards(self.player, 1)
+        self.assertNotIn(self.bundle, self.player.deck)
+        self.assertEqual(list(self.player.hand), [self.bundle])
+        self.assertEqual(self.player.get_board().find_bundle_zone(self.bundle).get_name(), "Hand")
+
+        self.game.play_card(self.player, self.bundle)
+        self.assertEqual(len(self.player.hand), 0)
+        self.assertEqual(self.player.get_board().find_bundle_zone(self.bundle).get_name(), "Ground Arena")
+
+        self.game.destroy_unit(self.bundle)
+        self.assertEqual(list(self.player.discard_pile), [self.bundle])
+
+
+if __name__ == "__main__":
+    unittest.main()
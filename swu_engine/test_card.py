@@ -0,0 +1,110 @@
+import pickle
+import unittest
+
+from swu_engine.card import Card
+from swu_engine.cardbundle import CardBundle
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.base import Base
+from swu_engine.events import NullSink
+from swu_engine.game import Game
+from swu_engine.player import Player
+from swu_engine.sim import DEFAULT_CARDS
+from swu_engine.vocab import ASPECTS, KEYWORDS
+
+
+class TestFlyweightCard(unittest.TestCase):
+    def setUp(self):
+        self.card = Card(name="Trooper", back_info="Back", card_type="unit", cost=2, attack=2, health=3,
+                         keywords=["Sentinel"], arenas=["Space"])
+
+    def test_card_is_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.card.attack = 5
+        self.assertEqual(self.card.keywords, ("Sentinel",))
+        self.assertEqual(self.card.get_default_arena(), "Space Arena")
+
+    def test_card_pickles(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.card)).fields(), self.card.fields())
+
+    def test_identical_printings_share_one_card(self):
+        db = CardDatabase(DEFAULT_CARDS)
+        distinct = {id(card) for card in db.cards_by_id.values()}
+        self.assertLess(len(distinct), len(db.cards_by_id))
+
+    def test_bundle_containers_are_lazy(self):
+        bundle = CardBundle(self.card, owner_id=1)
+        self.assertTrue(bundle.has_keyword("Sentinel"))
+        self.assertFalse(bundle.is_peeked_by(2))
+        self.assertIsNone(bundle._peekers)
+        bundle.peekers.add(2)
+        self.assertTrue(bundle.is_peeked_by(2))
+        self.assertEqual(bundle.upgrades, [])
+
+
+
+class TestBitmasks(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(sinks=[NullSink()])
+        self.player = Player(1, "Alice")
+        self.game.add_player(self.player)
+
+    def card(self, name, **kwargs):
+        return Card(name=name, back_info="Back", card_type="unit", cost=2, attack=1, health=1, **kwargs)
+
+    def test_keyword_masks(self):
+        bundle = CardBundle(self.card("Wall", keywords=["Sentinel"]), owner_id=1)
+        either = KEYWORDS.mask(["Sentinel", "Overwhelm"])
+        self.assertTrue(bundle.has_any_keyword(either))
+        self.assertFalse(bundle.has_keyword("Overwhelm"))
+        self.game.add_temp_keywords(bundle, ["Overwhelm"])
+        self.assertEqual(bundle.temp_keywords, ("Overwhelm",))
+        self.assertEqual(bundle.effective_keywords(), either)
+
+    def test_aspect_masks(self):
+        card = self.card("A", aspects=["Vigilance", "Heroism", "Heroism"])
+        self.assertEqual(card.aspect_mask, ASPECTS.mask(["Vigilance", "Heroism"]))
+        self.assertEqual(card.double_aspect_mask, ASPECTS.bit("Heroism"))
+        self.assertEqual(self.card("B", aspects=["Villainy"]).double_aspect_mask, 0)
+
+    def test_search_by_trait(self):
+        pilot = CardBundle(self.card("Pilot", traits=["PILOT", "REBEL"]), owner_id=1)
+        droid = CardBundle(self.card("Droid", traits=["DROID"]), owner_id=1)
+        for bundle in (pilot, droid):
+            self.player.get_board().move_bundle(bundle, "Deck")
+        action = self.game.rules.create_search_action(self.game, self.player, traits=["PILOT"])
+        req = action.get_requirements()[0]
+        self.assertEqual([b for b in self.player.deck if req.validator_fn(self.game, self.player, b)], [pilot])
+
+
+class TestAspectPenalty(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(sinks=[NullSink()])
+        self.player = Player(1, "Alice")
+        self.game.add_player(self.player)
+        self.player.leader = CardBundle(self.card("Leader", aspects=["Vigilance", "Villainy"]), owner_id=1)
+        self.player.base = Base("Base", 30, self.card("Base", aspects=["Vigilance"]))
+
+    def card(self, name, **kwargs):
+        return Card(name=name, back_info="Back", card_type="unit", cost=2, attack=1, health=1, **kwargs)
+
+    def test_penalty_per_missing_icon(self):
+        cost = self.game.rules.apply_aspect_penalty
+        self.assertEqual(cost(self.player, self.card("A", aspects=["Vigilance", "Vigilance"])), 2)
+        self.assertEqual(cost(self.player, self.card("B", aspects=["Villainy", "Villainy"])), 4)
+        self.assertEqual(cost(self.player, self.card("C", aspects=["Heroism"])), 4)
+        self.assertEqual(cost(self.player, self.card("D")), 2)
+
+    def test_payment_includes_penalty(self):
+        for i in range(3):
+            self.player.get_board().move_bundle(CardBundle(self.card(f"R{i}"), owner_id=1), "Resources")
+        matching = self.card("A", aspects=["Vigilance"])
+        off_aspect = self.card("C", aspects=["Heroism"])
+        self.assertTrue(self.player.can_pay_for(self.game, matching))
+        self.assertFalse(self.player.can_pay_for(self.game, off_aspect))
+        self.assertFalse(self.player.pay_for(self.game, off_aspect))
+        self.assertTrue(self.player.pay_for(self.game, matching))
+        self.assertEqual(sum(b.exhausted for b in self.player.resources), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+
+from swu_engine import deck_loader
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.sim import DEFAULT_CARDS
+
+
+class TestCardDatabaseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.tmp, "cards.csv")
+        self.write_csv(20)
+        self.cache_path = deck_loader.default_cache_path(self.csv_path)
+
+    def write_csv(self, n_cards: int):
+        with open(DEFAULT_CARDS, newline="", encoding="utf-8") as src:
+            rows = list(csv.reader(src))[:n_cards + 1]
+        with open(self.csv_path, "w", newline="", encoding="utf-8") as dst:
+            csv.writer(dst).writerows(rows)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_snapshot_matches_csv(self):
+        cached = CardDatabase(self.csv_path)
+        self.assertTrue(os.path.exists(self.cache_path))
+        reloaded = CardDatabase(self.csv_path)
+        parsed = CardDatabase(self.csv_path, use_cache=False)
+        self.assertEqual(list(reloaded.cards_by_id), list(parsed.cards_by_id))
+        for card_id, card in parsed.cards_by_id.items():
+            self.assertEqual(reloaded.get_card(card_id).fields(), card.fields())
+        self.assertEqual(len(cached.cards_by_id), 20)
+
+    def test_stale_snapshot_is_rebuilt(self):
+        CardDatabase(self.csv_path)
+        self.write_csv(10)
+        self.assertEqual(len(CardDatabase(self.csv_path).cards_by_id), 10)
+
+    def test_corrupt_snapshot_is_ignored(self):
+        with open(self.cache_path, "wb") as f:
+            f.write(b"garbage")
+        self.assertEqual(len(CardDatabase(self.csv_path).cards_by_id), 20)
+
+    def test_damaged_snapshot_body_is_rebuilt(self):
+        CardDatabase(self.csv_path)
+        with open(self.cache_path, "rb") as f:
+            data = f.read()
+        digest = deck_loader.csv_digest(self.csv_path)
+        header = deck_loader._HEADER.size
+        bodies = [data[header:header + 40],                                   # truncated
+                  b"garbage" * 10,                                            # not a pickle
+                  b"cmissing_module\nCard\n."]                                # missing module
+        for body in bodies:
+            with open(self.cache_path, "wb") as f:
+                f.write(data[:header] + body)
+            self.assertEqual(len(CardDatabase(self.csv_path).cards_by_id), 20)
+            self.assertIsNotNone(deck_loader.read_cache(self.cache_path, digest))   # rewritten
+
+
+if __name__ == "__main__":
+    unittest.main()
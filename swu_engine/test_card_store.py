@@ -0,0 +1,53 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from swu_engine.card_store import CardStore, default_store_path
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.sim import DEFAULT_CARDS, run_game
+
+
+class TestCardStore(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = CardDatabase(DEFAULT_CARDS)
+        cls.store = CardStore(DEFAULT_CARDS)
+
+    def test_views_match_card_database(self):
+        self.assertEqual(list(self.store.cards_by_id), list(self.db.cards_by_id))
+        for card_id, card in self.db.cards_by_id.items():
+            view = self.store.get_card(card_id)
+            for attr in ("name", "cost", "attack", "health", "card_type", "arenas", "back_info"):
+                self.assertEqual(getattr(view, attr), getattr(card, attr), (card_id, attr))
+            self.assertEqual(view.keywords, card.keywords)
+            self.assertEqual(view.get_default_arena(), card.get_default_arena())
+
+    def test_extra_columns_and_interning(self):
+        view = self.store.get_card("JTL-320")
+        self.assertEqual(view.traits, ("IMPERIAL", "PILOT"))
+        self.assertTrue(view.front_text.startswith("Sentinel"))
+        self.assertIs(self.store.get_card("JTL-320"), view)
+        self.assertIsNone(self.store.get_card("missing"))
+
+    def test_store_rebuilt_when_csv_changes(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            csv_path = os.path.join(tmp, "cards.csv")
+            shutil.copy(DEFAULT_CARDS, csv_path)
+            self.assertEqual(len(CardStore(csv_path)), len(self.db.cards_by_id))
+            with open(DEFAULT_CARDS, encoding="utf-8") as f:
+                header = f.readline()
+            with open(csv_path, "w", encoding="utf-8") as f:
+                f.write(header)
+            self.assertEqual(len(CardStore(csv_path)), 0)
+            self.assertTrue(os.path.exists(default_store_path(csv_path)))
+        finally:
+            shutil.rmtree(tmp)
+
+    def test_same_game_as_card_database(self):
+        self.assertEqual(run_game(self.store, 0, seed=3)[:5], run_game(self.db, 0, seed=3)[:5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import random
+import unittest
+
+from swu_engine.card import Card
+from swu_engine.cardbundle import CardBundle
+from swu_engine.deck_loader import Deck
+from swu_engine.events import NullSink
+from swu_engine.game import Game
+from swu_engine.player import Player
+
+
+class TestDeckOperations(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(sinks=[NullSink()])
+        self.player = Player(1, "Alice")
+        self.game.add_player(self.player)
+        self.bundles = []
+        for i in range(10):
+            card = Card(name=f"Card{i}", back_info="Back", token_info="", card_type="unit", cost=1)
+            bundle = CardBundle(primary_card=card, owner_id=1)
+            self.bundles.append(bundle)
+            self.player.get_board().move_bundle(bundle, "Deck")
+
+    def test_bulk_draw_takes_from_top(self):
+        self.game.draw_cards(self.player, 3)
+        self.assertEqual(list(self.player.hand), self.bundles[:3])
+        self.assertEqual(list(self.player.deck), self.bundles[3:])
+        self.assertEqual(self.player.get_board().find_bundle_zone(self.bundles[0]).get_name(), "Hand")
+
+    def test_bulk_mill_and_reveal(self):
+        self.assertEqual(self.game.reveal_top(self.player, 2), self.bundles[:2])
+        self.assertEqual(len(self.player.deck), 10)
+        self.game.mill_cards(self.player, 20)
+        self.assertEqual(list(self.player.discard_pile), self.bundles)
+        self.assertEqual(len(self.player.deck), 0)
+
+    def test_seeded_shuffle_is_reproducible(self):
+        deck_pile = self.player.get_board().deck_pile()
+        deck_pile.shuffle(random.Random(5))
+        first = list(self.player.deck)
+        other = Deck(1)
+        for b in self.bundles:
+            other.cards.append(b)
+        other.shuffle(random.Random(5))
+        self.assertEqual(first, list(other.cards))
+        self.assertEqual(other.draw(2), first[:2])
+        self.assertEqual(len(other), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.env import SWUEnv, VecEnv
+from swu_engine.sim import DEFAULT_CARDS
+
+
+def random_actions(rng, masks):
+    return [rng.choice(np.flatnonzero(mask)) for mask in masks]
+
+
+class TestEnv(unittest.TestCase):
+    def test_episode_ends_with_reward(self):
+        env = SWUEnv(CardDatabase(DEFAULT_CARDS), seed=1)
+        obs, info = env.reset()
+        self.assertEqual(obs.shape, (env.encoder.size,))
+        rng = np.random.default_rng(1)
+        done, steps = False, 0
+        while not done:
+            self.assertTrue(info["mask"][1:].any())
+            obs, reward, done, info = env.step(int(rng.choice(np.flatnonzero(info["mask"]))))
+            steps += 1
+        self.assertGreater(steps, 10)
+        if info["winner"]:
+            self.assertEqual(abs(reward), 1.0)
+
+    def run_vec(self, workers, steps=60):
+        rng = np.random.default_rng(0)
+        with VecEnv(DEFAULT_CARDS, 6, seed=2, workers=workers) as venv:
+            obs, masks = venv.reset()
+            finished, total = 0, []
+            for _ in range(steps):
+                obs, rewards, dones, masks, info = venv.step(random_actions(rng, masks))
+                finished += int(dones.sum())
+                total.append(float(obs.sum()))
+            self.assertEqual(obs.shape, (6, venv.arrays["obs"].shape[1]))
+            self.assertTrue(masks[:, 0].all())
+            return finished, total
+
+    def test_vec_env_auto_resets(self):
+        finished, _ = self.run_vec(1, steps=150)
+        self.assertGreater(finished, 0)
+
+    def test_sharded_matches_in_process(self):
+        self.assertEqual(self.run_vec(2), self.run_vec(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import io
+import unittest
+
+from swu_engine.card import Card
+from swu_engine.cardbundle import CardBundle
+from swu_engine.events import EventType, ListSink, NullSink, TextSink
+from swu_engine.game import Game
+from swu_engine.player import Player
+from swu_engine.token import Token
+
+
+class TestEventBus(unittest.TestCase):
+    def _game(self, sinks):
+        game = Game(sinks=sinks)
+        player = Player(1, "Alice")
+        game.add_player(player)
+        for i in range(3):
+            card = Card(name=f"Card{i}", back_info="Back", token_info="", card_type="unit", cost=1)
+            player.get_board().move_bundle(CardBundle(primary_card=card, owner_id=1), "Deck")
+        return game, player
+
+    def test_events_are_structured_records(self):
+        sink = ListSink()
+        game, player = self._game([sink])
+        game.draw_cards(player, 2)
+        game.discard_card_from_hand(player, player.hand[0])
+        draws = [e for e in sink.events if e.type == EventType.DRAW]
+        self.assertEqual(len(draws), 1)  # bulk draw is one event
+        self.assertEqual(draws[0].player_id, 1)
+        self.assertEqual(draws[0].amount, 2)
+        discard = next(e for e in sink.events if e.type == EventType.DISCARD)
+        self.assertEqual(discard.bundle_id, draws[0].subject[0].bundle_id)
+
+    def test_text_sink_keeps_console_messages(self):
+        out = io.StringIO()
+        game, player = self._game([])
+        game.events.add_sink(TextSink(game, stream=out))
+        game.draw_cards(player, 2)
+        self.assertEqual(out.getvalue(), "Alice draws Card0.\nAlice draws Card1.\n")
+
+    def test_null_sink_keeps_bus_inactive(self):
+        game, player = self._game([NullSink()])
+        self.assertFalse(game.events.active)
+        game.draw_cards(player, 3)
+        self.assertEqual(len(player.hand), 3)
+
+    def test_rules_helpers_emit_instead_of_printing(self):
+        sink = ListSink()
+        game, player = self._game([sink])
+        game.rules.create_token_action(player, Token(token_info="Clone Trooper", attack=1, health=1,
+                                                     arenas=["Ground"])).execute({})
+        bundle = player.deck[0]
+        cp = game.checkpoint()
+        game.rules.grant_peek_permission(player, bundle)
+        self.assertTrue(bundle.is_peeked_by(1))
+        self.assertEqual([e.type for e in sink.events], [EventType.TOKEN_ENTERS, EventType.PEEK])
+        game.rollback(cp)
+        self.assertFalse(bundle.is_peeked_by(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+
+from swu_engine.agents import FirstLegalAgent
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.sim import DEFAULT_CARDS, new_game, play_game
+from swu_engine.vocab import KEYWORDS
+
+
+def board_layout(game):
+    return [
+        [(zone.get_name(), [(b.bundle_id, b.damage, b.exhausted, b.attack_buff, b.health_buff, sorted(b.temp_keywords))
+                            for pile in zone.get_piles() for b in pile.get_bundles()])
+         for zone in p.get_board().get_zones()]
+        + [p.base.health, p.resources_played_this_turn, p.top_deck_revealed]
+        for p in game.players
+    ] + [game.turn_manager.get_position(), game.over, len(game.scheduler)]
+
+
+def finish(game):
+    agents = {p.get_player_id(): FirstLegalAgent() for p in game.players}
+    play_game(game, agents)
+    return game.winner.get_player_id() if game.winner else 0, game.turn_manager.round_number, board_layout(game)
+
+
+class TestGameState(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = CardDatabase(DEFAULT_CARDS)
+
+    def midgame(self):
+        game = new_game(self.db, seed=4)
+        agents = {p.get_player_id(): FirstLegalAgent() for p in game.players}
+        play_game(game, agents, max_rounds=2)
+        self.assertFalse(game.over)
+        return game
+
+    def assertKeywordIndex(self, game):
+        for p in game.players:
+            board = p.get_board()
+            recount = {}
+            for b, (zone, _) in board.locations.items():
+                if zone.is_arena:
+                    for kw in KEYWORDS.names(b.effective_keywords()):
+                        recount[KEYWORDS.bit(kw)] = recount.get(KEYWORDS.bit(kw), 0) + 1
+            self.assertEqual({k: v for k, v in board.arena_keywords.items() if v}, recount)
+
+    def test_clone_is_independent(self):
+        game = self.midgame()
+        before = board_layout(game)
+        clone = game.clone()
+        self.assertEqual(board_layout(clone), before)
+        self.assertIsNot(clone.players[0].hand[0], game.players[0].hand[0])
+        self.assertIs(clone.players[0].hand[0].primary_card, game.players[0].hand[0].primary_card)
+
+        clone_result = finish(clone)
+        self.assertEqual(board_layout(game), before)
+        self.assertEqual(finish(game), clone_result)
+
+    def test_restore_replays_identically(self):
+        game = self.midgame()
+        before = board_layout(game)
+        snap = game.snapshot()
+        first = finish(game)
+        game.restore(snap)
+        self.assertEqual(board_layout(game), before)
+        self.assertFalse(game.over)
+        self.assertEqual(finish(game), first)
+
+    def test_restore_rebuilds_arena_keywords(self):
+        game = self.midgame()
+        player, unit = next((p, b) for p in game.players for b, (zone, _) in p.get_board().locations.items()
+                            if zone.is_arena and not b.has_keyword("Sentinel"))
+        had_sentinel = player.get_board().has_arena_keyword("Sentinel")
+        snap = game.snapshot()
+        game.add_temp_keywords(unit, ["Sentinel"])
+        game.restore(snap)
+        self.assertEqual(player.get_board().has_arena_keyword("Sentinel"), had_sentinel)
+        self.assertKeywordIndex(game)
+        self.assertKeywordIndex(game.clone())
+
+    def test_rollback_undoes_rest_of_game(self):
+        game = self.midgame()
+        before = board_layout(game)
+        self.assertFalse(game.journal.recording)
+        cp = game.checkpoint()
+        first = finish(game)
+        self.assertTrue(game.over)
+        game.rollback(cp)
+        self.assertEqual(board_layout(game), before)
+        self.assertFalse(game.journal.recording)
+        self.assertKeywordIndex(game)
+        self.assertEqual(finish(game), first)
+
+    def test_nested_checkpoints(self):
+        game = self.midgame()
+        before = board_layout(game)
+        outer = game.checkpoint()
+        unit = game.players[0].hand[0]
+        game.modify_stats(unit, 2, 2)
+        game.add_temp_keywords(unit, ["Sentinel"])
+        after_buff = board_layout(game)
+        inner = game.checkpoint()
+        game.exhaust(unit)
+        game.draw_cards(game.players[0], 3)
+        game.shuffle_deck(game.players[1])
+        game.rollback(inner)
+        self.assertEqual(board_layout(game), after_buff)
+        self.assertTrue(game.journal.recording)
+        game.rollback(outer)
+        self.assertEqual(board_layout(game), before)
+        self.assertEqual(unit.temp_keywords, ())
+
+    def test_back_to_back_checkpoints(self):
+        game = self.midgame()
+        before = board_layout(game)
+        unit = game.players[0].hand[0]
+        outer = game.checkpoint()
+        inner = game.checkpoint()
+        game.rollback(inner)
+        self.assertEqual(len(game.journal.marks), 1)
+        self.assertTrue(game.journal.recording)
+        game.modify_stats(unit, 3, 3)
+        child = game.checkpoint()
+        game.release(child)
+        game.rollback(outer)
+        self.assertEqual(board_layout(game), before)
+        self.assertFalse(game.journal.recording)
+
+
+if __name__ == "__main__":
+    unittest.main()
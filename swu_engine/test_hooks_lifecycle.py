@@ -3,6 +3,7 @@ from swu_engine.game import Game
 from swu_engine.player import Player
 from swu_engine.card import Card
 from swu_engine.cardbundle import CardBundle
+from swu_engine.hooks import HookRegistry
 
 
 class TestHooksLifecycle(unittest.TestCase):
@@ -17,8 +18,8 @@ class TestHooksLifecycle(unittest.TestCase):
         for i in range(5):
             c1 = Card(name=f"AliceCard{i}", back_info="Back", token_info="", card_type="unit", cost=1, arenas=["Ground"])
             c2 = Card(name=f"BobCard{i}", back_info="Back", token_info="", card_type="unit", cost=1, arenas=["Ground"])
-            self.player1.hand.append(CardBundle(primary_card=c1, owner_id=self.player1.player_id))
-            self.player2.hand.append(CardBundle(primary_card=c2, owner_id=self.player2.player_id))
+            self.player1.get_board().move_bundle(CardBundle(primary_card=c1, owner_id=self.player1.player_id), "Hand")
+            self.player2.get_board().move_bundle(CardBundle(primary_card=c2, owner_id=self.player2.player_id), "Hand")
 
     def test_mulligan_and_ready_leaders(self):
         self.game.turn_manager.next_phase()  # triggers start_of_round
@@ -36,8 +37,38 @@ class TestHooksLifecycle(unittest.TestCase):
     def test_enforce_hand_limit(self):
         for i in range(5):
             c = Card(name=f"Extra{i}", back_info="Back", token_info="", card_type="unit", cost=1, arenas=["Ground"])
-            self.player1.hand.append(CardBundle(primary_card=c, owner_id=self.player1.player_id))
+            self.player1.get_board().move_bundle(CardBundle(primary_card=c, owner_id=self.player1.player_id), "Hand")
 
         self.game.turn_manager.phase_index = len(self.game.phases) - 1  # jump to End
         self.game.turn_manager.next_phase()  # triggers end_of_turn
         self.assertLessEqual(len(self.player1.hand), 7)
+
+
+class TestHookRegistry(unittest.TestCase):
+    def test_priority_and_registration_order(self):
+        calls = []
+        registry = HookRegistry()
+        registry.register("b", lambda *_: calls.append("b"), "end_of_round")
+        registry.register("c", lambda *_: calls.append("c"), "end_of_round")
+        registry.register("a", lambda *_: calls.append("a"), "end_of_round", priority=-1)
+        for fn in registry.get("end_of_round"):
+            fn()
+        self.assertEqual(calls, ["a", "b", "c"])
+        self.assertEqual(registry.get("start_of_turn"), ())
+
+    def test_disable_recompiles(self):
+        registry = HookRegistry()
+        registry.register("x", print, "start_of_turn")
+        registry.disable("x")
+        self.assertEqual(registry.get("start_of_turn"), ())
+        registry.enable("x")
+        self.assertEqual(registry.get("start_of_turn"), (print,))
+
+    def test_games_do_not_share_hooks(self):
+        game_a, game_b = Game(sinks=[]), Game(sinks=[])
+        game_a.hooks.disable("draw_at_start_of_turn")
+        self.assertTrue(game_b.hooks.is_enabled("draw_at_start_of_turn"))
+
+        clone = game_a.clone()
+        clone.hooks.enable("draw_at_start_of_turn")
+        self.assertFalse(game_a.hooks.is_enabled("draw_at_start_of_turn"))
@@ -0,0 +1,65 @@
+import random
+import unittest
+
+from swu_engine.agents import RandomAgent
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.mcts import MCTSAgent, determinize
+from swu_engine.sim import DEFAULT_CARDS, new_game, play_game
+from swu_engine.zobrist import TranspositionTable
+
+
+def names(bundles):
+    return sorted(b.primary_card.name for b in bundles)
+
+
+class TestMCTS(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = CardDatabase(DEFAULT_CARDS)
+
+    def test_determinize_keeps_known_information(self):
+        game = new_game(self.db, 4)
+        me, opp = game.players
+        state = determinize(game, me.get_player_id(), random.Random(0))
+        me2, opp2 = state.players
+        self.assertEqual([b.primary_card.name for b in me2.hand], [b.primary_card.name for b in me.hand])
+        self.assertEqual(names(me2.deck), names(me.deck))
+        self.assertEqual((len(opp2.hand), len(opp2.deck)), (len(opp.hand), len(opp.deck)))
+        self.assertEqual(names(list(opp2.hand) + list(opp2.deck)), names(list(opp.hand) + list(opp.deck)))
+        self.assertEqual(names(opp.hand), names(game.players[1].hand))   # original untouched
+
+    def test_agent_plays_a_game_and_reports(self):
+        game = new_game(self.db, 9)
+        agent = MCTSAgent(rng=random.Random(1), time_budget=1.0, max_simulations=8)
+        play_game(game, {1: agent, 2: RandomAgent(rng=random.Random(2))})
+        self.assertTrue(game.over or game.turn_manager.round_number > 60)
+        self.assertTrue(agent.history)
+        for move in agent.history:
+            self.assertEqual(move["simulations"], 8)
+            self.assertGreater(move["tree_nodes"], 1)
+            self.assertGreater(move["sims_per_sec"], 0)
+
+    def test_root_parallel_merges_workers(self):
+        game = new_game(self.db, 5)
+        tm = game.turn_manager
+        while tm.get_current_phase().name != "Main":
+            tm.next_phase()
+        agent = MCTSAgent(rng=random.Random(3), time_budget=1.0, workers=2, max_simulations=4)
+        agent.search(game, tm.get_current_player())
+        if agent.workers == 2:
+            self.assertEqual(agent.history[-1]["simulations"], 8)
+
+    def test_transposition_table_collects_leaves(self):
+        game = new_game(self.db, 5)
+        tm = game.turn_manager
+        while tm.get_current_phase().name != "Main":
+            tm.next_phase()
+        table = TranspositionTable(1024)
+        agent = MCTSAgent(rng=random.Random(4), time_budget=1.0, max_simulations=20, table=table)
+        agent.search(game, tm.get_current_player())
+        self.assertGreater(len(table), 0)
+        self.assertIsNone(game.journal.hasher)   # the search hashes its own clone
+
+
+if __name__ == "__main__":
+    unittest.main()
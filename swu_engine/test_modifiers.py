@@ -0,0 +1,98 @@
+import unittest
+
+from swu_engine.card import Card
+from swu_engine.cardbundle import CardBundle
+from swu_engine.events import NullSink
+from swu_engine.game import Game
+from swu_engine.hooks import HookRegistry
+from swu_engine.modifiers import LAYER_ABILITY, LAYER_LASTING, LAYER_SET, Modifier
+from swu_engine.player import Player
+
+
+class TestModifiers(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(sinks=[NullSink()], hooks=HookRegistry())
+        self.alice, self.bob = Player(1, "Alice"), Player(2, "Bob")
+        self.game.add_player(self.alice)
+        self.game.add_player(self.bob)
+        card = Card(name="Trooper", back_info="Back", card_type="unit", cost=1, attack=2, health=3,
+                    keywords=["Raid"])
+        self.unit = CardBundle(card, owner_id=1)
+        self.other = CardBundle(card, owner_id=1)
+        board = self.alice.get_board()
+        board.move_bundle(self.unit, "Ground Arena")
+        board.move_bundle(self.other, "Ground Arena")
+
+    def stats(self, bundle):
+        return bundle.effective_attack(), bundle.effective_health(), bundle.has_keyword("Sentinel")
+
+    def test_layers_apply_in_order(self):
+        game, unit = self.game, self.unit
+        game.add_modifier(unit, Modifier(LAYER_LASTING, attack=1))
+        game.add_modifier(unit, Modifier(LAYER_SET, set_attack=5, set_health=1))
+        game.modify_stats(unit, health=2)
+        self.assertEqual(self.stats(unit), (6, 3, False))
+        game.add_modifier(unit, Modifier(LAYER_ABILITY, attack=-9, keywords=["Sentinel"], remove_keywords=["Raid"]))
+        self.assertEqual(self.stats(unit), (0, 3, True))
+        self.assertFalse(unit.has_keyword("Raid"))
+        self.assertTrue(self.alice.get_board().has_arena_keyword("Sentinel"))
+
+    def test_only_the_affected_bundle_is_invalidated(self):
+        self.unit.effective_attack(), self.other.effective_attack()
+        before, cached = self.unit._stats, self.other._stats
+        self.game.add_modifier(self.unit, Modifier(attack=2))
+        self.assertIsNot(self.unit._stats, before)
+        self.assertIs(self.other._stats, cached)
+        self.assertEqual(self.unit.effective_attack(), 4)
+
+    def test_lasting_modifier_expires_and_rolls_back(self):
+        game, unit = self.game, self.unit
+        cp = game.checkpoint()
+        game.add_lasting_modifier(unit, Modifier(attack=3, keywords=["Sentinel"]), "phase")
+        self.assertEqual(self.stats(unit), (5, 3, True))
+        game.turn_manager.next_phase()
+        self.assertEqual(self.stats(unit), (2, 3, False))
+        game.rollback(cp)
+        self.assertEqual(self.stats(unit), (2, 3, False))
+        self.assertEqual(unit.modifiers, ())
+        self.assertFalse(self.alice.get_board().has_arena_keyword("Sentinel"))
+
+    def test_upgrades(self):
+        game, unit = self.game, self.unit
+        card = Card(name="Armor", back_info="Back", card_type="upgrade", cost=2, attack=1, health=2,
+                    keywords=["Sentinel"])
+        upgrade = CardBundle(card, owner_id=1)
+        self.alice.get_board().move_bundle(upgrade, "Hand")
+        game.attach_upgrade(unit, upgrade)
+        self.assertNotIn(upgrade, self.alice.hand)
+        self.assertEqual(self.stats(unit), (3, 5, True))
+        self.assertEqual(self.stats(game.clone().players[0].get_board().find_zone("Ground Arena")
+                                    .get_piles()[0].get_bundles()[0]), (3, 5, True))
+        game.detach_upgrade(unit, upgrade)
+        self.assertEqual(self.stats(unit), (2, 3, False))
+        self.assertIn(upgrade, self.alice.discard_pile)
+
+    def test_clone_remaps_upgrades(self):
+        game, unit = self.game, self.unit
+        card = Card(name="Armor", back_info="Back", card_type="upgrade", cost=2, attack=1, health=2,
+                    keywords=["Sentinel"])
+        upgrade = CardBundle(card, owner_id=1)
+        self.alice.get_board().move_bundle(upgrade, "Hand")
+        game.attach_upgrade(unit, upgrade)
+        game.register_delayed_effect("phase", Game.detach_upgrade, target_bundle=unit, upgrade_bundle=upgrade)
+        game.add_lasting_modifier(self.other, Modifier(attack=1, source=upgrade), "phase")
+
+        clone = game.clone()
+        unit_copy, other_copy = clone.players[0].get_board().find_zone("Ground Arena").get_piles()[0].get_bundles()
+        upgrade_copy = unit_copy.upgrades[0]
+        self.assertIsNot(upgrade_copy, upgrade)
+        self.assertTrue(all(m.source is upgrade_copy for m in unit_copy.modifiers + other_copy.modifiers))
+        clone.turn_manager.next_phase()
+        self.assertEqual((self.stats(unit_copy), self.stats(other_copy)), ((2, 3, False), (2, 3, False)))
+        self.assertIn(upgrade_copy, clone.players[0].discard_pile)
+        self.assertEqual((self.stats(unit), self.stats(self.other)), ((3, 5, True), (3, 3, False)))
+        self.assertEqual(unit.upgrades, [upgrade])
+
+
+if __name__ == "__main__":
+    unittest.main()
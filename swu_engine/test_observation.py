@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+
+from swu_engine.agents import FirstLegalAgent
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.observation import PLAYER_FEATURES, ObservationEncoder
+from swu_engine.sim import DEFAULT_CARDS, new_agents, new_game, play_game
+from swu_engine.vocab import KEYWORDS
+
+
+class TestObservationEncoder(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = CardDatabase(DEFAULT_CARDS)
+        cls.encoder = ObservationEncoder(cls.db)
+
+    def midgame(self, seed):
+        game = new_game(self.db, seed)
+        play_game(game, new_agents(game, seed, FirstLegalAgent), max_rounds=3)
+        return game
+
+    def test_hidden_information(self):
+        game = self.midgame(1)
+        alice, bob = game.players
+        fields = self.encoder.fields(self.encoder.encode(game, alice))
+        hands = fields["hands"]
+        self.assertEqual(np.count_nonzero(hands[0]), min(len(alice.hand), self.encoder.hand_slots))
+        self.assertEqual(np.count_nonzero(hands[1]), 0)
+        self.assertEqual(fields["players"][1][PLAYER_FEATURES.index("hand")], len(bob.hand))
+        self.assertEqual(fields["players"][0][PLAYER_FEATURES.index("base_hp")], alice.base.health)
+        self.assertFalse(game.rules.can_player_see(alice, bob.hand[0], game))
+        self.assertTrue(game.rules.can_player_see(bob, bob.hand[0], game))
+
+    def test_units_and_keywords(self):
+        game = self.midgame(2)
+        alice = game.players[0]
+        unit = next(b for b in alice.get_board().find_zone("Ground Arena").get_piles()[0].get_bundles())
+        game.add_temp_keywords(unit, ["Sentinel"])
+        units = self.encoder.fields(self.encoder.encode(game, alice))["units"]
+        slot = units[0, 0, 0]
+        self.assertEqual(slot[0], self.encoder.card_index[unit.primary_card])
+        self.assertEqual(list(slot[1:4]), [unit.effective_attack(), unit.effective_health(), unit.damage])
+        self.assertEqual(slot[5 + KEYWORDS.bit("Sentinel").bit_length() - 1], 1)
+
+    def test_batch_matches_single(self):
+        games = [self.midgame(seed) for seed in range(4)]
+        viewers = [1, 2, 1, 2]
+        batch = self.encoder.encode_batch(games, viewers)
+        batch = self.encoder.encode_batch(games, viewers, batch)   # reuse must clear old values
+        for i, game in enumerate(games):
+            single = self.encoder.encode(game, game.get_player_by_id(viewers[i]))
+            np.testing.assert_array_equal(batch[i], single)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.game_log import LOG_SUFFIX, GameLog
+from swu_engine.replay import Replayer, replay_files
+from swu_engine.sim import DEFAULT_CARDS, run_game
+
+
+def layout(game):
+    """Board contents by card name (bundle ids differ between separately built games)."""
+    return [[(zone.get_name(), [(b.primary_card.name, b.damage, b.exhausted)
+                                for pile in zone.get_piles() for b in pile.get_bundles()])
+             for zone in p.get_board().get_zones()] + [p.base.health]
+            for p in game.players] + [game.turn_manager.get_position()]
+
+
+class TestReplay(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = CardDatabase(DEFAULT_CARDS)
+        cls.record = run_game(cls.db, 0, seed=11, record=True)
+        cls.log = GameLog.from_bytes(cls.record.log)
+
+    def test_round_trip(self):
+        self.assertLess(len(self.record.log), 4096)
+        self.assertEqual(self.log.to_bytes(), self.record.log)
+        self.assertEqual(self.log.seed, 11)
+        self.assertEqual(self.log.count_actions(), self.record.actions)
+        self.assertEqual(self.log.winner, self.record.winner)
+        with self.assertRaises(ValueError):
+            GameLog.from_bytes(b"NOTLOG" + self.record.log[6:])
+
+    def test_replay_reproduces_game(self):
+        replayer = Replayer(self.db, self.log)
+        self.assertTrue(replayer.verify())
+        self.assertEqual(tuple(p.base.health for p in replayer.game.players), self.record.base_hp)
+
+    def test_seek_from_checkpoints(self):
+        replayer = Replayer(self.db, self.log, checkpoint_every=5)
+        replayer.run()
+        self.assertGreater(len(replayer.checkpoints), 2)
+        for n in (0, 7, self.record.actions // 2, self.record.actions - 1):
+            fresh = Replayer(self.db, self.log).seek(n)
+            self.assertEqual(layout(replayer.seek(n)), layout(fresh), n)
+
+    def test_bad_logs_are_counted_not_raised(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        tampered = GameLog.from_bytes(self.record.log)
+        i = next(i for i, d in enumerate(tampered.decisions) if d is not None)
+        tampered.decisions[i] = (99, ())
+        blobs = [self.record.log, tampered.to_bytes(), self.record.log[:40], self.record.log]
+        paths = []
+        for n, blob in enumerate(blobs):
+            paths.append(os.path.join(tmp, f"{n}{LOG_SUFFIX}"))
+            with open(paths[-1], "wb") as f:
+                f.write(blob)
+        with self.assertRaises(ValueError):
+            GameLog.load(paths[2])
+        self.assertEqual(replay_files(paths, workers=1), [True, False, False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from swu_engine.card import Card
+from swu_engine.cardbundle import CardBundle
+from swu_engine.events import NullSink
+from swu_engine.game import Game
+from swu_engine.hooks import HookRegistry
+from swu_engine.player import Player
+
+
+class TestDelayedEffects(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(sinks=[NullSink()], hooks=HookRegistry())   # no draws or discards, only the phase clock
+        self.alice, self.bob = Player(1, "Alice"), Player(2, "Bob")
+        self.game.add_player(self.alice)
+        self.game.add_player(self.bob)
+        card = Card(name="Trooper", back_info="Back", card_type="unit", cost=1, attack=2, health=2)
+        self.unit = CardBundle(card, owner_id=1)
+        self.alice.get_board().move_bundle(self.unit, "Ground Arena")
+
+    def buff(self, duration):
+        action = self.game.rules.create_buff_action(self.game, self.alice, 2, 0, ["Sentinel"], duration_phase=duration)
+        action.execute({action.get_requirements()[0]: [self.unit]})
+
+    def steps_until_expired(self):
+        steps = 0
+        while self.unit.attack_buff:
+            self.game.turn_manager.next_phase()
+            steps += 1
+        return steps
+
+    def test_durations(self):
+        phases = len(self.game.phases)
+        self.buff("phase")
+        self.assertEqual(self.steps_until_expired(), 1)
+        self.buff("turn")
+        self.assertEqual(self.steps_until_expired(), phases - 1)
+        self.buff("round")   # now at the start of Bob's turn, the last of the round
+        self.assertEqual(self.steps_until_expired(), phases)
+        self.assertFalse(self.unit.has_keyword("Sentinel"))
+        self.assertFalse(self.alice.get_board().has_arena_keyword("Sentinel"))
+        self.assertEqual(len(self.game.scheduler), 0)
+
+    def test_phase_name_wraps_to_next_turn(self):
+        self.game.turn_manager.phase_index = 2   # Combat
+        self.buff("Main")
+        self.assertEqual(self.steps_until_expired(), len(self.game.phases))
+
+    def test_rollback_unschedules_and_refires(self):
+        cp = self.game.checkpoint()
+        self.buff("phase")
+        self.game.rollback(cp)
+        self.assertEqual(len(self.game.scheduler), 0)
+        self.assertEqual(self.unit.attack_buff, 0)
+
+        self.buff("phase")
+        cp = self.game.checkpoint()
+        self.game.turn_manager.next_phase()
+        self.assertEqual(self.unit.attack_buff, 0)
+        self.game.rollback(cp)
+        self.assertEqual(self.unit.attack_buff, 2)
+        self.assertEqual(self.steps_until_expired(), 1)
+
+    def test_clone_remaps_bundles(self):
+        self.buff("turn")
+        clone = self.game.clone()
+        for _ in self.game.phases:
+            clone.turn_manager.next_phase()
+        self.assertEqual(self.unit.attack_buff, 2)
+        self.assertEqual(clone.players[0].get_board().find_zone("Ground Arena").get_piles()[0]
+                         .get_bundles()[0].attack_buff, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
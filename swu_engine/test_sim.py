@@ -0,0 +1,60 @@
+import unittest
+
+from swu_engine.agents import RandomAgent
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.sim import DEFAULT_CARDS, GameRecord, derive_seed, new_game, run_batch, run_game
+
+
+class TestSimulation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = CardDatabase(DEFAULT_CARDS)
+
+    def test_game_runs_to_completion(self):
+        record = run_game(self.db, 0, seed=1)
+        self.assertIsInstance(record, GameRecord)
+        self.assertIn(record.winner, (0, 1, 2))
+        self.assertEqual(len(record.base_hp), 2)
+        self.assertGreater(record.actions, 0)
+        if record.winner:
+            self.assertEqual(min(record.base_hp), 0)
+
+    def test_same_seed_same_result(self):
+        a = run_game(self.db, 0, seed=7)
+        b = run_game(self.db, 0, seed=7)
+        self.assertEqual(a[:5], b[:5])
+
+    def test_random_agent_is_seeded(self):
+        a = run_game(self.db, 0, seed=7, agent_cls=RandomAgent)
+        b = run_game(self.db, 0, seed=7, agent_cls=RandomAgent)
+        self.assertEqual(a[:5], b[:5])
+        self.assertNotEqual(a[:5], run_game(self.db, 0, seed=7)[:5])
+
+    def test_batch_returns_one_record_per_game(self):
+        records = run_batch(3, workers=1, seed=10)
+        self.assertEqual([r.game_index for r in records], [0, 1, 2])
+
+    def test_batch_is_splittable(self):
+        def results(records):
+            return [r[:5] + (r.seed,) for r in records]
+        whole = results(run_batch(4, workers=1, seed=3))
+        self.assertEqual(results(run_batch(2, workers=1, seed=3, first_game=2)), whole[2:])
+        self.assertEqual(results(run_batch(4, workers=2, seed=3)), whole)
+        self.assertEqual(len({derive_seed(3, i) for i in range(1000)}), 1000)
+        self.assertNotEqual(derive_seed(3, 0), derive_seed(4, 0))
+
+    def test_game_rng_is_per_game(self):
+        a, b = new_game(self.db, seed=5), new_game(self.db, seed=5)
+        a.shuffle_deck(a.players[0])
+        b.rng.random()
+        self.assertNotEqual(a.rng.getstate(), b.rng.getstate())
+        cp = a.checkpoint()
+        order = [x.bundle_id for x in a.players[0].deck]
+        a.shuffle_deck(a.players[0])
+        a.rollback(cp)
+        self.assertEqual([x.bundle_id for x in a.players[0].deck], order)
+        self.assertEqual(a.clone().rng.random(), a.rng.random())
+
+
+if __name__ == "__main__":
+    unittest.main()
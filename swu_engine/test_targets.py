@@ -0,0 +1,94 @@
+import unittest
+
+from swu_engine.agents import FirstLegalAgent
+from swu_engine.cardbundle import CardBundle
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.rules_engine import Requirement
+from swu_engine.sim import DEFAULT_CARDS, new_agents, new_game, play_game
+from swu_engine.targets import ENEMY_UNITS
+from swu_engine.token import Token
+
+
+def everything(game, zones=None):
+    for p in game.players:
+        yield p.base
+        for zone in p.get_board().get_zones():
+            if zones is None or zone.get_name() in zones:
+                for pile in zone.get_piles():
+                    yield from pile.get_bundles()
+
+
+class TestTargets(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = CardDatabase(DEFAULT_CARDS)
+
+    def setUp(self):
+        self.game = new_game(self.db, 2)
+        play_game(self.game, new_agents(self.game, 2, FirstLegalAgent), max_rounds=4)
+        self.player = self.game.turn_manager.get_current_player()
+
+    def test_shortlist_matches_full_scan(self):
+        game, player = self.game, self.player
+        actions = [(game.rules.create_search_action(game, player, traits=["Rebel"]), None),
+                   (game.rules.create_discard_action(game, player), None)]
+        board = player.get_board()
+        for unit in [b for b in board.locations if board.in_arena(b)]:
+            game.ready(unit)
+            actions.append((game.rules.create_attack_action(game, player, unit), ("Ground Arena", "Space Arena")))
+        self.assertGreater(len(actions), 2)
+        for action, zones in actions:
+            req = action.get_requirements()[0]
+            expected = [t for t in everything(game, zones) if req.validator_fn(game, player, t)]
+            self.assertCountEqual(game.targets.legal(player, req), expected, action.description)
+
+    def test_domain_narrows_lax_validators(self):
+        game, player = self.game, self.player
+        req = game.rules.create_damage_action(game, player, 1).get_requirements()[0]
+        in_play = [b for p in game.players for b in p.get_board().locations if p.get_board().in_arena(b)]
+        self.assertCountEqual(game.targets.legal(player, req), in_play + [p.base for p in game.players])
+
+    def test_reveal_and_peek_reach_every_card(self):
+        game, player = self.game, self.player
+        every_card = [b for b in everything(game) if isinstance(b, CardBundle)]
+        for action in (game.rules.create_reveal_action(game, player), game.rules.create_peek_action(game, player)):
+            req = action.get_requirements()[0]
+            self.assertCountEqual(game.rules.get_attack_targets(game, player, req), every_card)
+
+    def test_unit_requirements_accept_tokens(self):
+        game, player = self.game, self.player
+        trooper = Token(token_info="Clone Trooper", attack=2, health=2, arenas=["Ground"])
+        game.rules.create_token_action(player, trooper, game=game).execute({})
+        token = next(b for b in player.get_board().locations if b.primary_card is None)
+        rules = game.rules
+        for action in (rules.create_buff_action(game, player, 1, 1), rules.create_debuff_action(game, player, 1, 1),
+                       rules.create_add_keyword_action(game, player, "Sentinel"),
+                       rules.create_remove_keyword_action(game, player, "Sentinel")):
+            req = action.get_requirements()[0]
+            candidates = game.targets.shortlist(player, req.domain)
+            self.assertIn(token, candidates)
+            self.assertIn(token, game.targets.legal(player, req))
+            self.assertTrue(game.targets.mask(player, req) >> game.targets.candidates(player, req).index(token) & 1)
+
+    def test_mask_indexes_candidates(self):
+        game, player = self.game, self.player
+        req = Requirement("target", "enemy units with damage", lambda g, p, b: b.damage > 0, domain=ENEMY_UNITS)
+        candidates = game.targets.candidates(player, req)
+        mask = game.targets.mask(player, req)
+        self.assertEqual([c for i, c in enumerate(candidates) if mask >> i & 1], game.targets.legal(player, req))
+        self.assertTrue(all(isinstance(c, CardBundle) and c.owner_id != player.get_player_id() for c in candidates))
+
+    def test_cache_follows_state_version(self):
+        game, player = self.game, self.player
+        req = game.rules.create_discard_action(game, player).get_requirements()[0]
+        first = game.targets.legal(player, req)
+        self.assertIs(game.targets.legal(player, req), first)
+        cp = game.checkpoint()
+        player.get_board().move_bundle(first[0], "Discard")
+        self.assertEqual(len(game.targets.legal(player, req)), len(first) - 1)
+        game.rollback(cp)
+        self.assertEqual(game.targets.legal(player, req), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
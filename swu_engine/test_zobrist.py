@@ -0,0 +1,87 @@
+import random
+import unittest
+
+from swu_engine.action_space import ACTION_SPACE, PASS
+from swu_engine.deck_loader import CardDatabase
+from swu_engine.sim import DEFAULT_CARDS, new_game
+from swu_engine.zobrist import StateHasher, TranspositionTable
+
+
+class TestStateHash(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = CardDatabase(DEFAULT_CARDS)
+
+    def test_incremental_matches_full_hash(self):
+        game = new_game(self.db, 3)
+        game.state_hash()
+        rng = random.Random(3)
+        tm = game.turn_manager
+        while not game.over and tm.round_number <= 8:
+            if tm.get_current_phase().name in ("Main", "Combat"):
+                action_id = rng.choice(ACTION_SPACE.legal_ids(game))
+                if action_id != PASS:
+                    before = game.state_hash()
+                    cp = game.checkpoint()
+                    ACTION_SPACE.apply(game, action_id)
+                    game.rollback(cp)
+                    self.assertEqual(game.state_hash(), before)
+                    ACTION_SPACE.apply(game, action_id)
+                    self.assertEqual(game.state_hash(), StateHasher(game).get())
+                    continue
+            tm.next_phase()
+            self.assertEqual(game.state_hash(), StateHasher(game).get())
+        self.assertEqual(game.clone().state_hash(), game.state_hash())
+
+    def test_move_order_transposes(self):
+        game = new_game(self.db, 5)
+        a, b = list(game.players[0].hand)[:2]
+        other = game.clone()
+        a2, b2 = list(other.players[0].hand)[:2]
+        game.state_hash(), other.state_hash()
+        game.exhaust(a), game.exhaust(b)
+        other.exhaust(b2), other.exhaust(a2)
+        self.assertEqual(game.state_hash(), other.state_hash())
+        game.modify_stats(a, attack=1)
+        self.assertNotEqual(game.state_hash(), other.state_hash())
+
+    def test_duplicate_cards_do_not_cancel(self):
+        game = new_game(self.db, 6)
+        board = game.players[0].get_board()
+        hand = list(game.players[0].hand)
+        before = game.state_hash()
+        twins = [b for b in hand if sum(c.primary_card is b.primary_card for c in hand) > 1]
+        moved = twins[:2] or hand[:2]
+        for bundle in moved:
+            board.move_bundle(bundle, "Discard")
+        self.assertNotEqual(game.state_hash(), before)
+        self.assertEqual(game.state_hash(), StateHasher(game).get())
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def test_store_and_get(self):
+        table = TranspositionTable(16)
+        table.store(12345, "a", 3)
+        self.assertEqual(table.get(12345), "a")
+        self.assertIsNone(table.get(999))
+        self.assertEqual((table.hits, table.misses), (1, 1))
+        self.assertIn(12345, table)
+
+    def test_replacement_policy(self):
+        table = TranspositionTable(4)          # two buckets of two slots
+        step = table.mask + 1                  # keys landing in the same bucket
+        table.store(0, "deep", 5)
+        table.store(step, "shallow", 1)        # goes to the always-replace slot
+        table.store(2 * step, "newer", 1)      # evicts "shallow", not "deep"
+        self.assertEqual(table.get(0), "deep")
+        self.assertIsNone(table.get(step))
+        self.assertEqual(table.get(2 * step), "newer")
+        table.store(3 * step, "deeper", 9)     # takes the first slot, "deep" moves down
+        self.assertEqual(table.get(3 * step), "deeper")
+        self.assertEqual(table.get(0), "deep")
+        self.assertIsNone(table.get(2 * step))
+        self.assertLessEqual(len(table), table.capacity())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 # turn_manager.py
-from swu_engine import hooks
+from swu_engine.events import EventType
 
 class TurnManager:
     def __init__(self, players, phases, game_ref):
@@ -17,14 +17,32 @@ class TurnManager:
     def get_initiative_player(self):
         return self.players[self.initiative_player_index]
 
+    def get_position(self) -> tuple:
+        """(phase_index, round_number, initiative_player_index, current_player_index)"""
+        return self.phase_index, self.round_number, self.initiative_player_index, self.current_player_index
+
+    def set_position(self, position: tuple):
+        self.game_ref.journal.touch(self)
+        self.phase_index, self.round_number, self.initiative_player_index, self.current_player_index = position
+
+    def get_turn_key(self) -> tuple:
+        """(round_number, turn within the round counted from the initiative player, phase_index)"""
+        turn = (self.current_player_index - self.initiative_player_index) % len(self.players) if self.players else 0
+        return self.round_number, turn, self.phase_index
+
     def get_current_phase(self):
         return self.phases[self.phase_index]
 
     def open_priority_window(self, game, phase_name):
-        print(f"Priority window opened during {phase_name} phase.")
+        game.events.emit(EventType.PRIORITY_WINDOW, self.get_current_player(), target=phase_name)
 
     def next_phase(self):
         """Advance to the next phase, handling turn/round transitions and hooks."""
+        game = self.game_ref
+        if game.scheduler:
+            game.scheduler.fire_due(game, self.get_turn_key())   # effects lasting until the end of this phase
+        game.journal.record(self.set_position, self.get_position())
+        game.journal.touch(self)
         self.phase_index += 1
 
         if self.phase_index >= len(self.phases):
@@ -32,7 +50,7 @@ class TurnManager:
             self.phase_index = 0
 
             # 🔹 End-of-turn hooks
-            for fn in hooks.get_hooks_by_timing("end_of_turn"):
+            for fn in self.game_ref.hooks.get("end_of_turn"):
                 fn(self, self.get_current_player(), self.game_ref)
 
             # Move to next player
@@ -41,7 +59,7 @@ class TurnManager:
             # If we wrapped back to initiative player, round ends
             if self.current_player_index == self.initiative_player_index:
                 # 🔹 End-of-round hooks
-                for fn in hooks.get_hooks_by_timing("end_of_round"):
+                for fn in self.game_ref.hooks.get("end_of_round"):
                     fn(self, self.game_ref)
 
                 # Flip initiative
@@ -50,15 +68,15 @@ class TurnManager:
 
                 # Increment round
                 self.round_number += 1
-                print(f"--- New Round {self.round_number} ---")
-                print(f"Initiative passes to {self.get_initiative_player().get_name()}")
+                self.game_ref.events.emit(EventType.NEW_ROUND, amount=self.round_number)
+                self.game_ref.events.emit(EventType.INITIATIVE, self.get_initiative_player())
 
                 # 🔹 Start-of-round hooks
-                for fn in hooks.get_hooks_by_timing("start_of_round"):
+                for fn in self.game_ref.hooks.get("start_of_round"):
                     fn(self, self.game_ref)
 
             # 🔹 Start-of-turn hooks
-            for fn in hooks.get_hooks_by_timing("start_of_turn"):
+            for fn in self.game_ref.hooks.get("start_of_turn"):
                 fn(self, self.get_current_player(), self.game_ref)
 
         phase = self.get_current_phase()
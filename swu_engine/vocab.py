@@ -0,0 +1,70 @@
+# vocab.py
+"""
+Interned keyword, aspect and trait names.
+
+Each Vocabulary maps names to single bits, so a card's keywords, aspects or
+traits are one int and questions like "has Sentinel or Overwhelm" are one
+bitwise AND. Known names are registered up front in a fixed order (their
+bits are stable across processes); names first seen in card data get the
+next free bit when the database is loaded.
+"""
+
+
+class Vocabulary:
+    def __init__(self, kind: str, names=()):
+        self.kind = kind
+        self.bits: dict[str, int] = {}
+        self.names_by_bit: list[str] = []
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name: str) -> int:
+        """Bit for name, registering it if it is new."""
+        bit = self.bits.get(name)
+        if bit is None:
+            bit = self.bits[name] = 1 << len(self.names_by_bit)
+            self.names_by_bit.append(name)
+        return bit
+
+    def bit(self, name: str) -> int:
+        """Bit for a known name, 0 if the name was never interned."""
+        return self.bits.get(name, 0)
+
+    def mask(self, names) -> int:
+        """Intern names and return them as one mask."""
+        mask = 0
+        for name in names:
+            mask |= self.intern(name)
+        return mask
+
+    def names(self, mask: int) -> tuple[str, ...]:
+        """Names of the bits set in mask, in interning order."""
+        return tuple(name for i, name in enumerate(self.names_by_bit) if mask >> i & 1)
+
+    def __len__(self):
+        return len(self.names_by_bit)
+
+    def __repr__(self):
+        return f"Vocabulary({self.kind!r}, {len(self)} names)"
+
+
+KEYWORDS = Vocabulary("keyword", [
+    "Ambush", "Bounty", "Coordinate", "Exploit", "Grit", "Hidden", "Overwhelm", "Piloting",
+    "Raid", "Restore", "Saboteur", "Sentinel", "Shielded", "Smuggle",
+])
+ASPECTS = Vocabulary("aspect", ["Aggression", "Command", "Cunning", "Heroism", "Vigilance", "Villainy"])
+TRAITS = Vocabulary("trait")
+
+
+def aspect_masks(aspects) -> tuple[int, int]:
+    """
+    (aspect_mask, double_aspect_mask) for a list of aspect icons. Cards can
+    show the same aspect twice; the second icon goes in double_aspect_mask.
+    """
+    single = double = 0
+    for name in aspects:
+        bit = ASPECTS.intern(name)
+        if single & bit:
+            double |= bit
+        single |= bit
+    return single, double
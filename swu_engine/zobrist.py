@@ -0,0 +1,224 @@
+# zobrist.py
+"""
+Incremental state hashing and a bounded transposition table for search.
+
+StateHasher keeps a 64-bit Zobrist-style hash of a Game: every object that
+matters (each bundle with its zone, damage, exhaustion, buffs, temporary
+keywords, modifiers and upgrade count; bases' health; players' per-turn counters; the
+turn position; the game result) contributes a key, and the hash is their
+sum modulo 2**64. Sums rather than XOR keep two copies of the same card in
+the same zone from cancelling out. Pile membership counts, pile order does
+not (a shuffled deck hashes the same).
+
+Mutations reach the hasher through the game's Journal: journal.save() and
+journal.touch(), which Board and TurnManager call before they change
+anything, subtract the object's old key and mark it dirty; reading the hash
+adds the new keys of the dirty objects back. Each mutation is O(1).
+
+    h = game.state_hash()              # starts tracking on first use
+    table = shared_table()
+    table.store(h, value, weight=depth)
+    table.get(h)
+"""
+import hashlib
+
+from swu_engine.base import Base
+from swu_engine.cardbundle import CardBundle
+from swu_engine.player import Player
+from swu_engine.turn_manager import TurnManager
+
+M64 = (1 << 64) - 1
+# odd multipliers spreading the small integer fields over the word
+_C1, _C2, _C3, _C4, _C5, _C6 = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9,
+                                0xD6E8FEB86659FD93, 0xFF51AFD7ED558CCD, 0x94D049BB133111EB)
+
+
+def _mix(x: int) -> int:
+    """splitmix64 finalizer."""
+    x &= M64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & M64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & M64
+    return x ^ (x >> 31)
+
+
+_name_keys: dict[str, int] = {}
+
+
+def name_key(name: str) -> int:
+    """Fixed random key for a name (stable across processes and runs)."""
+    key = _name_keys.get(name)
+    if key is None:
+        key = _name_keys[name] = int.from_bytes(hashlib.blake2b(name.encode(), digest_size=8).digest(), "little")
+    return key
+
+
+_card_keys: dict = {}
+
+
+def _card_key(bundle: CardBundle) -> int:
+    card = bundle.primary_card
+    key = _card_keys.get(card)
+    if key is None:
+        if card is not None:
+            key = _card_keys[card] = name_key("card:" + card.name)
+        else:   # token units: keyed by their tokens, not cached
+            key = name_key("token:" + ",".join(t.token_info for t in bundle._tokens or ()))
+    return key
+
+
+_GAME, _TURN, _PLAYER, _BASE = (name_key(n) for n in ("game", "turn", "player", "base"))
+
+
+class StateHasher:
+    __slots__ = ("game", "boards", "bases", "value", "dirty")
+
+    def __init__(self, game, value: int = None):
+        """Hasher for game; value is its current hash if already known (Game.clone), else computed."""
+        self.game = game
+        self.dirty = set()
+        if value is None:
+            self.rehash()
+        else:
+            self._index()
+            self.value = value
+
+    def _index(self):
+        self.boards = {p.get_player_id(): p.get_board() for p in self.game.players}
+        self.bases = {p.base: p.get_player_id() for p in self.game.players if p.base is not None}
+
+    def rehash(self):
+        """Recompute from scratch (after Game.restore() or adding players)."""
+        self._index()
+        self.dirty.clear()
+        game = self.game
+        value = self.contribution(game) + self.contribution(game.turn_manager)
+        for player in game.players:
+            value += self.contribution(player)
+            if player.base is not None:
+                value += self.contribution(player.base)
+            for bundle in player.get_board().locations:
+                value += self.contribution(bundle)
+        self.value = value & M64
+
+    def touch(self, obj):
+        """obj is about to change: take its current key out until the next get()."""
+        dirty = self.dirty
+        if obj not in dirty:
+            self.value -= self.contribution(obj)
+            dirty.add(obj)
+
+    def get(self) -> int:
+        dirty = self.dirty
+        if dirty:
+            value = self.value
+            for obj in dirty:
+                value += self.contribution(obj)
+            dirty.clear()
+            self.value = value & M64
+        return self.value
+
+    def contribution(self, obj) -> int:
+        cls = type(obj)
+        if cls is CardBundle:
+            board = self.boards.get(obj.owner_id)
+            loc = board.locations.get(obj) if board is not None else None
+            if loc is None:
+                return 0
+            return _mix((_card_key(obj) ^ _mix(name_key(loc[0].get_name()) + obj.owner_id * _C1))
+                        + obj.damage * _C2 + obj.exhausted * _C3 + obj.attack_buff * _C4
+                        + obj.health_buff * _C5 + obj.effective_keywords() * _C6
+                        + (obj.effective_attack() << 32) + (obj.effective_health() << 44)
+                        + (len(obj._upgrades) << 56 if obj._upgrades else 0))
+        if cls is Base:
+            owner = self.bases.get(obj)
+            return _mix(_BASE + owner * _C1 + obj.health * _C2) if owner is not None else 0
+        if cls is Player:
+            return _mix(_PLAYER + obj.player_id * _C1 + obj.resources_played_this_turn * _C2
+                        + obj.top_deck_revealed * _C3)
+        if cls is TurnManager:
+            return _mix(_TURN + obj.phase_index * _C1 + obj.round_number * _C2
+                        + obj.initiative_player_index * _C3 + obj.current_player_index * _C4)
+        if obj is self.game:
+            winner = obj.winner.get_player_id() if obj.winner is not None else 0
+            return _mix(_GAME + obj.over * _C1 + winner * _C2)
+        return 0
+
+
+class TranspositionTable:
+    """
+    Bounded hash -> value table. Slots come in pairs per bucket (indexed by
+    the low bits of the hash): the first is depth-preferred and only gives
+    way to an entry of at least its weight (search depth, visit count, ...),
+    the second is always replaced. A displaced first entry moves down to
+    the second slot. Keys are full 64-bit hashes, so a hit is exact up to
+    hash collisions.
+    """
+    __slots__ = ("mask", "keys", "values", "weights", "hits", "misses")
+
+    def __init__(self, size: int = 1 << 16):
+        buckets = 1
+        while buckets * 2 < size:
+            buckets *= 2
+        self.mask = buckets - 1
+        self.keys = [None] * (2 * buckets)
+        self.values = [None] * (2 * buckets)
+        self.weights = [0] * (2 * buckets)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.keys) - self.keys.count(None)
+
+    def __contains__(self, key: int):
+        i = (key & self.mask) << 1
+        return self.keys[i] == key or self.keys[i + 1] == key
+
+    def capacity(self) -> int:
+        return len(self.keys)
+
+    def get(self, key: int, default=None):
+        i = (key & self.mask) << 1
+        keys = self.keys
+        if keys[i] == key:
+            self.hits += 1
+            return self.values[i]
+        if keys[i + 1] == key:
+            self.hits += 1
+            return self.values[i + 1]
+        self.misses += 1
+        return default
+
+    def store(self, key: int, value, weight: int = 0):
+        i = (key & self.mask) << 1
+        keys, values, weights = self.keys, self.values, self.weights
+        if keys[i] == key:
+            values[i], weights[i] = value, weight
+            return
+        if keys[i] is not None and weight < weights[i]:
+            j = i + 1
+        else:
+            if keys[i] is not None:   # demote the old first entry (over a stale copy of key, if any)
+                keys[i + 1], values[i + 1], weights[i + 1] = keys[i], values[i], weights[i]
+            elif keys[i + 1] == key:
+                keys[i + 1] = values[i + 1] = None
+                weights[i + 1] = 0
+            j = i
+        keys[j], values[j], weights[j] = key, value, weight
+
+    def clear(self):
+        n = len(self.keys)
+        self.keys = [None] * n
+        self.values = [None] * n
+        self.weights = [0] * n
+        self.hits = self.misses = 0
+
+
+_shared = None
+
+
+def shared_table(size: int = 1 << 16) -> TranspositionTable:
+    """The process-wide table agents share (created with size on first call)."""
+    global _shared
+    if _shared is None:
+        _shared = TranspositionTable(size)
+    return _shared